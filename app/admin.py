@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import CustomUser, HeadCategory, Category, Product, ProductImage, Profile, Size
+from .models import CustomUser, HeadCategory, Category, Product, ProductImage, Profile, Size, Order, OrderLine, Stock
 
 
 # --- CustomUser Admin ---
@@ -37,6 +37,12 @@ class ProductImageInline(admin.TabularInline):  # or StackedInline for larger pr
     extra = 1  # shows one empty image field by default
 
 
+# --- Stock Inline (units left per size) ---
+class StockInline(admin.TabularInline):
+    model = Stock
+    extra = 0
+
+
 # --- Product Admin ---
 @admin.register(Product)
 class ProductAdmin(admin.ModelAdmin):
@@ -44,7 +50,7 @@ class ProductAdmin(admin.ModelAdmin):
     search_fields = ['name', 'category__name']
     list_filter = ['category']
     filter_horizontal = ('available_sizes',)  # Use filter_horizontal for many-to-many fields
-    inlines = [ProductImageInline]  # ✅ Allows adding multiple images directly from product page
+    inlines = [ProductImageInline, StockInline]  # ✅ Allows adding multiple images directly from product page
 
 
 # --- Category Admin ---
@@ -60,4 +66,20 @@ class CategoryAdmin(admin.ModelAdmin):
 class ProfileAdmin(admin.ModelAdmin):
     list_display = ['user', 'full_name', 'gender', 'city', 'state']
     search_fields = ['user__username', 'full_name', 'city']
-    list_filter = ['gender', 'state']
\ No newline at end of file
+    list_filter = ['gender', 'state']
+
+
+# --- OrderLine Inline ---
+class OrderLineInline(admin.TabularInline):
+    model = OrderLine
+    extra = 0
+    readonly_fields = ['product', 'product_name', 'size_name', 'unit_price', 'quantity']
+
+
+# --- Order Admin ---
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    list_display = ['id', 'full_name', 'total_items', 'total_price', 'payment_method', 'created_at']
+    search_fields = ['full_name', 'email', 'user__username']
+    list_filter = ['payment_method', 'created_at']
+    inlines = [OrderLineInline]
@@ -0,0 +1,38 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_running = set()
+_lock = threading.Lock()
+
+
+def rebuild_in_background(name, rebuild):
+    """Run `rebuild` on a daemon thread, at most one per `name` at a time.
+
+    Callers keep serving the data they have until it finishes. With
+    settings.BACKGROUND_REBUILDS off, as in the tests, it runs inline.
+    """
+    if not getattr(settings, 'BACKGROUND_REBUILDS', True):
+        rebuild()
+        return
+    with _lock:
+        if name in _running:
+            return
+        _running.add(name)
+    threading.Thread(target=_run, args=(name, rebuild), name=f'rebuild-{name}', daemon=True).start()
+
+
+def _run(name, rebuild):
+    try:
+        rebuild()
+    except Exception:
+        logger.exception("Background rebuild of %s failed", name)
+    finally:
+        # The thread's connections would otherwise stay open until the process exits
+        connections.close_all()
+        with _lock:
+            _running.discard(name)
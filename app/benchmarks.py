@@ -0,0 +1,312 @@
+"""Per-route query-count, latency and response-size measurements for benchmark_routes and the tests.
+
+Every named route in app/urls.py needs an entry in ROUTE_REQUESTS.
+"""
+import json
+import statistics
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, reset_queries
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .models import (
+    CustomUser, HeadCategory, Category, Size, ShoeSize, Product, ProductImage,
+    Profile, Cart, CartItem, Stock,
+)
+from .profiling import save_profile
+from .search import rebuild_search_index
+from .stock import hold_stock
+
+
+BASELINE_PATH = Path(settings.BASE_DIR) / 'benchmarks' / 'route_baseline.json'
+
+BENCHMARK_PASSWORD = 'benchmark-password'
+SEED_BATCH_SIZE = 2000
+# Units per product size; enough that repeated benchmark runs never sell out
+SEED_STOCK = 1000000
+
+CLOTHING_CATEGORIES = ['Jacket', 'Hoodie', 'T-Shirt', 'Shirt', 'Sweatshirt']
+FOOTWEAR_CATEGORIES = ['Sneakers', 'Boots', 'Sandals']
+
+# Allowed growth over the baseline before a route counts as regressed
+TIME_TOLERANCE = 2.0
+TIME_SLACK_MS = 25.0
+BYTES_TOLERANCE = 1.10
+
+
+def seed_catalog(size):
+    """Create a synthetic catalog of `size` products plus a shopper with a filled cart"""
+    clothing = HeadCategory.objects.create(name='Clothing', slug='clothing')
+    footwear = HeadCategory.objects.create(name='Footwear', slug='footwear')
+    categories = [
+        Category.objects.create(name=name, head_category=clothing) for name in CLOTHING_CATEGORIES
+    ] + [
+        Category.objects.create(name=name, head_category=footwear) for name in FOOTWEAR_CATEGORIES
+    ]
+    sizes = [Size.objects.create(name=name) for name, _ in Size.SIZE_CHOICES]
+    shoe_sizes = [ShoeSize.objects.create(size=size) for size, _ in ShoeSize.SIZE_CHOICES]
+
+    size_links = []
+    shoe_size_links = []
+    stock = []
+    images = []
+    for start in range(0, size, SEED_BATCH_SIZE):
+        batch = []
+        for number in range(start, min(start + SEED_BATCH_SIZE, size)):
+            category = categories[number % len(categories)]
+            batch.append(Product(
+                category=category,
+                name=f'{category.name} Drip {number}',
+                slug=f'{category.slug}-drip-{number}',
+                price=Decimal(499 + number % 5000),
+                image='products/benchmark.jpg',
+                description=f'Synthetic {category.name.lower()} number {number} for benchmarks.'
+            ))
+        created = Product.objects.bulk_create(batch)
+        for product in created:
+            if product.category.head_category_id == footwear.id:
+                shoe_size_links.extend(
+                    Product.available_shoe_sizes.through(product_id=product.id, shoesize_id=shoe_size.id)
+                    for shoe_size in shoe_sizes[2:6]
+                )
+                stock.extend(
+                    Stock(product_id=product.id, shoe_size_id=shoe_size.id, quantity=SEED_STOCK)
+                    for shoe_size in shoe_sizes[2:6]
+                )
+            else:
+                size_links.extend(
+                    Product.available_sizes.through(product_id=product.id, size_id=size.id)
+                    for size in sizes[1:5]
+                )
+                stock.extend(
+                    Stock(product_id=product.id, size_id=size.id, quantity=SEED_STOCK)
+                    for size in sizes[1:5]
+                )
+            if product.id % 10 == 0:
+                images.append(ProductImage(product=product, image='products/benchmark-alt.jpg'))
+        Product.available_sizes.through.objects.bulk_create(size_links, batch_size=SEED_BATCH_SIZE)
+        Product.available_shoe_sizes.through.objects.bulk_create(shoe_size_links, batch_size=SEED_BATCH_SIZE)
+        Stock.objects.bulk_create(stock, batch_size=SEED_BATCH_SIZE)
+        ProductImage.objects.bulk_create(images, batch_size=SEED_BATCH_SIZE)
+        size_links, shoe_size_links, stock, images = [], [], [], []
+
+    # bulk_create skips signals, so refresh the derived indexes by hand
+    rebuild_search_index()
+    cache.clear()
+
+    user = CustomUser.objects.create_user('benchmark', 'benchmark@example.com', BENCHMARK_PASSWORD)
+    Profile.objects.create(user=user, full_name='Bench Mark')
+    staff = CustomUser.objects.create_user(
+        'benchmark-staff', 'staff@example.com', BENCHMARK_PASSWORD, is_staff=True
+    )
+    clothing_product = Product.objects.filter(category__head_category=clothing).first()
+    footwear_product = Product.objects.filter(category__head_category=footwear).first()
+    return {
+        'user': user,
+        'staff': staff,
+        'product': clothing_product,
+        'footwear_product': footwear_product,
+        'category': clothing_product.category,
+        'size': sizes[1],
+        'shoe_size': shoe_sizes[2],
+    }
+
+
+def fill_cart(fixture, lines=5):
+    """Give the benchmark user a cart with `lines` clothing items, replacing any previous one"""
+    cart, _ = Cart.objects.get_or_create(user=fixture['user'])
+    cart.items.all().delete()
+    # Every clothing product is seeded with this size, so large carts are possible on small catalogs
+    products = Product.objects.filter(available_sizes=fixture['size']).order_by('id')[:lines]
+    items = [CartItem(cart=cart, product=product, size=fixture['size'], quantity=2) for product in products]
+    CartItem.objects.bulk_create(items)
+    # Hold the stock just as add_to_cart would have
+    hold_stock(cart, {(item.product_id, item.size_id, None): item.quantity for item in items}, exact=True)
+    cache.clear()
+    return cart.items.order_by('id').first()
+
+
+def _json(data):
+    return {'data': json.dumps(data), 'content_type': 'application/json'}
+
+
+def _cart_batch(fixture, first_item):
+    """A debounced cart page flush: two quantity edits, a removal and a new line"""
+    item_ids = list(first_item.cart.items.order_by('id').values_list('id', flat=True))
+    footwear = fixture['footwear_product']
+    return {'operations': [
+        {'op': 'update', 'item_id': item_ids[0], 'quantity': 3},
+        {'op': 'update', 'item_id': item_ids[1], 'quantity': 1},
+        {'op': 'remove', 'item_id': item_ids[2]},
+        {'op': 'add', 'product_id': footwear.id, 'shoe_size_id': fixture['shoe_size'].id, 'quantity': 1},
+    ]}
+
+
+CHECKOUT_FORM = {
+    'fullName': 'Bench Mark', 'phone': '9999999999', 'email': 'benchmark@example.com',
+    'address1': '1 Benchmark Road', 'city': 'Mumbai', 'state': 'Maharashtra',
+    'pincode': '400001', 'paymentMethod': 'cod',
+}
+
+
+def _saved_profile(fixture):
+    save_profile('benchmark', {'sql': b'-- benchmark\n'})
+    return 'benchmark'
+
+
+# route name -> (method, signed in (True or 'staff'), request builder, optional per-run setup)
+ROUTE_REQUESTS = {
+    'home': ('get', False, lambda f, s: (reverse('home'), {}), None),
+    'login': ('get', False, lambda f, s: (reverse('login'), {}), None),
+    'register': ('get', False, lambda f, s: (reverse('register'), {}), None),
+    'logout': ('get', True, lambda f, s: (reverse('logout'), {}), None),
+    'productDetail': ('get', False, lambda f, s: (reverse('productDetail', args=[f['product'].slug]), {}), None),
+    'category_products': ('get', False, lambda f, s: (reverse('category_products', args=[f['category'].slug]), {}), None),
+    'search_products': ('get', False, lambda f, s: (reverse('search_products'), {'data': {'q': 'drip'}}), None),
+    'search_suggestions': ('get', False, lambda f, s: (reverse('search_suggestions'), {'data': {'q': 'jack'}}), None),
+    'userProfile': ('get', True, lambda f, s: (reverse('userProfile'), {}), None),
+    'view_cart': ('get', True, lambda f, s: (reverse('view_cart'), {}), fill_cart),
+    'get_cart_count': ('get', True, lambda f, s: (reverse('get_cart_count'), {}), None),
+    'checkout': ('get', True, lambda f, s: (reverse('checkout'), {}), fill_cart),
+    'process_checkout': ('post', True, lambda f, s: (reverse('process_checkout'), {'data': CHECKOUT_FORM}), fill_cart),
+    'add_to_cart': ('post', True, lambda f, s: (reverse('add_to_cart'), _json({
+        'product_id': f['product'].id, 'size_id': f['size'].id, 'quantity': 1})), fill_cart),
+    'update_cart_item': ('post', True, lambda f, s: (reverse('update_cart_item'), _json({
+        'item_id': s.id, 'quantity': 3})), fill_cart),
+    'remove_cart_item': ('post', True, lambda f, s: (reverse('remove_cart_item'), _json({
+        'item_id': s.id})), fill_cart),
+    'update_cart': ('post', True, lambda f, s: (reverse('update_cart'), _json(_cart_batch(f, s))), fill_cart),
+    'faq': ('get', False, lambda f, s: (reverse('faq'), {}), None),
+    'sizeGuide': ('get', False, lambda f, s: (reverse('sizeGuide'), {}), None),
+    'storeLocations': ('get', False, lambda f, s: (reverse('storeLocations'), {}), None),
+    'careInstruction': ('get', False, lambda f, s: (reverse('careInstruction'), {}), None),
+    'returnExchanges': ('get', False, lambda f, s: (reverse('returnExchanges'), {}), None),
+    'sustainability': ('get', False, lambda f, s: (reverse('sustainability'), {}), None),
+    'press': ('get', False, lambda f, s: (reverse('press'), {}), None),
+    'ourstory': ('get', False, lambda f, s: (reverse('ourstory'), {}), None),
+    'paymentdone': ('get', False, lambda f, s: (reverse('paymentdone'), {}), None),
+    'instagram': ('get', False, lambda f, s: (reverse('instagram'), {}), None),
+    'AllProduct': ('get', False, lambda f, s: (reverse('AllProduct'), {}), None),
+    'newArrival': ('get', False, lambda f, s: (reverse('newArrival'), {}), None),
+    'sitemap': ('get', False, lambda f, s: (reverse('sitemap'), {}), None),
+    'sitemap_pages': ('get', False, lambda f, s: (reverse('sitemap_pages'), {}), None),
+    'sitemap_products': ('get', False, lambda f, s: (reverse('sitemap_products', args=[1]), {}), None),
+    'product_feed': ('get', False, lambda f, s: (reverse('product_feed', args=['csv']), {}), None),
+    'metrics': ('get', 'staff', lambda f, s: (reverse('metrics'), {}), None),
+    'profile_download': ('get', 'staff', lambda f, s: (reverse('profile_download', args=[s, 'sql']), {}),
+                         _saved_profile),
+}
+
+
+def _client(fixture, signed_in):
+    client = Client()
+    if signed_in:
+        client.force_login(fixture['staff'] if signed_in == 'staff' else fixture['user'])
+    return client
+
+
+def _body(response):
+    return b''.join(response.streaming_content) if response.streaming else response.content
+
+
+def measure_route(name, fixture, repeat=3, setup=None):
+    """Warm a route once, then return its median wall time and last query count and size"""
+    method, signed_in, build_request, default_setup = ROUTE_REQUESTS[name]
+    setup = setup or default_setup
+    timings = []
+    queries = size = status = None
+    for run in range(repeat + 1):
+        client = _client(fixture, signed_in)
+        state = setup(fixture) if setup else None
+        path, kwargs = build_request(fixture, state)
+
+        # Seeding a large catalog can fill the bounded query log, which would make every count 0
+        reset_queries()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = getattr(client, method)(path, **kwargs)
+            # Streaming views run their queries while the body is consumed
+            body = _body(response)
+            elapsed = (time.perf_counter() - started) * 1000
+
+        if run == 0:
+            # The first run fills process caches; steady state is what we budget
+            continue
+        timings.append(elapsed)
+        queries = len(captured)
+        size = len(body)
+        status = response.status_code
+
+    return {
+        'status': status,
+        'queries': queries,
+        'time_ms': round(statistics.median(timings), 2),
+        'bytes': size,
+    }
+
+
+def request_route(name, fixture, client=None):
+    """Request a route once after its setup; returns the response and its drained body"""
+    method, signed_in, build_request, setup = ROUTE_REQUESTS[name]
+    if client is None:
+        client = _client(fixture, signed_in)
+    state = setup(fixture) if setup else None
+    path, kwargs = build_request(fixture, state)
+    response = getattr(client, method)(path, **kwargs)
+    return response, _body(response)
+
+
+def capture_route_queries(name, fixture, client=None):
+    """Request a route once after its setup and return the SQL it ran"""
+    reset_queries()
+    with CaptureQueriesContext(connection) as captured:
+        request_route(name, fixture, client)
+    return [query['sql'] for query in captured]
+
+
+def measure_routes(fixture, repeat=3, names=None):
+    return {name: measure_route(name, fixture, repeat) for name in (names or ROUTE_REQUESTS)}
+
+
+CHECKOUT_CART_LINES = (1, 10, 50)
+
+
+def measure_checkout(fixture, line_counts=CHECKOUT_CART_LINES, repeat=3):
+    """Measure process_checkout for carts of different sizes; queries and time should stay flat"""
+    results = {}
+    for lines in line_counts:
+        results[lines] = measure_route(
+            'process_checkout', fixture, repeat,
+            setup=lambda fixture, lines=lines: fill_cart(fixture, lines)
+        )
+    return results
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not Path(path).exists():
+        return {}
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def find_regressions(results, baseline, check_time=True):
+    """Compare one catalog size's results against its baseline and describe every regression"""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        if result['queries'] > expected['queries']:
+            regressions.append(f"{name}: {result['queries']} queries (budget {expected['queries']})")
+        if result['bytes'] > expected['bytes'] * BYTES_TOLERANCE:
+            regressions.append(f"{name}: {result['bytes']} bytes (budget {expected['bytes']})")
+        time_budget = expected['time_ms'] * TIME_TOLERANCE + TIME_SLACK_MS
+        if check_time and result['time_ms'] > time_budget:
+            regressions.append(f"{name}: {result['time_ms']}ms (budget {time_budget:.1f}ms)")
+    return regressions
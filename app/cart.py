@@ -0,0 +1,266 @@
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+
+from .models import CartItem, Product, ShoeSize, Size
+from .stock import hold_stock
+
+
+# [owner, count]; sessions are shared by every worker, unlike their local caches.
+# Another device of the same user catches up on its next cart change or cart page view
+CART_COUNT_SESSION_KEY = 'cart_item_count'
+
+
+def _cart_owner(user, session_key):
+    if user.is_authenticated:
+        return f'user:{user.pk}'
+    if session_key:
+        return f'session:{session_key}'
+    return None
+
+
+def _cart_items(user, session_key):
+    if user.is_authenticated:
+        return CartItem.objects.filter(cart__user=user)
+    return CartItem.objects.filter(cart__session_key=session_key)
+
+
+def add_cart_line(cart, product, size=None, shoe_size=None, quantity=1):
+    """Add quantity to a cart line, creating it if needed, without a read-modify-write.
+
+    On SQLite and PostgreSQL this is one INSERT ... ON CONFLICT DO UPDATE
+    against the partial unique constraints on CartItem, so concurrent adds
+    of the same line all land and never produce a duplicate row. The units
+    are held in stock first; raises OutOfStock when they are not available.
+    """
+    size_id = size.id if size else None
+    shoe_size_id = shoe_size.id if shoe_size else None
+    with transaction.atomic():
+        hold_stock(cart, {(product.id, size_id, shoe_size_id): quantity}, add=True)
+        _add_to_line(cart, product, size_id, shoe_size_id, quantity)
+
+
+def _add_to_line(cart, product, size_id, shoe_size_id, quantity):
+    if connection.vendor in ('sqlite', 'postgresql'):
+        if shoe_size_id is None:
+            target = '(cart_id, product_id, size_id) WHERE shoe_size_id IS NULL'
+        else:
+            target = '(cart_id, product_id, shoe_size_id) WHERE size_id IS NULL'
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'INSERT INTO app_cartitem (cart_id, product_id, size_id, shoe_size_id, quantity, added_at) '
+                f'VALUES (%s, %s, %s, %s, %s, %s) ON CONFLICT {target} '
+                'DO UPDATE SET quantity = app_cartitem.quantity + excluded.quantity',
+                [cart.id, product.id, size_id, shoe_size_id, quantity, timezone.now()]
+            )
+        return
+
+    # Other backends: an atomic UPDATE, falling back to INSERT for a new line
+    lines = CartItem.objects.filter(cart=cart, product=product, size_id=size_id, shoe_size_id=shoe_size_id)
+    if lines.update(quantity=F('quantity') + quantity):
+        return
+    try:
+        with transaction.atomic():
+            CartItem.objects.create(cart=cart, product=product, size_id=size_id, shoe_size_id=shoe_size_id,
+                                    quantity=quantity)
+    except IntegrityError:
+        # Another request created the line first
+        lines.update(quantity=F('quantity') + quantity)
+
+
+def set_cart_line_quantity(cart, cart_item, quantity):
+    """Set a line's quantity, removing it at zero, and resize its stock hold to match"""
+    quantity = max(quantity, 0)
+    key = (cart_item.product_id, cart_item.size_id, cart_item.shoe_size_id)
+    with transaction.atomic():
+        hold_stock(cart, {key: quantity})
+        if quantity:
+            CartItem.objects.filter(id=cart_item.id).update(quantity=quantity)
+        else:
+            CartItem.objects.filter(id=cart_item.id).delete()
+
+
+CART_BATCH_LIMIT = 100
+
+
+class CartBatchError(ValueError):
+    """A batch of cart operations was rejected; nothing in it was applied"""
+
+
+def _positive_int(value, field):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise CartBatchError(f'{field} must be a whole number')
+    return value
+
+
+def _optional_id(operation, field):
+    value = operation.get(field)
+    return _positive_int(value, field) if value else None
+
+
+def apply_cart_operations(cart, operations):
+    """Apply a list of add/update/remove operations to a cart in one transaction.
+
+    Operations look like {'op': 'add', 'product_id', 'size_id' or 'shoe_size_id',
+    'quantity'}, {'op': 'update', 'item_id', 'quantity'} or {'op': 'remove',
+    'item_id'}. Later operations on the same line win, an update to zero removes
+    the line, and the whole batch costs one bulk_update, one bulk_create and one
+    DELETE however many clicks it holds. Raises OutOfStock if the new
+    quantities can't be held. Returns {item_id: quantity} for every line the
+    batch left in the cart.
+    """
+    if not isinstance(operations, list) or not operations:
+        raise CartBatchError('No cart operations given')
+    if len(operations) > CART_BATCH_LIMIT:
+        raise CartBatchError(f'At most {CART_BATCH_LIMIT} cart operations per request')
+
+    quantities = {}  # item_id -> new quantity, 0 meaning remove
+    adds = {}  # (product_id, size_id, shoe_size_id) -> quantity to add
+    for operation in operations:
+        kind = operation.get('op') if isinstance(operation, dict) else None
+        if kind in ('update', 'remove'):
+            item_id = _positive_int(operation.get('item_id'), 'item_id')
+            quantity = 0 if kind == 'remove' else _positive_int(operation.get('quantity'), 'quantity')
+            quantities[item_id] = max(quantity, 0)
+        elif kind == 'add':
+            quantity = _positive_int(operation.get('quantity', 1), 'quantity')
+            if quantity < 1:
+                raise CartBatchError('quantity must be at least 1')
+            key = (
+                _positive_int(operation.get('product_id'), 'product_id'),
+                _optional_id(operation, 'size_id'),
+                _optional_id(operation, 'shoe_size_id'),
+            )
+            adds[key] = adds.get(key, 0) + quantity
+        else:
+            raise CartBatchError(f'Unknown cart operation {kind!r}')
+
+    product_ids = {product_id for product_id, _, _ in adds}
+    if adds:
+        _validate_adds(adds, product_ids)
+
+    with transaction.atomic():
+        # One read for every line the batch touches: edited items and lines of added products
+        lines = cart.items.select_for_update().filter(
+            Q(id__in=list(quantities)) | Q(product_id__in=product_ids)
+        ).in_bulk()
+        if not set(quantities) <= set(lines):
+            raise CartBatchError('Cart item not found')
+
+        to_update = []
+        to_delete = []
+        for item_id, quantity in quantities.items():
+            if quantity == 0:
+                to_delete.append(item_id)
+            else:
+                lines[item_id].quantity = quantity
+                to_update.append(lines[item_id])
+
+        to_create = []
+        for (product_id, size_id, shoe_size_id), quantity in adds.items():
+            line = next((
+                line for line in lines.values()
+                if (line.product_id, line.size_id, line.shoe_size_id) == (product_id, size_id, shoe_size_id)
+            ), None)
+            if line is None:
+                to_create.append(CartItem(cart=cart, product_id=product_id, size_id=size_id,
+                                          shoe_size_id=shoe_size_id, quantity=quantity))
+            elif line.id in to_delete:
+                # Removed and re-added in the same batch: keep the line with the new quantity
+                to_delete.remove(line.id)
+                line.quantity = quantity
+                to_update.append(line)
+            else:
+                line.quantity += quantity
+                if line not in to_update:
+                    to_update.append(line)
+
+        # Resize the stock holds of every touched line before writing it
+        targets = {(line.product_id, line.size_id, line.shoe_size_id): line.quantity
+                   for line in to_update + to_create}
+        targets.update({(lines[item_id].product_id, lines[item_id].size_id, lines[item_id].shoe_size_id): 0
+                        for item_id in to_delete})
+        hold_stock(cart, targets)
+
+        if to_update:
+            CartItem.objects.bulk_update(to_update, ['quantity'])
+        if to_create:
+            CartItem.objects.bulk_create(to_create)
+        if to_delete:
+            cart.items.filter(id__in=to_delete).delete()
+
+    return {line.id: line.quantity for line in to_update + to_create}
+
+
+def _validate_adds(adds, product_ids):
+    """Check that added products and sizes exist and that each product gets the right kind of size"""
+    products = Product.objects.select_related('category__head_category').in_bulk(product_ids)
+    size_ids = {size_id for _, size_id, _ in adds if size_id}
+    shoe_size_ids = {shoe_size_id for _, _, shoe_size_id in adds if shoe_size_id}
+    if (len(products) != len(product_ids)
+            or Size.objects.filter(id__in=size_ids).count() != len(size_ids)
+            or ShoeSize.objects.filter(id__in=shoe_size_ids).count() != len(shoe_size_ids)):
+        raise CartBatchError('Product or size not found')
+
+    for product_id, size_id, shoe_size_id in adds:
+        if products[product_id].is_footwear:
+            if not shoe_size_id or size_id:
+                raise CartBatchError('Please select a shoe size for footwear products')
+        elif not size_id or shoe_size_id:
+            raise CartBatchError('Please select a size for clothing products')
+
+
+def get_cart_owner(request):
+    """Return the identity of the visitor's cart, or None if they cannot have one yet"""
+    return _cart_owner(request.user, request.session.session_key)
+
+
+def get_cart_item_count(request):
+    """Return the visitor's cart item count from their session, filling it on a miss.
+
+    The count is stored with its owner, so logging in (which keeps the
+    session data) recounts for the user's cart.
+    """
+    owner = get_cart_owner(request)
+    if owner is None:
+        # No session means no cart, so there is nothing to look up or create
+        return 0
+
+    stored = request.session.get(CART_COUNT_SESSION_KEY)
+    if stored and stored[0] == owner:
+        return stored[1]
+    items = _cart_items(request.user, request.session.session_key)
+    count = items.aggregate(total=Sum('quantity'))['total'] or 0
+    request.session[CART_COUNT_SESSION_KEY] = [owner, count]
+    return count
+
+
+def set_cart_item_count(request, count):
+    """Store the visitor's cart item count after a cart mutation or a look at the whole cart"""
+    owner = get_cart_owner(request)
+    if owner is not None and request.session.get(CART_COUNT_SESSION_KEY) != [owner, count]:
+        request.session[CART_COUNT_SESSION_KEY] = [owner, count]
+
+
+async def aget_cart_item_count(request):
+    """get_cart_item_count for async views"""
+    user = await request.auser()
+    owner = _cart_owner(user, request.session.session_key)
+    if owner is None:
+        return 0
+
+    stored = await request.session.aget(CART_COUNT_SESSION_KEY)
+    if stored and stored[0] == owner:
+        return stored[1]
+    items = _cart_items(user, request.session.session_key)
+    count = (await items.aaggregate(total=Sum('quantity')))['total'] or 0
+    await request.session.aset(CART_COUNT_SESSION_KEY, [owner, count])
+    return count
+
+
+async def aset_cart_item_count(request, count):
+    owner = _cart_owner(await request.auser(), request.session.session_key)
+    if owner is not None and await request.session.aget(CART_COUNT_SESSION_KEY) != [owner, count]:
+        await request.session.aset(CART_COUNT_SESSION_KEY, [owner, count])
@@ -0,0 +1,263 @@
+"""Streaming bulk import of products, their sizes, stock and images from CSV or JSONL.
+
+Used by the ``import_catalog`` management command. Rows are read lazily
+and written a batch at a time with bulk_create/bulk_update, so memory
+stays flat however large the file is. Products are matched on slug, so
+re-running an import updates rather than duplicates.
+"""
+import csv
+import json
+import os
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.db import transaction
+from django.utils.text import slugify
+
+from .models import HeadCategory, Category, Size, ShoeSize, Product, ProductImage, Stock
+
+
+IMPORT_BATCH_SIZE = 1000
+# Separates several sizes or images inside one CSV cell
+LIST_SEPARATOR = '|'
+PRODUCT_FIELDS = ['category', 'name', 'price', 'image', 'description', 'updated_at']
+
+
+class CatalogRowError(ValueError):
+    """A row that cannot be imported; `line` is its line number in the file"""
+
+    def __init__(self, line, message):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+def read_rows(path):
+    """Yield (line number, raw dict) from a .jsonl file or a CSV file with a header row.
+
+    A JSONL line that does not decode is yielded as its text, for
+    parse_row to reject like any other bad row.
+    """
+    with open(path, newline='', encoding='utf-8') as catalog_file:
+        if path.endswith('.jsonl'):
+            for number, line in enumerate(catalog_file, 1):
+                if line.strip():
+                    try:
+                        raw = json.loads(line)
+                    except json.JSONDecodeError:
+                        raw = line
+                    yield number, raw
+        else:
+            reader = csv.DictReader(catalog_file)
+            for row in reader:
+                yield reader.line_num, row
+
+
+def _list(value):
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(LIST_SEPARATOR) if item.strip()]
+    return [str(item) for item in value]
+
+
+def _text(raw, field):
+    value = raw.get(field)
+    return str(value).strip() if value not in (None, '') else ''
+
+
+def parse_row(number, raw):
+    """Validate one raw row into the fields the batch writer needs"""
+    if not isinstance(raw, dict):
+        raise CatalogRowError(number, "not a JSON object")
+    name = _text(raw, 'name')
+    category = _text(raw, 'category')
+    if not name or not category:
+        raise CatalogRowError(number, "name and category are required")
+    try:
+        price = Decimal(str(raw.get('price')))
+    except InvalidOperation:
+        raise CatalogRowError(number, f"invalid price {raw.get('price')!r}")
+    stock = raw.get('stock')
+    try:
+        stock = int(stock) if stock not in (None, '') else None
+    except (TypeError, ValueError):
+        raise CatalogRowError(number, f"invalid stock {stock!r}")
+    lists = {}
+    for field in ('images', 'sizes', 'shoe_sizes'):
+        try:
+            lists[field] = _list(raw.get(field))
+        except TypeError:
+            raise CatalogRowError(number, f"invalid {field} {raw.get(field)!r}")
+    return {
+        'line': number,
+        'name': name,
+        'slug': _text(raw, 'slug') or slugify(name),
+        'category': category,
+        'head_category': _text(raw, 'head_category') or None,
+        'price': price,
+        'description': str(raw.get('description') or ''),
+        'image': _text(raw, 'image'),
+        **lists,
+        'stock': stock,
+    }
+
+
+class CatalogImporter:
+    """Writes parsed rows in batches, remembering categories and sizes between batches"""
+
+    def __init__(self, image_root=None):
+        self.image_root = image_root
+        self.categories = {name: id for id, name in Category.objects.order_by('-id').values_list('id', 'name')}
+        self.head_categories = dict(HeadCategory.objects.values_list('name', 'id'))
+        self.sizes = dict(Size.objects.values_list('name', 'id'))
+        self.shoe_sizes = dict(ShoeSize.objects.values_list('size', 'id'))
+        self.created_categories = False
+        self.images_seen = set()
+
+    def _category_id(self, row):
+        category_id = self.categories.get(row['category'])
+        if category_id is None:
+            head_category_id = None
+            if row['head_category']:
+                head_category_id = self.head_categories.get(row['head_category'])
+                if head_category_id is None:
+                    head_category_id = HeadCategory.objects.create(name=row['head_category']).id
+                    self.head_categories[row['head_category']] = head_category_id
+            category_id = Category.objects.create(name=row['category'], head_category_id=head_category_id).id
+            self.categories[row['category']] = category_id
+            self.created_categories = True
+        return category_id
+
+    def _size_ids(self, row, names, known, model, field):
+        if names is None:
+            return None
+        ids = []
+        for name in names:
+            if name not in known:
+                if name not in dict(model.SIZE_CHOICES):
+                    raise CatalogRowError(row['line'], f"unknown size {name!r}")
+                known[name] = model.objects.get_or_create(**{field: name})[0].id
+            ids.append(known[name])
+        return ids
+
+    def _stored_name(self, path):
+        """Local files are copied under products/; values without an image root are storage names already"""
+        if not path or not self.image_root:
+            return path
+        return f'products/{os.path.basename(path)}'
+
+    def image_tasks(self, rows):
+        """(source path or None, storage name) pairs not handed out before"""
+        tasks = []
+        for row in rows:
+            for path in [row['image'], *(row['images'] or [])]:
+                name = self._stored_name(path)
+                if name and name not in self.images_seen:
+                    self.images_seen.add(name)
+                    source = os.path.join(self.image_root, path) if self.image_root else None
+                    tasks.append((source, name))
+        return tasks
+
+    def write_batch(self, rows):
+        """Upsert one batch of parsed rows; returns (created, updated, row errors)"""
+        # Later rows win when a batch repeats a slug
+        rows = list({row['slug']: row for row in rows}.values())
+        errors = []
+        valid = []
+        for row in rows:
+            try:
+                row['category_id'] = self._category_id(row)
+                row['size_ids'] = self._size_ids(row, row['sizes'], self.sizes, Size, 'name')
+                row['shoe_size_ids'] = self._size_ids(row, row['shoe_sizes'], self.shoe_sizes, ShoeSize, 'size')
+            except CatalogRowError as error:
+                errors.append(error)
+            else:
+                valid.append(row)
+        rows = valid
+
+        with transaction.atomic():
+            existing = {}
+            for product_id, slug in (
+                Product.objects.filter(slug__in=[row['slug'] for row in rows])
+                .order_by('-id').values_list('id', 'slug')
+            ):
+                existing[slug] = product_id  # a duplicated slug updates its oldest product
+
+            products = []
+            for row in rows:
+                products.append(Product(
+                    id=existing.get(row['slug']),
+                    category_id=row['category_id'],
+                    name=row['name'],
+                    slug=row['slug'],
+                    price=row['price'],
+                    image=self._stored_name(row['image']),
+                    description=row['description'],
+                ))
+            updated = sum(product.id is not None for product in products)
+            # INSERT ... ON CONFLICT (id) DO UPDATE: bulk_update's CASE per row is quadratic in the batch size
+            Product.objects.bulk_create(
+                products, update_conflicts=True, unique_fields=['id'], update_fields=PRODUCT_FIELDS
+            )
+            for row, product in zip(rows, products):
+                row['product_id'] = product.id
+
+            self._replace_links(rows, 'size_ids', Product.available_sizes.through, 'size_id')
+            self._replace_links(rows, 'shoe_size_ids', Product.available_shoe_sizes.through, 'shoesize_id')
+            self._replace_images(rows)
+            self._set_stock(rows)
+        return len(products) - updated, updated, errors
+
+    def _replace_links(self, rows, key, through, field):
+        rows = [row for row in rows if row[key] is not None]
+        if not rows:
+            return
+        through.objects.filter(product_id__in=[row['product_id'] for row in rows]).delete()
+        through.objects.bulk_create(
+            through(product_id=row['product_id'], **{field: size_id})
+            for row in rows for size_id in row[key]
+        )
+
+    def _replace_images(self, rows):
+        rows = [row for row in rows if row['images'] is not None]
+        if not rows:
+            return
+        # A queryset delete leaves the files alone; other products may share them
+        ProductImage.objects.filter(product_id__in=[row['product_id'] for row in rows]).delete()
+        ProductImage.objects.bulk_create(
+            ProductImage(product_id=row['product_id'], image=self._stored_name(path))
+            for row in rows for path in row['images']
+        )
+
+    def _set_stock(self, rows):
+        """Give every listed size of a row `stock` units, creating the Stock rows that are missing"""
+        wanted = {}
+        for row in rows:
+            if row['stock'] is None:
+                continue
+            for size_id in row['size_ids'] or []:
+                wanted[(row['product_id'], size_id, None)] = row['stock']
+            for shoe_size_id in row['shoe_size_ids'] or []:
+                wanted[(row['product_id'], None, shoe_size_id)] = row['stock']
+        if not wanted:
+            return
+        stock_ids = {
+            (product_id, size_id, shoe_size_id): stock_id
+            for stock_id, product_id, size_id, shoe_size_id in Stock.objects.filter(
+                product_id__in={product_id for product_id, _, _ in wanted}
+            ).values_list('id', 'product_id', 'size_id', 'shoe_size_id')
+        }
+        Stock.objects.bulk_create(
+            [
+                Stock(id=stock_ids.get(key), product_id=key[0], size_id=key[1], shoe_size_id=key[2],
+                      quantity=quantity)
+                for key, quantity in wanted.items()
+            ],
+            update_conflicts=True, unique_fields=['id'], update_fields=['quantity'],
+        )
+
+
+def batches(rows, size=IMPORT_BATCH_SIZE):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
@@ -1,13 +1,25 @@
-from .views import get_or_create_cart
+from django.utils.functional import SimpleLazyObject
+
+from .cart import get_cart_item_count
+from .navigation import get_navigation_tree
 
 def cart_context(request):
-    """Add cart item count to all template contexts"""
-    try:
-        cart = get_or_create_cart(request)
-        cart_item_count = cart.get_total_items()
-    except:
-        cart_item_count = 0
+    """Add a lazily evaluated cart item count to all template contexts"""
+    def cart_item_count():
+        try:
+            return get_cart_item_count(request)
+        except:
+            return 0
     
     return {
-        'cart_item_count': cart_item_count
+        'cart_item_count': SimpleLazyObject(cart_item_count)
+    }
+
+
+def navigation_context(request):
+    """Add the cached navigation tree to all template contexts"""
+    tree = get_navigation_tree()
+    return {
+        'categories': tree['categories'],
+        'head_categories': tree['head_categories']
     }
\ No newline at end of file
@@ -0,0 +1,106 @@
+import contextvars
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import SharedCounter
+
+
+_request_counters = contextvars.ContextVar('shared_counters', default=None)
+
+
+class _Snapshot:
+    """Every counter's value, read at most once per request by CounterSnapshotMiddleware"""
+
+    def __init__(self):
+        self.values = None
+
+
+def _start(initial):
+    # Counters start from the clock by default, so one that is recreated never
+    # repeats a value another process may still hold
+    return time.time_ns() // 1000 if initial is None else initial
+
+
+def get_counter(name, initial=None):
+    """Current value of a shared counter, created at `initial` (default: the clock) on first use"""
+    snapshot = _request_counters.get()
+    if snapshot is not None:
+        if snapshot.values is None:
+            # One query answers every counter the request reads
+            snapshot.values = dict(SharedCounter.objects.values_list('name', 'value'))
+        if name in snapshot.values:
+            return snapshot.values[name]
+
+    value = SharedCounter.objects.filter(name=name).values_list('value', flat=True).first()
+    if value is None:
+        counter, created = SharedCounter.objects.get_or_create(name=name, defaults={'value': _start(initial)})
+        value = counter.value
+    if snapshot is not None:
+        snapshot.values[name] = value
+    return value
+
+
+async def aget_counter(name, initial=None):
+    """get_counter for async views"""
+    snapshot = _request_counters.get()
+    if snapshot is not None:
+        if snapshot.values is None:
+            snapshot.values = {
+                counter: value async for counter, value in SharedCounter.objects.values_list('name', 'value')
+            }
+        if name in snapshot.values:
+            return snapshot.values[name]
+
+    value = await SharedCounter.objects.filter(name=name).values_list('value', flat=True).afirst()
+    if value is None:
+        counter, created = await SharedCounter.objects.aget_or_create(name=name, defaults={'value': _start(initial)})
+        value = counter.value
+    if snapshot is not None:
+        snapshot.values[name] = value
+    return value
+
+
+def increment_counter(name, initial=None):
+    """Add one to a shared counter in a single UPDATE and return its new value"""
+    with transaction.atomic():
+        counters = SharedCounter.objects.filter(name=name)
+        if not counters.update(value=F('value') + 1, updated_at=timezone.now()):
+            SharedCounter.objects.get_or_create(name=name, defaults={'value': _start(initial)})
+            counters.update(value=F('value') + 1, updated_at=timezone.now())
+        value = counters.values_list('value', flat=True).get()
+    snapshot = _request_counters.get()
+    if snapshot is not None and snapshot.values is not None:
+        snapshot.values[name] = value
+    return value
+
+
+class CounterSnapshotMiddleware:
+    """Read the shared counters once per request instead of once per lookup"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = _request_counters.set(_Snapshot())
+        try:
+            return self.get_response(request)
+        finally:
+            _request_counters.reset(token)
+
+    async def __acall__(self, request):
+        token = _request_counters.set(_Snapshot())
+        try:
+            return await self.get_response(request)
+        finally:
+            _request_counters.reset(token)
@@ -0,0 +1,339 @@
+"""Faceted filtering of product listings, with option counts from an in-process bitset index"""
+import math
+import threading
+from bisect import bisect_left
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import Exists, F, IntegerField, OuterRef
+from django.db.models.functions import Round
+from django.utils.functional import cached_property
+
+from .background import rebuild_in_background
+from .counters import get_counter, increment_counter
+from .models import Product, ShoeSize, Size
+from .navigation import get_navigation_tree
+from .search import normalize_query
+
+
+# Shared counter bumped on any price, size or category change
+FACET_VERSION = 'facets'
+# Lower bounds of the price bands offered as links, in rupees
+PRICE_BANDS = (Decimal(0), Decimal(1000), Decimal(2500), Decimal(5000))
+MULTI_VALUE_FACETS = ('size', 'shoe_size', 'head')
+# Search result bitsets memoized per snapshot and normalized query; cleared when full
+SEARCH_SCOPE_CACHE_SIZE = 256
+
+
+def _price(value):
+    try:
+        price = Decimal(value)
+    except (InvalidOperation, TypeError):
+        return None
+    return price if price.is_finite() and price >= 0 else None
+
+
+def parse_filters(params):
+    """Read the active filters from a QueryDict, dropping values no product could match.
+
+    min_price/max_price bound a half-open range; size, shoe_size and head
+    (a head category slug) repeat and are ORed within a facet.
+    """
+    known = {
+        'size': {name for name, _ in Size.SIZE_CHOICES},
+        'shoe_size': {size for size, _ in ShoeSize.SIZE_CHOICES},
+        'head': {head['slug'] for head in get_navigation_tree()['head_categories']},
+    }
+    filters = {
+        'min_price': _price(params.get('min_price')),
+        'max_price': _price(params.get('max_price')),
+    }
+    for name in MULTI_VALUE_FACETS:
+        filters[name] = sorted(set(params.getlist(name)) & known[name])
+    return filters
+
+
+def filter_products(queryset, filters):
+    """Apply the active filters to a product queryset; Exists() keeps one row per product"""
+    if filters['min_price'] is not None:
+        queryset = queryset.filter(price__gte=filters['min_price'])
+    if filters['max_price'] is not None:
+        queryset = queryset.filter(price__lt=filters['max_price'])
+    if filters['size']:
+        queryset = queryset.filter(Exists(Product.available_sizes.through.objects.filter(
+            product_id=OuterRef('pk'), size__name__in=filters['size']
+        )))
+    if filters['shoe_size']:
+        queryset = queryset.filter(Exists(Product.available_shoe_sizes.through.objects.filter(
+            product_id=OuterRef('pk'), shoesize__size__in=filters['shoe_size']
+        )))
+    if filters['head']:
+        queryset = queryset.filter(category__head_category__slug__in=filters['head'])
+    return queryset
+
+
+def _bitset(positions):
+    bits = bytearray(max(positions, default=0) // 8 + 1)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def _cents(price):
+    return math.ceil(price * 100)
+
+
+class FacetSnapshot:
+    """Bitsets of one catalog version; bit n is the nth product in (price, id) order"""
+
+    def __init__(self, positions, cents, masks):
+        self.positions = positions
+        self.cents = cents
+        self.masks = masks
+        self.everything = (1 << len(cents)) - 1
+        self.searches = {}
+
+    def select(self, product_ids):
+        """Bitset of the given products, skipping any newer than the snapshot"""
+        positions = self.positions
+        return _bitset([positions[product_id] for product_id in product_ids if product_id in positions])
+
+    def search_scope(self, query, product_ids):
+        """select() of a search's results, fetching `product_ids()` once per normalized query"""
+        key = ' '.join(normalize_query(query))
+        mask = self.searches.get(key)
+        if mask is None:
+            if len(self.searches) >= SEARCH_SCOPE_CACHE_SIZE:
+                self.searches = {}
+            mask = self.searches[key] = self.select(product_ids())
+        return mask
+
+    def price_range(self, lower, upper):
+        """Bitset of the products priced in [lower, upper); None leaves a side open"""
+        start = 0 if lower is None else bisect_left(self.cents, _cents(lower))
+        end = len(self.cents) if upper is None else bisect_left(self.cents, _cents(upper))
+        if end <= start:
+            return 0
+        return ((1 << end) - 1) ^ ((1 << start) - 1)
+
+    def any_of(self, facet, values):
+        mask = 0
+        for value in values:
+            mask |= self.masks.get((facet, value), 0)
+        return mask
+
+    def counts(self, scope, filters):
+        """{facet: {value: count}} within the `scope` bitset; price counts are per PRICE_BANDS index"""
+        selected = {
+            name: self.any_of(name, filters[name]) for name in MULTI_VALUE_FACETS if filters[name]
+        }
+        if filters['min_price'] is not None or filters['max_price'] is not None:
+            selected['price'] = self.price_range(filters['min_price'], filters['max_price'])
+
+        def base(facet):
+            mask = scope
+            for name, other in selected.items():
+                if name != facet:
+                    mask &= other
+            return mask
+
+        counts = {}
+        for facet in MULTI_VALUE_FACETS:
+            within = base(facet)
+            counts[facet] = {
+                value: (within & mask).bit_count()
+                for (name, value), mask in self.masks.items() if name == facet
+            }
+        within = base('price')
+        counts['price'] = {}
+        for index, lower in enumerate(PRICE_BANDS):
+            upper = PRICE_BANDS[index + 1] if index + 1 < len(PRICE_BANDS) else None
+            counts['price'][index] = (within & self.price_range(lower, upper)).bit_count()
+        return counts
+
+
+class FacetIndex:
+    """Per-process facet summary, rebuilt from three queries whenever the facet version moves.
+
+    Only the first build runs in a request; later ones run in the
+    background while the previous snapshot keeps answering.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._snapshot = None
+
+    def _current_version(self):
+        return get_counter(FACET_VERSION)
+
+    def invalidate(self, **kwargs):
+        """Make every process rebuild on its next count, after a price, size or category change"""
+        increment_counter(FACET_VERSION)
+
+    def load(self):
+        """Rebuild the summary from the database"""
+        version = self._current_version()
+        positions = {}
+        cents = []
+        members = {}
+        products = Product.objects.order_by('price', 'id').values_list(
+            'id', Round(F('price') * 100, output_field=IntegerField()), 'category_id'
+        )
+        for position, (product_id, price, category_id) in enumerate(products.iterator(chunk_size=5000)):
+            positions[product_id] = position
+            cents.append(price)
+            members.setdefault(('category', category_id), []).append(position)
+        for facet, links, names in (
+            ('size', Product.available_sizes.through.objects.values_list('size_id', 'product_id'),
+             dict(Size.objects.values_list('id', 'name'))),
+            ('shoe_size', Product.available_shoe_sizes.through.objects.values_list('shoesize_id', 'product_id'),
+             dict(ShoeSize.objects.values_list('id', 'size'))),
+        ):
+            grouped = {}
+            for value_id, product_id in links.iterator(chunk_size=5000):
+                # Products created since the first query wait for the next rebuild
+                if product_id in positions:
+                    grouped.setdefault(value_id, []).append(positions[product_id])
+            for value_id, bits in grouped.items():
+                members[(facet, names.get(value_id))] = bits
+
+        masks = {key: _bitset(bits) for key, bits in members.items()}
+        for head in get_navigation_tree()['head_categories']:
+            mask = 0
+            for category in head['categories']:
+                mask |= masks.get(('category', category['id']), 0)
+            masks[('head', head['slug'])] = mask
+        snapshot = FacetSnapshot(positions, cents, masks)
+        with self._lock:
+            self._snapshot = snapshot
+            self._version = version
+        return snapshot
+
+    def snapshot(self):
+        with self._lock:
+            version, snapshot = self._version, self._snapshot
+        if snapshot is None:
+            snapshot = self.load()
+        elif version != self._current_version():
+            rebuild_in_background('facets', self.load)
+            # Newer if the rebuild ran inline, the previous one while it runs in the background
+            with self._lock:
+                snapshot = self._snapshot
+        return snapshot
+
+
+facet_index = FacetIndex()
+
+
+def _price_label(lower, upper):
+    if upper is None:
+        return f'₹{lower:,} and above'
+    if not lower:
+        return f'Under ₹{upper:,}'
+    return f'₹{lower:,} – ₹{upper:,}'
+
+
+class Facets:
+    """The facet filters of one listing request; counts are only computed when a template reads them.
+
+    Counts cover the whole catalog, the products of `category_id`, or for
+    a `search_query` exactly the products `queryset` returns.
+    """
+
+    def __init__(self, request, queryset, category_id=None, search_query=None):
+        self.request = request
+        self.queryset = queryset
+        self.category_id = category_id
+        self.search_query = search_query
+        self.filters = parse_filters(request.GET)
+
+    def filtered(self):
+        return filter_products(self.queryset, self.filters)
+
+    @property
+    def active(self):
+        return any(self.filters.values())
+
+    @property
+    def clear_url(self):
+        def change(params):
+            for name in self.filters:
+                params.pop(name, None)
+        return self._url(change)
+
+    def _url(self, change):
+        """The current listing URL with `change` applied to its parameters, back on the first page"""
+        params = self.request.GET.copy()
+        for name in ('cursor', 'format'):
+            params.pop(name, None)
+        change(params)
+        query = params.urlencode()
+        return f'{self.request.path}?{query}' if query else self.request.path
+
+    def _toggle_url(self, name, value, selected):
+        def change(params):
+            values = [v for v in params.getlist(name) if v != value]
+            params.setlist(name, values if selected else values + [value])
+        return self._url(change)
+
+    def _price_url(self, lower, upper, selected):
+        def change(params):
+            params.pop('min_price', None)
+            params.pop('max_price', None)
+            if not selected:
+                if lower:
+                    params['min_price'] = str(lower)
+                if upper is not None:
+                    params['max_price'] = str(upper)
+        return self._url(change)
+
+    def _options(self, name, values, counts):
+        options = []
+        for value, label in values:
+            selected = value in self.filters[name]
+            count = counts.get(value, 0)
+            if count or selected:
+                options.append({
+                    'label': label,
+                    'count': count,
+                    'selected': selected,
+                    'url': self._toggle_url(name, value, selected),
+                })
+        return options
+
+    def _scope(self, snapshot):
+        if self.search_query is not None:
+            return snapshot.search_scope(
+                self.search_query, lambda: self.queryset.order_by().values_list('id', flat=True)
+            )
+        if self.category_id is not None:
+            return snapshot.masks.get(('category', self.category_id), 0)
+        return snapshot.everything
+
+    @cached_property
+    def groups(self):
+        """[(title, options)] for every facet with something to offer"""
+        snapshot = facet_index.snapshot()
+        counts = snapshot.counts(self._scope(snapshot), self.filters)
+        heads = [(head['slug'], head['name']) for head in get_navigation_tree()['head_categories']]
+
+        prices = []
+        for index, lower in enumerate(PRICE_BANDS):
+            upper = PRICE_BANDS[index + 1] if index + 1 < len(PRICE_BANDS) else None
+            selected = (self.filters['min_price'] or 0) == lower and self.filters['max_price'] == upper
+            count = counts['price'][index]
+            if count or selected:
+                prices.append({
+                    'label': _price_label(lower, upper),
+                    'count': count,
+                    'selected': selected,
+                    'url': self._price_url(lower, upper, selected),
+                })
+
+        groups = [
+            ('Category', self._options('head', heads, counts['head'])),
+            ('Price', prices),
+            ('Size', self._options('size', Size.SIZE_CHOICES, counts['size'])),
+            ('Shoe size', self._options('shoe_size', ShoeSize.SIZE_CHOICES, counts['shoe_size'])),
+        ]
+        return [(title, options) for title, options in groups if options]
@@ -0,0 +1,187 @@
+"""Streaming sitemap and merchant product feed.
+
+Every body is a generator over values() rows read with
+.iterator(chunk_size=...), so a crawler pulling 100k products costs a
+worker one chunk of tuples at a time instead of the whole catalog.
+"""
+import csv
+from xml.sax.saxutils import escape
+
+from asgiref.sync import sync_to_async
+from django.core.files.storage import default_storage
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Exists, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+
+from .models import Category, Product, SharedCounter, Stock
+
+
+# The sitemaps.org limit per file; bigger catalogs are split into shards listed by the index
+SITEMAP_URLS_PER_SHARD = 50000
+FEED_CHUNK_SIZE = 2000
+FEED_CURRENCY = 'INR'
+FEED_BRAND = 'DripSpace'
+FEED_COLUMNS = [
+    'id', 'title', 'description', 'link', 'image_link', 'price', 'availability', 'brand', 'product_type',
+]
+
+# Pages worth crawling besides products and categories
+SITEMAP_PAGES = [
+    'home', 'AllProduct', 'newArrival', 'faq', 'sizeGuide', 'storeLocations', 'careInstruction',
+    'returnExchanges', 'sustainability', 'press', 'ourstory',
+]
+
+SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+# Shared counter moved by changes that leave no newer Product.updated_at
+# behind: deleted products, edited or deleted categories (app.signals) and
+# stock selling out or coming back (app.stock)
+FEED_CHANGES = 'feeds'
+
+
+def catalog_last_modified(request, *args, **kwargs):
+    """Newest product edit or removal, for Last-Modified and If-Modified-Since"""
+    edited = Max('updated_at')
+    removed = Subquery(SharedCounter.objects.filter(name=FEED_CHANGES).values('updated_at'))
+    # One query; either side may be NULL, which GREATEST() would return as is
+    return Product.objects.aggregate(
+        last_modified=Greatest(Coalesce(edited, removed), Coalesce(removed, edited))
+    )['last_modified']
+
+
+def sitemap_shard_count():
+    """Shards are id ranges, so the count comes from one indexed MAX(id) instead of COUNT(*)"""
+    last_id = Product.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+    return max(1, -(-last_id // SITEMAP_URLS_PER_SHARD))
+
+
+def _lastmod(value):
+    return value.isoformat(timespec='seconds')
+
+
+def _url_template(request, name):
+    """Absolute URL of a slug route with a marker to fill in, instead of reverse() per row"""
+    return request.build_absolute_uri(reverse(name, args=['slug-marker']))
+
+
+def _buffered(lines, size=FEED_CHUNK_SIZE):
+    """Join lines into chunks, so the server writes to the socket once per chunk rather than per row"""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= size:
+            yield ''.join(chunk)
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
+
+
+async def _pulled(chunks):
+    """Async iteration over sync chunks, each pulled on the thread that runs the ORM"""
+    next_chunk = sync_to_async(next)
+    while (chunk := await next_chunk(chunks, None)) is not None:
+        yield chunk
+
+
+def streaming_response(request, lines, content_type):
+    chunks = _buffered(lines)
+    if isinstance(request, ASGIRequest):
+        # Django's ASGI handler reads a sync iterator into memory in one go before sending it
+        chunks = _pulled(chunks)
+    return StreamingHttpResponse(chunks, content_type=f'{content_type}; charset=utf-8')
+
+
+def sitemap_index(request):
+    yield f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{SITEMAP_NS}">\n'
+    locations = [request.build_absolute_uri(reverse('sitemap_pages'))]
+    locations += [
+        request.build_absolute_uri(reverse('sitemap_products', args=[shard]))
+        for shard in range(1, sitemap_shard_count() + 1)
+    ]
+    for location in locations:
+        yield f'<sitemap><loc>{escape(location)}</loc></sitemap>\n'
+    yield '</sitemapindex>\n'
+
+
+def sitemap_pages(request):
+    yield f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n'
+    for name in SITEMAP_PAGES:
+        yield f'<url><loc>{escape(request.build_absolute_uri(reverse(name)))}</loc></url>\n'
+    category_url = _url_template(request, 'category_products')
+    for slug in Category.objects.order_by('id').values_list('slug', flat=True).iterator(chunk_size=FEED_CHUNK_SIZE):
+        yield f'<url><loc>{escape(category_url.replace("slug-marker", slug))}</loc></url>\n'
+    yield '</urlset>\n'
+
+
+def sitemap_products(request, shard):
+    """Products with ids in the shard's range; gaps from deletions only make a shard smaller"""
+    rows = Product.objects.filter(
+        id__gt=(shard - 1) * SITEMAP_URLS_PER_SHARD, id__lte=shard * SITEMAP_URLS_PER_SHARD
+    ).order_by('id').values_list('slug', 'updated_at')
+    product_url = _url_template(request, 'productDetail')
+    yield f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n'
+    for slug, updated_at in rows.iterator(chunk_size=FEED_CHUNK_SIZE):
+        yield (
+            f'<url><loc>{escape(product_url.replace("slug-marker", slug))}</loc>'
+            f'<lastmod>{_lastmod(updated_at)}</lastmod></url>\n'
+        )
+    yield '</urlset>\n'
+
+
+def _feed_rows(request):
+    """One dict per product in merchant feed terms"""
+    stock = Stock.objects.filter(product=OuterRef('pk'))
+    rows = (
+        Product.objects.order_by('id')
+        .annotate(tracked=Exists(stock), in_stock=Exists(stock.filter(quantity__gt=0)))
+        .values_list('id', 'name', 'description', 'slug', 'image', 'price', 'category__name', 'tracked', 'in_stock')
+    )
+    product_url = _url_template(request, 'productDetail')
+    for product_id, name, description, slug, image, price, category, tracked, in_stock in rows.iterator(
+        chunk_size=FEED_CHUNK_SIZE
+    ):
+        yield {
+            'id': product_id,
+            'title': name,
+            'description': description,
+            'link': product_url.replace('slug-marker', slug),
+            'image_link': request.build_absolute_uri(default_storage.url(image)) if image else '',
+            'price': f'{price} {FEED_CURRENCY}',
+            # Products without stock rows are not tracked and always on sale
+            'availability': 'in stock' if in_stock or not tracked else 'out of stock',
+            'brand': FEED_BRAND,
+            'product_type': category,
+        }
+
+
+class _Echo:
+    """csv.writer target that hands each formatted line straight back"""
+
+    def write(self, value):
+        return value
+
+
+def product_feed_csv(request):
+    writer = csv.DictWriter(_Echo(), fieldnames=FEED_COLUMNS)
+    yield writer.writeheader()
+    for row in _feed_rows(request):
+        yield writer.writerow(row)
+
+
+def product_feed_xml(request):
+    """RSS 2.0 with the Google Merchant g: namespace"""
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0" xmlns:g="http://base.google.com/ns/1.0"><channel>\n'
+        f'<title>{FEED_BRAND}</title><link>{escape(request.build_absolute_uri("/"))}</link>'
+        f'<description>{FEED_BRAND} product feed</description>\n'
+    )
+    for row in _feed_rows(request):
+        fields = ''.join(
+            f'<g:{column}>{escape(str(row[column]))}</g:{column}>'
+            for column in FEED_COLUMNS
+        )
+        yield f'<item>{fields}</item>\n'
+    yield '</channel></rss>\n'
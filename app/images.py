@@ -0,0 +1,139 @@
+import io
+import os
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, features
+
+
+# Widths generated for every uploaded image; originals are never upscaled
+RENDITION_WIDTHS = (320, 640, 1024)
+PLACEHOLDER_WIDTH = 24
+
+RENDITION_FORMATS = {
+    'avif': {'format': 'AVIF', 'mime': 'image/avif', 'options': {'quality': 55}},
+    'webp': {'format': 'WEBP', 'mime': 'image/webp', 'options': {'quality': 75, 'method': 4}},
+    'jpg': {'format': 'JPEG', 'mime': 'image/jpeg', 'options': {'quality': 80, 'optimize': True, 'progressive': True}},
+}
+
+RENDITIONS_CACHE_KEY = 'image:renditions:{name}'
+# The cache is per process, so a set another worker dropped is noticed within this
+RENDITIONS_TIMEOUT = 60 * 60
+# How long a "no renditions yet" answer is trusted before storage is checked again
+MISSING_RENDITIONS_TIMEOUT = 60 * 5
+
+
+def available_formats():
+    """Rendition extensions this Pillow build can encode, best compression first"""
+    return [ext for ext in RENDITION_FORMATS if ext != 'avif' or features.check('avif')]
+
+
+def rendition_name(name, width, ext):
+    """products/shoe.avif -> products/renditions/shoe.avif-640w.webp
+
+    The source's whole file name is kept, so shoe.avif and shoe.png never
+    share a rendition.
+    """
+    directory, filename = os.path.split(name)
+    return os.path.join(directory, 'renditions', f'{filename}-{width}w.{ext}')
+
+
+def placeholder_name(name):
+    directory, filename = os.path.split(name)
+    return os.path.join(directory, 'renditions', f'{filename}-placeholder.jpg')
+
+
+def _encode(image, ext):
+    spec = RENDITION_FORMATS[ext]
+    if spec['format'] == 'JPEG' and image.mode != 'RGB':
+        # JPEG has no alpha channel, flatten transparent images onto white
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        rgba = image.convert('RGBA')
+        background.paste(rgba, mask=rgba.getchannel('A'))
+        image = background
+    elif image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+    buffer = io.BytesIO()
+    image.save(buffer, spec['format'], **spec['options'])
+    return buffer.getvalue()
+
+
+def _resized(image, width):
+    if image.width <= width:
+        return image
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def _replace(storage, name, content):
+    if storage.exists(name):
+        storage.delete(name)
+    storage.save(name, ContentFile(content))
+
+
+def generate_renditions(field_file, force=False):
+    """Write every width/format rendition plus a placeholder next to the original image"""
+    if not field_file or not field_file.name:
+        return False
+    storage = field_file.storage
+    name = field_file.name
+    if not force and has_renditions(name, storage):
+        return False
+    if not storage.exists(name):
+        # Nothing to resize; templates keep pointing at the original URL
+        return False
+
+    with storage.open(name, 'rb') as original:
+        image = Image.open(original)
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    for width in RENDITION_WIDTHS:
+        resized = _resized(image, width)
+        for ext in available_formats():
+            _replace(storage, rendition_name(name, width, ext), _encode(resized, ext))
+
+    # The placeholder is written last so its presence means the set is complete
+    _replace(storage, placeholder_name(name), _encode(_resized(image, PLACEHOLDER_WIDTH), 'jpg'))
+    cache.set(RENDITIONS_CACHE_KEY.format(name=name), True, timeout=RENDITIONS_TIMEOUT)
+    return True
+
+
+def import_image(source, name, renditions=True):
+    """Copy a local image file into storage as `name` and build its renditions.
+
+    Used from worker processes by bulk imports, so it touches storage only,
+    never the database. An image already in storage is not copied again.
+    """
+    storage = default_storage
+    if source and not storage.exists(name):
+        with open(source, 'rb') as image_file:
+            saved = storage.save(name, image_file)
+        if saved != name:
+            raise ValueError(f"{name} was stored as {saved}")
+    if renditions:
+        generate_renditions(SimpleNamespace(name=name, storage=storage))
+    return name
+
+
+def delete_renditions(name, storage=default_storage):
+    """Remove the renditions of an image that is being deleted or replaced"""
+    if not name:
+        return
+    for width in RENDITION_WIDTHS:
+        for ext in RENDITION_FORMATS:
+            storage.delete(rendition_name(name, width, ext))
+    storage.delete(placeholder_name(name))
+    cache.delete(RENDITIONS_CACHE_KEY.format(name=name))
+
+
+def has_renditions(name, storage=default_storage):
+    """Whether the rendition set for an image exists, remembered in the cache"""
+    key = RENDITIONS_CACHE_KEY.format(name=name)
+    exists = cache.get(key)
+    if exists is None:
+        exists = storage.exists(placeholder_name(name))
+        cache.set(key, exists, timeout=RENDITIONS_TIMEOUT if exists else MISSING_RENDITIONS_TIMEOUT)
+    return exists
@@ -0,0 +1,56 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from app.benchmarks import seed_catalog
+from app.models import Cart
+from app.query_plans import EXPECTED_SCANS, audit_routes
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a synthetic catalog in a throwaway test database, request every route and run "
+        "EXPLAIN QUERY PLAN over each statement. Fails if a route scans a whole table that "
+        "an index should have narrowed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--products', type=int, default=10000, help="Catalog size to seed")
+        parser.add_argument('--carts', type=int, default=10000,
+                            help="Anonymous carts to seed, so cart lookups have something to scan")
+        parser.add_argument('--min-rows', type=int, default=1000,
+                            help="Ignore scans of tables smaller than this, e.g. sizes and categories")
+        parser.add_argument('--show-sql', action='store_true', help="Print the statement behind each scan")
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError("The audit reads SQLite's EXPLAIN QUERY PLAN output")
+
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        old_config = runner.setup_databases()
+        try:
+            with transaction.atomic():
+                fixture = seed_catalog(options['products'])
+                Cart.objects.bulk_create(
+                    Cart(session_key=f'audit-{number}') for number in range(options['carts'])
+                )
+                findings = audit_routes(fixture, min_rows=options['min_rows'])
+                transaction.set_rollback(True)
+            cache.clear()
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        unexpected = [finding for finding in findings if not finding['expected']]
+        for finding in findings:
+            note = EXPECTED_SCANS.get((finding['route'], finding['table']), 'missing index?')
+            self.stdout.write(f"{finding['route']:<20} {finding['plan']:<45} {note}")
+            if options['show_sql']:
+                self.stdout.write(f"    {finding['sql']}")
+
+        if unexpected:
+            raise CommandError(f"{len(unexpected)} full table scans without an explanation")
+        self.stdout.write(self.style.SUCCESS("No unexpected full table scans"))
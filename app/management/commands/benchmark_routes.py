@@ -0,0 +1,97 @@
+import json
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from app.benchmarks import (
+    BASELINE_PATH, find_regressions, load_baseline, measure_checkout, measure_routes, seed_catalog,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed synthetic catalogs in a throwaway test database, request every route, and "
+        "record query counts, wall time and response bytes. Fails if a route regresses "
+        "past the committed baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='100,10000,100000',
+                            help="Comma-separated catalog sizes to seed (default: 100,10000,100000)")
+        parser.add_argument('--repeat', type=int, default=3,
+                            help="Measured runs per route after one warm-up run")
+        parser.add_argument('--baseline', default=str(BASELINE_PATH),
+                            help="Baseline JSON to compare against and update")
+        parser.add_argument('--update-baseline', action='store_true',
+                            help="Write the results as the new baseline if no route regressed")
+        parser.add_argument('--force', action='store_true',
+                            help="With --update-baseline, record query and byte regressions too")
+        parser.add_argument('--no-time', action='store_true',
+                            help="Only budget queries and bytes, e.g. on noisy CI machines")
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',') if size.strip()]
+        baseline = load_baseline(options['baseline'])
+
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        old_config = runner.setup_databases()
+        results = {}
+        try:
+            for size in sizes:
+                self.stdout.write(f"Seeding {size} products...")
+                with transaction.atomic():
+                    fixture = seed_catalog(size)
+                    results[str(size)] = measure_routes(fixture, repeat=options['repeat'])
+                    checkout = measure_checkout(fixture, repeat=options['repeat'])
+                    transaction.set_rollback(True)
+                cache.clear()
+                self._report(size, results[str(size)])
+                self._report_checkout(checkout)
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        # Timings are re-recorded freely; query and byte budgets only move down unless forced
+        check_time = not options['no_time'] and not options['update_baseline']
+        regressions = []
+        for size, size_results in results.items():
+            for regression in find_regressions(size_results, baseline.get(size, {}), check_time=check_time):
+                regressions.append(f"[{size} products] {regression}")
+
+        if options['update_baseline']:
+            if regressions and not options['force']:
+                raise CommandError(
+                    "Not recording regressions as the baseline (pass --force if they are intended):\n  "
+                    + "\n  ".join(regressions)
+                )
+            baseline.update(results)
+            with open(options['baseline'], 'w') as baseline_file:
+                json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+                baseline_file.write('\n')
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {options['baseline']}"))
+            return
+
+        if regressions:
+            raise CommandError("Route budgets exceeded:\n  " + "\n  ".join(regressions))
+        self.stdout.write(self.style.SUCCESS("All routes within budget"))
+
+    def _report(self, size, results):
+        self.stdout.write(f"\n{size} products")
+        self.stdout.write(f"  {'route':<20} {'status':>6} {'queries':>8} {'ms':>9} {'bytes':>9}")
+        for name, result in results.items():
+            self.stdout.write(
+                f"  {name:<20} {result['status']:>6} {result['queries']:>8} "
+                f"{result['time_ms']:>9.2f} {result['bytes']:>9}"
+            )
+
+    def _report_checkout(self, results):
+        self.stdout.write("\n  process_checkout by cart size")
+        self.stdout.write(f"  {'lines':<20} {'status':>6} {'queries':>8} {'ms':>9}")
+        for lines, result in results.items():
+            self.stdout.write(
+                f"  {lines:<20} {result['status']:>6} {result['queries']:>8} {result['time_ms']:>9.2f}"
+            )
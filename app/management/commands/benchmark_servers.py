@@ -0,0 +1,197 @@
+import asyncio
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.models import Product
+
+
+SERVER_COMMANDS = {
+    'gunicorn': lambda port, workers: [
+        sys.executable, '-m', 'gunicorn', 'main.wsgi:application',
+        '--worker-class', 'sync', '--workers', str(workers),
+        '--bind', f'127.0.0.1:{port}', '--log-level', 'warning',
+    ],
+    'uvicorn': lambda port, workers: [
+        sys.executable, '-m', 'uvicorn', 'main.asgi:application',
+        '--workers', str(workers), '--host', '127.0.0.1', '--port', str(port),
+        '--log-level', 'warning', '--no-access-log',
+    ],
+}
+# uvicorn again, with the JSON endpoints routed to their native async views
+SERVER_COMMANDS['uvicorn-async'] = SERVER_COMMANDS['uvicorn']
+SERVER_ENVIRONMENTS = {'uvicorn-async': {'DJANGO_ASYNC_VIEWS': '1'}}
+
+ENDPOINTS = ('count', 'suggest', 'add')
+
+
+async def http_request(port, method, path, cookies, body=b'', headers=None):
+    """Send one HTTP/1.1 request on a fresh connection, keep its cookies and return the status"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    lines = [f'{method} {path} HTTP/1.1', 'Host: 127.0.0.1', 'Connection: close']
+    if cookies:
+        lines.append('Cookie: ' + '; '.join(f'{name}={value}' for name, value in cookies.items()))
+    for name, value in (headers or {}).items():
+        lines.append(f'{name}: {value}')
+    lines.append(f'Content-Length: {len(body)}')
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+
+    head = raw.partition(b'\r\n\r\n')[0].decode('latin-1').split('\r\n')
+    for line in head[1:]:
+        name, _, value = line.partition(':')
+        if name.lower() == 'set-cookie':
+            cookie_name, _, cookie_value = value.strip().split(';', 1)[0].partition('=')
+            cookies[cookie_name] = cookie_value
+    return int(head[0].split(' ', 2)[1])
+
+
+async def run_client(port, deadline, endpoints, add_body, stats):
+    """One simulated shopper: pick up a CSRF cookie, then cycle through the endpoints"""
+    cookies = {}
+    # The login form renders {% csrf_token %}, which is what sets the cookie
+    await http_request(port, 'GET', '/login/', cookies)
+    requests = {
+        'count': ('GET', '/cart/count/', b'', {}),
+        'suggest': ('GET', '/search/suggestions/?q=dri', b'', {}),
+        'add': ('POST', '/add-to-cart/', add_body, {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': cookies.get('csrftoken', ''),
+        }),
+    }
+    while time.monotonic() < deadline:
+        for endpoint in endpoints:
+            method, path, body, headers = requests[endpoint]
+            started = time.perf_counter()
+            try:
+                status = await http_request(port, method, path, cookies, body, headers)
+            except (OSError, IndexError, ValueError):
+                status = None
+            stats['latencies'].append(time.perf_counter() - started)
+            if status != 200:
+                stats['errors'] += 1
+
+
+async def run_load(port, concurrency, duration, endpoints, add_body):
+    stats = {'latencies': [], 'errors': 0}
+    deadline = time.monotonic() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        run_client(port, deadline, endpoints, add_body, stats) for _ in range(concurrency)
+    ))
+    stats['elapsed'] = time.perf_counter() - started
+    return stats
+
+
+def wait_for_port(port, process, timeout=20):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise CommandError(f"Server exited with code {process.returncode}")
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise CommandError(f"Server did not start listening on port {port}")
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare requests/sec of the JSON cart and suggestion endpoints under gunicorn sync "
+        "workers and uvicorn, with sync and with async views, with many concurrent clients, "
+        "against a scratch copy of the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--servers', default='gunicorn,uvicorn,uvicorn-async')
+        parser.add_argument('--endpoints', default=','.join(ENDPOINTS),
+                            help="Comma-separated subset of: count, suggest, add")
+        parser.add_argument('--concurrency', type=int, default=100)
+        parser.add_argument('--duration', type=float, default=10.0, help="Seconds of load per server")
+        parser.add_argument('--workers', type=int, default=2)
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--output', help="Also write the results as JSON to this path")
+
+    def handle(self, *args, **options):
+        servers = [server for server in options['servers'].split(',') if server]
+        endpoints = [endpoint for endpoint in options['endpoints'].split(',') if endpoint]
+        for server in servers:
+            if server not in SERVER_COMMANDS:
+                raise CommandError(f"Unknown server '{server}'")
+        for endpoint in endpoints:
+            if endpoint not in ENDPOINTS:
+                raise CommandError(f"Unknown endpoint '{endpoint}'")
+
+        product = Product.objects.filter(available_sizes__isnull=False).values(
+            'id', 'available_sizes'
+        ).first()
+        if product is None and 'add' in endpoints:
+            raise CommandError("The 'add' endpoint needs a product with at least one size")
+        add_body = json.dumps({
+            'product_id': product['id'] if product else None,
+            'size_id': product['available_sizes'] if product else None,
+            'quantity': 1,
+        }).encode()
+
+        results = {}
+        with tempfile.TemporaryDirectory() as scratch:
+            # Every server gets a fresh copy, so cart writes never touch the real database
+            for server in servers:
+                database = os.path.join(scratch, f'{server}.sqlite3')
+                shutil.copy(settings.DATABASES['default']['NAME'], database)
+                env = dict(os.environ, DJANGO_SQLITE_PATH=database, **SERVER_ENVIRONMENTS.get(server, {}))
+                subprocess.run(
+                    [sys.executable, 'manage.py', 'migrate', '--verbosity', '0'],
+                    cwd=settings.BASE_DIR, env=env, check=True
+                )
+                results[server] = self._benchmark(server, env, options, endpoints, add_body)
+
+        self.stdout.write(
+            f"\n{'server':<13} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'requests':>9} {'errors':>7}"
+        )
+        for server, result in results.items():
+            self.stdout.write(
+                f"{server:<13} {result['requests_per_second']:>9.1f} {result['p50_ms']:>8.1f} "
+                f"{result['p99_ms']:>8.1f} {result['requests']:>9} {result['errors']:>7}"
+            )
+        if options['output']:
+            with open(options['output'], 'w') as output_file:
+                json.dump(results, output_file, indent=2)
+
+    def _benchmark(self, server, env, options, endpoints, add_body):
+        port = options['port']
+        self.stdout.write(f"Benchmarking {server} with {options['concurrency']} clients...")
+        process = subprocess.Popen(
+            SERVER_COMMANDS[server](port, options['workers']), cwd=settings.BASE_DIR, env=env
+        )
+        try:
+            wait_for_port(port, process)
+            stats = asyncio.run(run_load(
+                port, options['concurrency'], options['duration'], endpoints, add_body
+            ))
+        finally:
+            process.terminate()
+            process.wait()
+
+        latencies = sorted(stats['latencies'])
+        if not latencies:
+            raise CommandError(f"No requests completed against {server}")
+        return {
+            'requests': len(latencies),
+            'errors': stats['errors'],
+            'requests_per_second': round(len(latencies) / stats['elapsed'], 1),
+            'p50_ms': round(statistics.median(latencies) * 1000, 1),
+            'p99_ms': round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 1),
+        }
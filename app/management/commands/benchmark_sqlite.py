@@ -0,0 +1,157 @@
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, close_old_connections, connection
+
+from app.benchmarks import seed_catalog
+from app.cart import add_cart_line
+from app.models import Cart, Product, Size
+
+
+PROFILES = ('default', 'tuned')
+
+
+def build_profiles():
+    """What a bare sqlite3 DATABASES entry gets versus what main/settings.py configures"""
+    return {
+        'default': {'pragmas': {}, 'options': {}, 'conn_max_age': 0},
+        'tuned': {
+            'pragmas': dict(settings.SQLITE_PRAGMAS),
+            'options': dict(settings.DATABASES['default'].get('OPTIONS', {})),
+            'conn_max_age': settings.DATABASES['default'].get('CONN_MAX_AGE', 0),
+        },
+    }
+
+
+def use_profile(path, profile):
+    """Point the default connection at `path` with the given pragmas, OPTIONS and CONN_MAX_AGE"""
+    connection.close()
+    settings.SQLITE_PRAGMAS = profile['pragmas']
+    connection.settings_dict.update(
+        NAME=path, OPTIONS=dict(profile['options']), CONN_MAX_AGE=profile['conn_max_age']
+    )
+
+
+def run_worker(args):
+    """One worker process: a mix of catalog reads and cart writes, each as its own 'request'"""
+    number, path, profile, start_at, duration, write_ratio = args
+    use_profile(path, profile)
+    rng = random.Random(number)
+    cart = Cart.objects.create(session_key=f'benchmark-worker-{number}')
+    lines = list(Product.objects.filter(available_sizes__isnull=False).values_list('id', 'available_sizes')[:50])
+    categories = list(Product.objects.values_list('category_id', flat=True).distinct())
+    close_old_connections()
+
+    stats = {'reads': [], 'writes': [], 'errors': 0}
+    time.sleep(max(0.0, start_at - time.time()))
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        write = rng.random() < write_ratio
+        started = time.perf_counter()
+        try:
+            if write:
+                product_id, size_id = rng.choice(lines)
+                add_cart_line(cart, Product(id=product_id), size=Size(id=size_id))
+            else:
+                list(Product.objects.filter(category_id=rng.choice(categories))
+                     .values('id', 'name', 'price').order_by('-id')[:24])
+        except DatabaseError:
+            stats['errors'] += 1
+        else:
+            stats['writes' if write else 'reads'].append(time.perf_counter() - started)
+        # The end of a request: drops the connection unless CONN_MAX_AGE keeps it
+        close_old_connections()
+    connection.close()
+    return stats
+
+
+def percentile(latencies, fraction):
+    return round(latencies[max(0, int(len(latencies) * fraction) - 1)] * 1000, 2) if latencies else None
+
+
+class Command(BaseCommand):
+    help = (
+        "Run several processes doing catalog reads and cart writes against one SQLite file, once "
+        "with a bare sqlite3 connection and once with the tuned connection settings, and compare."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profiles', default=','.join(PROFILES))
+        parser.add_argument('--processes', type=int, default=8)
+        parser.add_argument('--duration', type=float, default=5.0, help="Seconds of load per profile")
+        parser.add_argument('--write-ratio', type=float, default=0.2,
+                            help="Share of operations that add to a cart")
+        parser.add_argument('--products', type=int, default=1000, help="Catalog size to seed")
+        parser.add_argument('--output', help="Also write the results as JSON to this path")
+
+    def handle(self, *args, **options):
+        names = [name for name in options['profiles'].split(',') if name]
+        for name in names:
+            if name not in PROFILES:
+                raise CommandError(f"Unknown profile '{name}'")
+
+        profiles = build_profiles()
+        original = dict(connection.settings_dict), settings.SQLITE_PRAGMAS
+        results = {}
+        try:
+            with tempfile.TemporaryDirectory() as scratch:
+                for name in names:
+                    path = os.path.join(scratch, f'{name}.sqlite3')
+                    results[name] = self._benchmark(name, path, profiles[name], options)
+        finally:
+            connection.close()
+            connection.settings_dict.clear()
+            connection.settings_dict.update(original[0])
+            settings.SQLITE_PRAGMAS = original[1]
+
+        self.stdout.write(
+            f"\n{'profile':<9} {'ops/s':>8} {'reads/s':>8} {'writes/s':>9} {'read p99':>9} "
+            f"{'write p99':>10} {'errors':>7}"
+        )
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<9} {result['ops_per_second']:>8.1f} {result['reads_per_second']:>8.1f} "
+                f"{result['writes_per_second']:>9.1f} {result['read_p99_ms'] or 0:>9.2f} "
+                f"{result['write_p99_ms'] or 0:>10.2f} {result['errors']:>7}"
+            )
+        if options['output']:
+            with open(options['output'], 'w') as output_file:
+                json.dump(results, output_file, indent=2)
+
+    def _benchmark(self, name, path, profile, options):
+        self.stdout.write(f"Benchmarking the {name} profile with {options['processes']} processes...")
+        use_profile(path, profile)
+        call_command('migrate', verbosity=0)
+        seed_catalog(options['products'])
+        # Workers are forked, so they must not inherit an open connection
+        connection.close()
+
+        start_at = time.time() + 1
+        context = multiprocessing.get_context('fork')
+        with context.Pool(options['processes']) as pool:
+            stats = pool.map(run_worker, [
+                (number, path, profile, start_at, options['duration'], options['write_ratio'])
+                for number in range(options['processes'])
+            ])
+
+        reads = sorted(latency for worker in stats for latency in worker['reads'])
+        writes = sorted(latency for worker in stats for latency in worker['writes'])
+        duration = options['duration']
+        return {
+            'ops_per_second': round((len(reads) + len(writes)) / duration, 1),
+            'reads_per_second': round(len(reads) / duration, 1),
+            'writes_per_second': round(len(writes) / duration, 1),
+            'read_p50_ms': round(statistics.median(reads) * 1000, 2) if reads else None,
+            'read_p99_ms': percentile(reads, 0.99),
+            'write_p50_ms': round(statistics.median(writes) * 1000, 2) if writes else None,
+            'write_p99_ms': percentile(writes, 0.99),
+            'errors': sum(worker['errors'] for worker in stats),
+        }
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from app.images import generate_renditions
+from app.models import HeadCategory, Category, Product, ProductImage
+
+
+class Command(BaseCommand):
+    help = "Backfill responsive image renditions for existing product and category media"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force', action='store_true',
+            help="Regenerate renditions even where they already exist"
+        )
+
+    def handle(self, *args, **options):
+        generated = skipped = failed = 0
+        for model in (HeadCategory, Category, Product, ProductImage):
+            for instance in model.objects.exclude(image='').exclude(image__isnull=True).only('id', 'image').iterator():
+                try:
+                    if generate_renditions(instance.image, force=options['force']):
+                        generated += 1
+                    else:
+                        skipped += 1
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"{model.__name__} {instance.id}: {instance.image.name}: {e}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated renditions for {generated} images ({skipped} already done, {failed} failed)"
+        ))
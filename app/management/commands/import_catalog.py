@@ -0,0 +1,116 @@
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+
+from app.catalog_import import IMPORT_BATCH_SIZE, CatalogImporter, CatalogRowError, batches, parse_row, read_rows
+from app.facets import facet_index
+from app.images import import_image
+from app.navigation import invalidate_navigation_tree
+from app.search import rebuild_search_index
+from app.suggestions import suggestion_index
+
+
+# Batches of image work allowed in flight while the next product batch is written
+IMAGE_BATCHES_IN_FLIGHT = 2
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream a CSV or JSONL catalog into the database in bulk batches, matching products "
+        "on slug, and copy images and build their renditions in a process pool. Columns: name, "
+        "category, price, plus optional slug, head_category, description, image, images, "
+        "sizes, shoe_sizes and stock (units on sale per listed size). List cells in CSV use '|'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="A .csv or .jsonl file")
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE)
+        parser.add_argument('--image-root',
+                            help="Directory the image paths are relative to; files are copied into media/products/")
+        parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                            help="Processes copying images and building renditions")
+        parser.add_argument('--skip-renditions', action='store_true',
+                            help="Only copy images; generate_image_renditions can fill them in later")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f"No such file: {path}")
+        image_root = options['image_root']
+        renditions = not options['skip_renditions']
+
+        self.failed_rows = self.images = self.failed_images = 0
+        importer = CatalogImporter(image_root=image_root)
+        started = time.perf_counter()
+        created = updated = 0
+
+        pool = None
+        if image_root or renditions:
+            # Spawned workers set Django up themselves instead of inheriting the open database connection
+            pool = ProcessPoolExecutor(
+                options['workers'], mp_context=multiprocessing.get_context('spawn'), initializer=django.setup
+            )
+        in_flight = deque()
+        try:
+            for batch in batches(self._parsed_rows(path), options['batch_size']):
+                batch_created, batch_updated, errors = importer.write_batch(batch)
+                created += batch_created
+                updated += batch_updated
+                self._row_errors(errors)
+                if pool:
+                    in_flight.append([
+                        (name, pool.submit(import_image, source, name, renditions))
+                        for source, name in importer.image_tasks(batch)
+                    ])
+                    while len(in_flight) > IMAGE_BATCHES_IN_FLIGHT:
+                        self._collect(in_flight.popleft())
+            while in_flight:
+                self._collect(in_flight.popleft())
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+            # Batches are committed one by one, so a failed import still has to publish those before it
+            if created or updated or importer.created_categories:
+                self._refresh_indexes(importer)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {created + updated} products ({created} new, {updated} updated, "
+            f"{self.failed_rows} rows rejected) and {self.images} images ({self.failed_images} failed) "
+            f"in {elapsed:.1f}s"
+        ))
+
+    def _refresh_indexes(self, importer):
+        # Bulk writes skip the signals that keep these in sync. The versions
+        # are shared counters, so every worker reloads its copies
+        rebuild_search_index()
+        suggestion_index.invalidate()
+        facet_index.invalidate()
+        if importer.created_categories:
+            invalidate_navigation_tree()
+
+    def _parsed_rows(self, path):
+        for number, raw in read_rows(path):
+            try:
+                yield parse_row(number, raw)
+            except CatalogRowError as error:
+                self._row_errors([error])
+
+    def _row_errors(self, errors):
+        for error in errors:
+            self.failed_rows += 1
+            self.stderr.write(str(error))
+
+    def _collect(self, tasks):
+        for name, future in tasks:
+            try:
+                future.result()
+                self.images += 1
+            except Exception as e:
+                self.failed_images += 1
+                self.stderr.write(f"{name}: {e}")
@@ -0,0 +1,52 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from app.benchmarks import seed_catalog
+from app.page_weight import brotli, page_weights
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a synthetic catalog in a throwaway test database, render every HTML page and "
+        "report its bytes with the linked CSS and JS inlined (how pages used to ship) against "
+        "a first and a repeat visit with those bundles served as cached static files."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--products', type=int, default=100, help="Catalog size to seed")
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        old_config = runner.setup_databases()
+        try:
+            with transaction.atomic():
+                fixture = seed_catalog(options['products'])
+                pages, assets = page_weights(fixture)
+                transaction.set_rollback(True)
+            cache.clear()
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        encoding = 'br' if brotli else 'gzip'
+        self.stdout.write(f"Transfer sizes are {encoding}-encoded bytes")
+        self.stdout.write(
+            f"{'page':<20} {'html':>8} {'inline':>8} {'inline ' + encoding:>12} "
+            f"{'first visit':>12} {'repeat visit':>12} {'saved':>7}"
+        )
+        for name, page in pages.items():
+            first_visit = page['html'][encoding] + sum(assets[path][encoding] for path in page['assets'])
+            repeat_visit = page['html'][encoding]
+            before = page['inline'][encoding]
+            self.stdout.write(
+                f"{name:<20} {page['html']['raw']:>8} {page['inline']['raw']:>8} {before:>12} "
+                f"{first_visit:>12} {repeat_visit:>12} {1 - repeat_visit / before:>7.0%}"
+            )
+
+        self.stdout.write(f"\n{'asset':<36} {'raw':>8} {'gzip':>8} {'br':>8}")
+        for path, sizes in sorted(assets.items()):
+            self.stdout.write(f"{path:<36} {sizes['raw']:>8} {sizes['gzip']:>8} {sizes['br'] or '-':>8}")
@@ -0,0 +1,60 @@
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from app.models import Cart, StockReservation
+from app.stock import release_reservations
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired sessions and abandoned anonymous carts (their session is gone, "
+        "or they hold no items) in batches, so each DELETE stays short."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true',
+                            help="Only count what would be deleted")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        dry_run = options['dry_run']
+
+        expired_sessions = Session.objects.filter(expire_date__lt=timezone.now())
+        sessions = self._delete_in_batches(expired_sessions, batch_size, dry_run)
+
+        anonymous_carts = Cart.objects.filter(user__isnull=True)
+        # In a dry run the expired sessions still exist, so count their carts as orphaned too
+        live_sessions = Session.objects.filter(expire_date__gte=timezone.now()).values('session_key')
+        orphaned = self._delete_in_batches(
+            anonymous_carts.exclude(session_key__in=live_sessions), batch_size, dry_run,
+            before_delete=self._release_holds
+        )
+        empty = self._delete_in_batches(
+            anonymous_carts.filter(items__isnull=True), batch_size, dry_run,
+            before_delete=self._release_holds
+        )
+
+        verb = "Would delete" if dry_run else "Deleted"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {sessions} expired sessions, {orphaned} orphaned carts and {empty} empty carts"
+        ))
+
+    def _release_holds(self, cart_ids):
+        # Deleting a cart cascades to its stock holds, so put the units back on sale first
+        release_reservations(StockReservation.objects.filter(cart_id__in=cart_ids))
+
+    def _delete_in_batches(self, queryset, batch_size, dry_run, before_delete=None):
+        if dry_run:
+            return queryset.count()
+        deleted = 0
+        while True:
+            ids = list(queryset.values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return deleted
+            if before_delete:
+                before_delete(ids)
+            # Cart items go with their cart through the ON DELETE CASCADE collector
+            queryset.model.objects.filter(pk__in=ids).delete()
+            deleted += len(ids)
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from app.stock import RELEASE_BATCH_SIZE, release_expired_reservations
+
+
+class Command(BaseCommand):
+    help = (
+        "Put the units of expired cart holds back on sale. Run it every minute or so from cron; "
+        "each batch is one UPDATE and one DELETE."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=RELEASE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        released = release_expired_reservations(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Released {released} expired stock holds"))
@@ -0,0 +1,136 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Sum
+from django.test import Client
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from app.benchmarks import CHECKOUT_FORM, seed_catalog
+from app.models import Cart, CartItem, CustomUser, Order, Profile, Stock, StockReservation
+from app.stock import release_reservations
+
+
+def run_parallel(clients, send):
+    """Fire send(client) from one thread per client, all released at once; returns (statuses, seconds)"""
+    barrier = threading.Barrier(len(clients))
+
+    def worker(client):
+        barrier.wait()
+        try:
+            response = send(client)
+            if response.status_code != 200:
+                return f'HTTP {response.status_code}'
+            payload = response.json()
+            return 'ok' if payload['success'] else payload['message']
+        except Exception as error:
+            return type(error).__name__
+        finally:
+            connections.close_all()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(clients)) as pool:
+        statuses = Counter(pool.map(worker, clients))
+    return statuses, time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = (
+        "Flash-sale stress test: hundreds of shoppers race for a few units of one size, first "
+        "through add_to_cart and then through checkout. Fails if stock is ever oversold."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=200, help="Parallel shoppers")
+        parser.add_argument('--units', type=int, default=50, help="Units of stock on sale")
+
+    def handle(self, *args, **options):
+        clients, units = options['clients'], options['units']
+
+        # Threads need a real file to share; an in-memory test database is per connection
+        scratch = tempfile.mkdtemp()
+        settings.DATABASES['default']['TEST']['NAME'] = os.path.join(scratch, 'stress.sqlite3')
+        setup_test_environment()
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        old_config = runner.setup_databases()
+        try:
+            self._stress(clients, units)
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+            os.rmdir(scratch)
+
+    def _stress(self, clients, units):
+        fixture = seed_catalog(10)
+        product, size = fixture['product'], fixture['size']
+        stock = Stock.objects.get(product=product, size=size)
+        stock.quantity = units
+        stock.save()
+
+        users = CustomUser.objects.bulk_create(
+            CustomUser(username=f'shopper{number}', email=f'shopper{number}@example.com')
+            for number in range(clients)
+        )
+        # Checkout saves the shipping address onto the profile
+        Profile.objects.bulk_create(Profile(user=user) for user in users)
+        shoppers = []
+        for user in users:
+            client = Client()
+            client.force_login(user)
+            shoppers.append(client)
+        cache.clear()
+
+        add_body = json.dumps({'product_id': product.id, 'size_id': size.id, 'quantity': 1})
+        added, add_seconds = run_parallel(shoppers, lambda client: client.post(
+            '/add-to-cart/', add_body, content_type='application/json'
+        ))
+        self._report('add_to_cart', added, add_seconds)
+        held = StockReservation.objects.filter(stock=stock).aggregate(total=Sum('quantity'))['total'] or 0
+        stock.refresh_from_db()
+        self._check('add_to_cart', added['ok'], held, stock.quantity, units)
+
+        # Let every hold lapse, then give every shopper an unheld line so checkout has to race for stock
+        release_reservations(StockReservation.objects.all())
+        CartItem.objects.all().delete()
+        carts = {cart.user_id: cart for cart in Cart.objects.filter(user__in=users)}
+        carts.update({
+            cart.user_id: cart
+            for cart in Cart.objects.bulk_create(Cart(user=user) for user in users if user.id not in carts)
+        })
+        CartItem.objects.bulk_create(
+            CartItem(cart=cart, product=product, size=size, quantity=1) for cart in carts.values()
+        )
+
+        checked_out, checkout_seconds = run_parallel(
+            shoppers, lambda client: client.post('/process-checkout/', CHECKOUT_FORM)
+        )
+        self._report('process_checkout', checked_out, checkout_seconds)
+        sold = Order.objects.aggregate(total=Sum('total_items'))['total'] or 0
+        stock.refresh_from_db()
+        self._check('process_checkout', checked_out['ok'], sold, stock.quantity, units)
+
+    def _report(self, phase, statuses, seconds):
+        total = sum(statuses.values())
+        breakdown = ', '.join(f"{status}: {count}" for status, count in statuses.most_common())
+        self.stdout.write(
+            f"{phase:<17} {total} requests in {seconds:.2f}s ({total / seconds:.1f} req/s) - {breakdown}"
+        )
+
+    def _check(self, phase, succeeded, taken, remaining, units):
+        if remaining < 0 or taken + remaining != units or succeeded != taken:
+            raise CommandError(
+                f"{phase}: {succeeded} shoppers succeeded and {taken} units went out, "
+                f"but {remaining} of {units} units are left"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"{phase}: {taken} of {units} units taken, {remaining} left, no oversell"
+        ))
@@ -0,0 +1,217 @@
+"""Per-route latency histograms, Server-Timing headers and their Prometheus exposition"""
+import contextvars
+import random
+import threading
+import time
+from bisect import bisect_left
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.template.backends import django as django_backend
+
+
+# Prometheus' default buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_PREFIX = 'dripspace'
+
+_current = contextvars.ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    """DB and template time of one sampled request"""
+
+    def __init__(self):
+        self.db = 0.0
+        self.queries = 0
+        self.render = 0.0
+        self.rendering = False
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - started
+            self.queries += 1
+
+
+def time_query(execute, sql, params, many, context):
+    """Execute wrapper installed on every connection by app.signals; times sampled requests only.
+
+    Installed per connection rather than per request because under ASGI
+    the view runs its queries on another thread's connection; the
+    request's timings reach it through the context variable.
+    """
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    return timings(execute, sql, params, many, context)
+
+
+class RouteMetrics:
+    """Latency histogram of one route, plus the DB and template totals of its sampled requests"""
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.seconds = 0.0
+        self.sampled = 0
+        self.db_seconds = 0.0
+        self.render_seconds = 0.0
+        self.queries = 0
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.routes = {}
+
+    def observe(self, route, method, status, seconds, timings=None):
+        key = (route, method, f'{status // 100}xx')
+        with self.lock:
+            metrics = self.routes.get(key)
+            if metrics is None:
+                metrics = self.routes[key] = RouteMetrics()
+            metrics.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            metrics.count += 1
+            metrics.seconds += seconds
+            if timings is not None:
+                metrics.sampled += 1
+                metrics.db_seconds += timings.db
+                metrics.render_seconds += timings.render
+                metrics.queries += timings.queries
+
+    def reset(self):
+        with self.lock:
+            self.routes = {}
+
+    def prometheus(self):
+        """The registry in the Prometheus text exposition format"""
+        with self.lock:
+            routes = sorted(
+                (key, dict(vars(metrics), buckets=list(metrics.buckets)))
+                for key, metrics in self.routes.items()
+            )
+
+        duration = f'{METRIC_PREFIX}_http_request_duration_seconds'
+        lines = [
+            f'# HELP {duration} Time from the metrics middleware to the response, by route.',
+            f'# TYPE {duration} histogram',
+        ]
+        for (route, method, status), metrics in routes:
+            labels = f'route="{route}",method="{method}",status="{status}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), metrics['buckets']):
+                cumulative += count
+                lines.append(f'{duration}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{duration}_sum{{{labels}}} {metrics["seconds"]:.6f}')
+            lines.append(f'{duration}_count{{{labels}}} {metrics["count"]}')
+
+        for name, field, help_text in (
+            ('sampled_requests_total', 'sampled', 'Requests that were timed in detail.'),
+            ('db_seconds_total', 'db_seconds', 'Time spent in database queries by sampled requests.'),
+            ('render_seconds_total', 'render_seconds', 'Time spent rendering templates by sampled requests.'),
+            ('queries_total', 'queries', 'Database queries run by sampled requests.'),
+        ):
+            metric = f'{METRIC_PREFIX}_http_{name}'
+            lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} counter']
+            for (route, method, status), metrics in routes:
+                value = metrics[field]
+                value = f'{value:.6f}' if isinstance(value, float) else value
+                lines.append(f'{metric}{{route="{route}",method="{method}",status="{status}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+def _sampled():
+    rate = getattr(settings, 'REQUEST_METRICS_SAMPLE_RATE', 0)
+    return rate >= 1 or (rate > 0 and random.random() < rate)
+
+
+def _route(request):
+    match = getattr(request, 'resolver_match', None)
+    # view_name keeps the label set bounded; unmatched paths share one label
+    return match.view_name if match else 'unmatched'
+
+
+def server_timing(timings, total):
+    return (
+        f'db;dur={timings.db * 1000:.1f};desc="{timings.queries} queries", '
+        f'render;dur={timings.render * 1000:.1f}, '
+        f'total;dur={total * 1000:.1f}'
+    )
+
+
+class RequestMetricsMiddleware:
+    """Record every request's latency by route; time sampled requests in detail for Server-Timing.
+
+    Metrics live in each worker process's memory, so a scrape reports the
+    worker that answered it.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        started = time.perf_counter()
+        timings = RequestTimings() if _sampled() else None
+        token = _current.set(timings)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._observe(request, response, started, timings)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        timings = RequestTimings() if _sampled() else None
+        token = _current.set(timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._observe(request, response, started, timings)
+
+    def _observe(self, request, response, started, timings):
+        total = time.perf_counter() - started
+        registry.observe(_route(request), request.method, response.status_code, total, timings)
+        if timings is not None:
+            # Streaming bodies run their queries after this point, so only what the view did is reported
+            response['Server-Timing'] = server_timing(timings, total)
+        return response
+
+
+class Template(django_backend.Template):
+
+    def render(self, context=None, request=None):
+        timings = _current.get()
+        # Nested render_to_string() calls are already inside the outer render's time
+        if timings is None or timings.rendering:
+            return super().render(context, request)
+        timings.rendering = True
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timings.render += time.perf_counter() - started
+            timings.rendering = False
+
+
+class DjangoTemplates(django_backend.DjangoTemplates):
+    """The stock Django backend, with rendering timed for sampled requests"""
+
+    def from_string(self, template_code):
+        return Template(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return Template(super().get_template(template_name).template, self)
@@ -0,0 +1,33 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    # FTS5 is SQLite-only; other backends fall back to ORM filtering in app.search
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS app_product_search USING fts5("
+        "name, category, description, tokenize = 'unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute(
+        "INSERT INTO app_product_search (rowid, name, category, description) "
+        "SELECT p.id, p.name, c.name, p.description "
+        "FROM app_product p INNER JOIN app_category c ON c.id = p.category_id"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS app_product_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0008_cartitem_shoe_size'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
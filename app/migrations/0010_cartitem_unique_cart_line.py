@@ -0,0 +1,38 @@
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def merge_duplicate_lines(apps, schema_editor):
+    # Earlier read-modify-write adds could leave several rows for one line; fold them into the oldest
+    CartItem = apps.get_model('app', 'CartItem')
+    duplicates = (
+        CartItem.objects.values('cart_id', 'product_id', 'size_id', 'shoe_size_id')
+        .annotate(rows=models.Count('id'), total=Sum('quantity'), keep=models.Min('id'))
+        .filter(rows__gt=1)
+    )
+    for line in duplicates:
+        items = CartItem.objects.filter(
+            cart_id=line['cart_id'], product_id=line['product_id'],
+            size_id=line['size_id'], shoe_size_id=line['shoe_size_id']
+        )
+        items.filter(id=line['keep']).update(quantity=line['total'])
+        items.exclude(id=line['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0009_product_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_lines, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='cartitem',
+            constraint=models.UniqueConstraint(condition=models.Q(('shoe_size__isnull', True)), fields=('cart', 'product', 'size'), name='unique_cart_line_size'),
+        ),
+        migrations.AddConstraint(
+            model_name='cartitem',
+            constraint=models.UniqueConstraint(condition=models.Q(('size__isnull', True)), fields=('cart', 'product', 'shoe_size'), name='unique_cart_line_shoe_size'),
+        ),
+    ]
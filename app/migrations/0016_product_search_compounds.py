@@ -0,0 +1,47 @@
+from django.db import migrations
+
+
+SEARCH_COLUMNS = "name, category, description{}, tokenize = 'unicode61 remove_diacritics 2'"
+
+
+def recreate_search_index(apps, schema_editor, compounds):
+    # The index only holds derived data, so it is rebuilt with the new columns
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS app_product_search")
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE app_product_search USING fts5("
+        + SEARCH_COLUMNS.format(', compounds' if compounds else '') + ")"
+    )
+    if compounds:
+        schema_editor.execute(
+            "INSERT INTO app_product_search (rowid, name, category, description, compounds) "
+            "SELECT p.id, p.name, c.name, p.description, "
+            "nullif(replace(p.name || ' ' || c.name, '-', ''), p.name || ' ' || c.name) "
+            "FROM app_product p INNER JOIN app_category c ON c.id = p.category_id"
+        )
+    else:
+        schema_editor.execute(
+            "INSERT INTO app_product_search (rowid, name, category, description) "
+            "SELECT p.id, p.name, c.name, p.description "
+            "FROM app_product p INNER JOIN app_category c ON c.id = p.category_id"
+        )
+
+
+def add_compounds(apps, schema_editor):
+    recreate_search_index(apps, schema_editor, compounds=True)
+
+
+def remove_compounds(apps, schema_editor):
+    recreate_search_index(apps, schema_editor, compounds=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0015_sharedcounter'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_compounds, remove_compounds),
+    ]
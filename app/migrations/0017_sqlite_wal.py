@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def set_journal_mode(mode):
+    def apply(apps, schema_editor):
+        # Stored in the database file, so it is set once here rather than on every connection
+        if schema_editor.connection.vendor == 'sqlite':
+            schema_editor.execute(f'PRAGMA journal_mode = {mode}')
+    return apply
+
+
+class Migration(migrations.Migration):
+    # SQLite cannot change the journal mode inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('app', '0016_product_search_compounds'),
+    ]
+
+    operations = [
+        migrations.RunPython(set_journal_mode('WAL'), set_journal_mode('DELETE')),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-17 14:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0017_sqlite_wal'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSearch',
+            fields=[
+                ('product', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_entry', serialize=False, to='app.product')),
+            ],
+            options={
+                'db_table': 'app_product_search',
+                'managed': False,
+            },
+        ),
+    ]
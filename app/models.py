@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F, Sum
 from django.contrib.auth.models import AbstractUser
 from django.utils.text import slugify
 from django.core.exceptions import ValidationError
@@ -83,6 +84,8 @@ class Product(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     image = models.ImageField(upload_to='products/')
     description = models.TextField(blank=True)
+    # Drives sitemap <lastmod> and the feeds' Last-Modified header
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     
     # Many-to-many relationship for available sizes
     available_sizes = models.ManyToManyField(Size, blank=True, related_name='products')
@@ -158,7 +161,8 @@ class Profile(models.Model):
 
 class Cart(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, null=True, blank=True)
-    session_key = models.CharField(max_length=40, null=True, blank=True)
+    # Anonymous carts are found by session on every cart request
+    session_key = models.CharField(max_length=40, null=True, blank=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -168,11 +172,35 @@ class Cart(models.Model):
         else:
             return f"Cart for session {self.session_key}"
 
+    def _totals_aggregates(self):
+        return {
+            'total_items': Sum('quantity'),
+            'total_price': Sum(
+                F('quantity') * F('product__price'),
+                output_field=models.DecimalField(max_digits=12, decimal_places=2)
+            ),
+        }
+
+    def get_totals(self):
+        """Return the item count and price total of the cart from a single aggregate query"""
+        totals = self.items.aggregate(**self._totals_aggregates())
+        return {
+            'total_items': totals['total_items'] or 0,
+            'total_price': totals['total_price'] or 0,
+        }
+
+    async def aget_totals(self):
+        totals = await self.items.aaggregate(**self._totals_aggregates())
+        return {
+            'total_items': totals['total_items'] or 0,
+            'total_price': totals['total_price'] or 0,
+        }
+
     def get_total_items(self):
-        return sum(item.quantity for item in self.items.all())
+        return self.get_totals()['total_items']
 
     def get_total_price(self):
-        return sum(item.get_total_price() for item in self.items.all())
+        return self.get_totals()['total_price']
 
 
 class CartItem(models.Model):
@@ -183,6 +211,22 @@ class CartItem(models.Model):
     quantity = models.PositiveIntegerField(default=1)
     added_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # A line has either a clothing size or a shoe size; NULLs never collide
+        # in a unique index, so each kind gets its own partial constraint
+        constraints = [
+            models.UniqueConstraint(
+                fields=['cart', 'product', 'size'],
+                condition=models.Q(shoe_size__isnull=True),
+                name='unique_cart_line_size',
+            ),
+            models.UniqueConstraint(
+                fields=['cart', 'product', 'shoe_size'],
+                condition=models.Q(size__isnull=True),
+                name='unique_cart_line_shoe_size',
+            ),
+        ]
+
     def __str__(self):
         return f"{self.quantity} x {self.product.name}"
 
@@ -235,3 +279,100 @@ class CartItem(models.Model):
         elif self.size:
             return self.size.name
         return None
+
+
+class Stock(models.Model):
+    """Units of one product size that can still be put in a cart; products without rows are not tracked"""
+    product = models.ForeignKey(Product, related_name='stock', on_delete=models.CASCADE)
+    size = models.ForeignKey(Size, on_delete=models.CASCADE, null=True, blank=True)
+    shoe_size = models.ForeignKey(ShoeSize, on_delete=models.CASCADE, null=True, blank=True)
+    quantity = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['product', 'size'],
+                condition=models.Q(shoe_size__isnull=True),
+                name='unique_stock_size',
+            ),
+            models.UniqueConstraint(
+                fields=['product', 'shoe_size'],
+                condition=models.Q(size__isnull=True),
+                name='unique_stock_shoe_size',
+            ),
+        ]
+
+    def __str__(self):
+        size = self.shoe_size or self.size
+        return f"{self.product.name} ({size}): {self.quantity}"
+
+
+class StockReservation(models.Model):
+    """Units taken out of Stock for a cart; handed back in bulk once expires_at passes"""
+    stock = models.ForeignKey(Stock, related_name='reservations', on_delete=models.CASCADE)
+    cart = models.ForeignKey(Cart, related_name='reservations', on_delete=models.CASCADE)
+    quantity = models.PositiveIntegerField()
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['cart', 'stock'], name='unique_cart_reservation'),
+        ]
+
+    def __str__(self):
+        return f"{self.quantity} held for cart {self.cart_id} until {self.expires_at}"
+
+
+class Order(models.Model):
+    user = models.ForeignKey(CustomUser, related_name='orders', on_delete=models.SET_NULL, null=True, blank=True)
+    full_name = models.CharField(max_length=100)
+    phone = models.CharField(max_length=15)
+    email = models.EmailField()
+    address = models.TextField()
+    city = models.CharField(max_length=50)
+    state = models.CharField(max_length=50)
+    pincode = models.CharField(max_length=10)
+    payment_method = models.CharField(max_length=20)
+    total_items = models.PositiveIntegerField(default=0)
+    total_price = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Order #{self.pk} by {self.full_name}"
+
+
+class OrderLine(models.Model):
+    """A cart line frozen at checkout; name, size and price are copied so later catalog edits don't change the order"""
+    order = models.ForeignKey(Order, related_name='lines', on_delete=models.CASCADE)
+    product = models.ForeignKey(Product, on_delete=models.SET_NULL, null=True, blank=True)
+    product_name = models.CharField(max_length=200)
+    size_name = models.CharField(max_length=10, blank=True)
+    unit_price = models.DecimalField(max_digits=10, decimal_places=2)
+    quantity = models.PositiveIntegerField()
+
+    def __str__(self):
+        return f"{self.quantity} x {self.product_name}"
+
+    def get_total_price(self):
+        return self.unit_price * self.quantity
+
+
+class SharedCounter(models.Model):
+    """A named counter every worker process sees, such as the version stamp of a per-process cache"""
+    name = models.CharField(max_length=100, unique=True)
+    value = models.BigIntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} = {self.value}"
+
+
+class ProductSearch(models.Model):
+    """A product's row in the SQLite FTS5 search index, which app.search creates and keeps in sync"""
+    product = models.OneToOneField(
+        Product, on_delete=models.DO_NOTHING, primary_key=True, db_column='rowid', related_name='search_entry'
+    )
+
+    class Meta:
+        managed = False
+        db_table = 'app_product_search'
@@ -0,0 +1,95 @@
+from django.core.cache import cache
+
+from .counters import get_counter, increment_counter
+from .models import HeadCategory, Category
+
+
+# Shared counter bumped on every catalog tree change, so each worker notices it
+NAVIGATION_VERSION = 'navigation'
+NAVIGATION_TREE_KEY = 'navigation:tree:{version}'
+
+# (version, tree) pair kept in process memory so most renders only pay a cache lookup
+_local_tree = (None, None)
+
+
+def _category_node(category):
+    return {
+        'id': category.id,
+        'name': category.name,
+        'slug': category.slug,
+        'image': category.image.name if category.image else '',
+        'image_url': category.image.url if category.image else '',
+        'head_category_id': category.head_category_id,
+    }
+
+
+def build_navigation_tree():
+    """Query the catalog tree once and return it as plain, cacheable data"""
+    head_categories = []
+    for head_category in HeadCategory.objects.prefetch_related('categories').order_by('id'):
+        head_categories.append({
+            'id': head_category.id,
+            'name': head_category.name,
+            'slug': head_category.slug,
+            'image': head_category.image.name if head_category.image else '',
+            'image_url': head_category.image.url if head_category.image else '',
+            'categories': [
+                _category_node(category)
+                for category in sorted(head_category.categories.all(), key=lambda c: c.id)
+            ],
+        })
+
+    categories = [_category_node(category) for category in Category.objects.order_by('id')]
+
+    return {
+        'head_categories': head_categories,
+        'categories': categories,
+    }
+
+
+def get_navigation_version():
+    """Return the current navigation version stamp"""
+    return get_counter(NAVIGATION_VERSION)
+
+
+def get_navigation_tree():
+    """Return the navigation tree, rebuilding it only after an invalidation"""
+    global _local_tree
+
+    version = get_navigation_version()
+    local_version, local_tree = _local_tree
+    if local_version == version and local_tree is not None:
+        return local_tree
+
+    tree_key = NAVIGATION_TREE_KEY.format(version=version)
+    tree = cache.get(tree_key)
+    if tree is None:
+        tree = build_navigation_tree()
+        cache.set(tree_key, tree, timeout=None)
+
+    _local_tree = (version, tree)
+    return tree
+
+
+def get_head_category(name):
+    """Find a head category node in the navigation tree by name"""
+    for head_category in get_navigation_tree()['head_categories']:
+        if head_category['name'] == name:
+            return head_category
+    return None
+
+
+def get_category(name):
+    """Find a category node in the navigation tree by name"""
+    for category in get_navigation_tree()['categories']:
+        if category['name'] == name:
+            return category
+    return None
+
+
+def invalidate_navigation_tree(**kwargs):
+    """Bump the navigation version so every process rebuilds on its next request"""
+    global _local_tree
+
+    increment_counter(NAVIGATION_VERSION)
+    _local_tree = (None, None)
@@ -0,0 +1,98 @@
+import functools
+import hashlib
+from pathlib import Path
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+from .navigation import get_navigation_version
+
+
+PAGE_CACHE_KEY = 'page:{template_version}:{navigation_version}:{audience}:{url}'
+# Its own cache, so page bodies neither evict nor get evicted by anything else
+PAGE_CACHE_ALIAS = 'pages'
+PAGE_CACHE_TIMEOUT = 60 * 60 * 24
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / 'templates'
+
+
+def _hash_templates():
+    digest = hashlib.md5()
+    for path in sorted(TEMPLATE_DIR.rglob('*.html')):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+_cached_template_version = functools.lru_cache(maxsize=None)(_hash_templates)
+
+
+def get_template_version():
+    """Fingerprint of the app's templates; computed once per process outside DEBUG"""
+    if settings.DEBUG:
+        return _hash_templates()
+    return _cached_template_version()
+
+
+def _etag_matches(request, etag):
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+    return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+
+
+def _finalize(response, etag):
+    response['ETag'] = etag
+    # Clients must revalidate, which costs them a 304 at most
+    patch_cache_control(response, private=True, no_cache=True)
+    # The navbar differs for signed-in visitors
+    patch_vary_headers(response, ('Cookie',))
+    return response
+
+
+def _page_url(request, params):
+    """The path plus only the query parameters the page renders, in a fixed order"""
+    query = urlencode([(name, value) for name in sorted(params) for value in request.GET.getlist(name)])
+    return f'{request.path}?{query}' if query else request.path
+
+
+def cached_page(view=None, *, params=()):
+    """Cache a static page's rendered body and answer conditional GETs with 304.
+
+    Bodies are keyed by template and navigation version, so a deploy or a
+    catalog change invalidates them. Only the signed-in/anonymous state is
+    baked into the body; per-user data like the cart count is fetched by
+    the page's JavaScript. Query parameters outside `params` do not change
+    the body, so they share its entry.
+    """
+    if view is None:
+        return functools.partial(cached_page, params=params)
+
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return view(request, *args, **kwargs)
+
+        cache = caches[PAGE_CACHE_ALIAS]
+        key = PAGE_CACHE_KEY.format(
+            template_version=get_template_version(),
+            navigation_version=get_navigation_version(),
+            audience='user' if request.user.is_authenticated else 'anon',
+            url=hashlib.md5(_page_url(request, params).encode()).hexdigest()
+        )
+        cached = cache.get(key)
+        if cached is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200 or response.streaming:
+                return response
+            etag = '"%s"' % hashlib.md5(response.content).hexdigest()
+            cache.set(key, (etag, response.content, response['Content-Type']), PAGE_CACHE_TIMEOUT)
+        else:
+            etag, content, content_type = cached
+            response = HttpResponse(content, content_type=content_type)
+
+        if _etag_matches(request, etag):
+            return _finalize(HttpResponseNotModified(), etag)
+        return _finalize(response, etag)
+
+    return wrapper
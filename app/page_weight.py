@@ -0,0 +1,70 @@
+"""Per-page byte weight: the HTML plus the static CSS and JS it links to"""
+import gzip
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+from .benchmarks import ROUTE_REQUESTS, request_route
+
+try:
+    import brotli
+except ImportError:  # whitenoise only writes .br files when Brotli is installed
+    brotli = None
+
+
+STATIC_REFERENCE = re.compile(
+    r'<(?:link[^>]*\bhref|script[^>]*\bsrc)="' + re.escape('/' + settings.STATIC_URL.lstrip('/')) + r'([^"]+)"'
+)
+# collectstatic's content hash, e.g. home.5e5e7ce3909e.css
+HASHED_NAME = re.compile(r'\.[0-9a-f]{12}(\.\w+)$')
+
+
+def encoded_sizes(data):
+    """Raw, gzip and brotli sizes, the same encodings whitenoise precompresses"""
+    return {
+        'raw': len(data),
+        'gzip': len(gzip.compress(data, compresslevel=9)),
+        'br': len(brotli.compress(data)) if brotli else None,
+    }
+
+
+def linked_assets(html):
+    """Static paths a page links with <link href> or <script src>, in document order"""
+    paths = []
+    for path in STATIC_REFERENCE.findall(html.decode()):
+        path = HASHED_NAME.sub(r'\1', path)
+        if path not in paths:
+            paths.append(path)
+    return paths
+
+
+def read_asset(path):
+    found = finders.find(path)
+    if found is None:
+        raise FileNotFoundError(f"{path} is linked but no static finder has it")
+    with open(found, 'rb') as asset:
+        return asset.read()
+
+
+def page_weights(fixture, names=None):
+    """Weigh every HTML page in ROUTE_REQUESTS; returns {name: weights} and {asset path: sizes}"""
+    pages = {}
+    assets = {}
+    for name in names or ROUTE_REQUESTS:
+        method, _, _, _ = ROUTE_REQUESTS[name]
+        if method != 'get':
+            continue
+        response, html = request_route(name, fixture)
+        if response.status_code != 200 or not response.get('Content-Type', '').startswith('text/html'):
+            continue
+        linked = linked_assets(html)
+        contents = {path: read_asset(path) for path in linked}
+        for path, data in contents.items():
+            assets.setdefault(path, encoded_sizes(data))
+        pages[name] = {
+            'html': encoded_sizes(html),
+            'assets': linked,
+            'inline': encoded_sizes(html + b''.join(contents.values())),
+        }
+    return pages, assets
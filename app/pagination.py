@@ -0,0 +1,89 @@
+import math
+
+from django.db.models import Q
+from django.http import JsonResponse
+from django.shortcuts import render
+from django.template.loader import render_to_string
+
+
+PRODUCT_PAGE_SIZE = 24
+# Search results carry this annotation (app.search) and are paged best match first
+RANK = 'search_rank'
+
+
+def parse_cursor(request):
+    """Read the keyset cursor from the query string: the last product id shown, as 'rank_id' on ranked pages"""
+    rank, _, last_id = request.GET.get('cursor', '').rpartition('_')
+    try:
+        last_id = int(last_id)
+        rank = float(rank) if rank else None
+    except ValueError:
+        return None
+    if last_id <= 0 or (rank is not None and not math.isfinite(rank)):
+        return None
+    return last_id if rank is None else (rank, last_id)
+
+
+def keyset_page(queryset, cursor=None, page_size=PRODUCT_PAGE_SIZE):
+    """Return one page of a queryset, newest first, and the cursor for the next page.
+
+    Seeking with id < cursor keeps every page an index range scan of
+    page_size rows, however deep the visitor has scrolled. Ranked
+    querysets seek on (rank, -id) instead.
+    """
+    ranked = RANK in queryset.query.annotations
+    if ranked:
+        queryset = queryset.order_by(RANK, '-id')
+        if isinstance(cursor, tuple):
+            rank, last_id = cursor
+            queryset = queryset.filter(Q(**{f'{RANK}__gt': rank}) | Q(**{RANK: rank, 'id__lt': last_id}))
+    else:
+        queryset = queryset.order_by('-id')
+        if isinstance(cursor, int):
+            queryset = queryset.filter(id__lt=cursor)
+    items = list(queryset[:page_size + 1])
+    next_cursor = None
+    if len(items) > page_size:
+        last = items[page_size - 1]
+        # repr() round-trips the float exactly, so the next page starts right after it
+        next_cursor = f'{getattr(last, RANK)!r}_{last.id}' if ranked else last.id
+    return items[:page_size], next_cursor
+
+
+def _page_url(request, cursor, as_json=False):
+    params = request.GET.copy()
+    params['cursor'] = cursor
+    if as_json:
+        params['format'] = 'json'
+    else:
+        params.pop('format', None)
+    return f'{request.path}?{params.urlencode()}'
+
+
+def render_product_listing(request, template_name, cards_template, queryset, context=None,
+                           page_size=PRODUCT_PAGE_SIZE):
+    """Render a product listing page, or just its next batch of cards for infinite scroll"""
+    products, next_cursor = keyset_page(queryset, parse_cursor(request), page_size)
+
+    next_page_url = next_json_url = None
+    if next_cursor is not None:
+        next_page_url = _page_url(request, next_cursor)
+        next_json_url = _page_url(request, next_cursor, as_json=True)
+
+    if request.GET.get('format') == 'json':
+        return JsonResponse({
+            'html': render_to_string(cards_template, {'products': products}, request=request),
+            'count': len(products),
+            'next_cursor': next_cursor,
+            'next_url': next_json_url,
+            'next_page_url': next_page_url
+        })
+
+    context = dict(context or {})
+    context.update({
+        'products': products,
+        'cards_template': cards_template,
+        'next_page_url': next_page_url,
+        'next_json_url': next_json_url
+    })
+    return render(request, template_name, context)
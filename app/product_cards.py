@@ -0,0 +1,73 @@
+"""Per-card fragment cache for product listings, keyed by product id and updated_at.
+
+Template and catalog tree changes move every key, as in the page cache.
+"""
+from django.core.cache import caches
+from django.template import Context
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+
+from .images import MISSING_RENDITIONS_TIMEOUT, has_renditions
+from .navigation import get_navigation_version
+from .page_cache import get_template_version
+
+
+PRODUCT_CARD_KEY = 'card:{template_version}:{navigation_version}:{template}:{product_id}:{product_version}'
+PRODUCT_CARD_TIMEOUT = 60 * 60 * 24
+# Longer lists are not stored; they would only evict their own cards
+PRODUCT_CARD_LIST_LIMIT = 10000
+
+
+def product_card_key(template_name, product, template_version, navigation_version):
+    return PRODUCT_CARD_KEY.format(
+        template_version=template_version,
+        navigation_version=navigation_version,
+        template=template_name,
+        product_id=product.id,
+        product_version=product.updated_at.timestamp(),
+    )
+
+
+def _card_timeout(product):
+    """Cards rendered before their image renditions exist are redone once those may have appeared"""
+    if product.image and not has_renditions(product.image.name, product.image.storage):
+        return MISSING_RENDITIONS_TIMEOUT
+    return PRODUCT_CARD_TIMEOUT
+
+
+def _render_cards(products, template_name):
+    """Render the card template for each product in one bound context, as a for loop over it would"""
+    template = get_template(template_name).template
+    context = Context()
+    cards = []
+    with context.bind_template(template), context.render_context.push_state(template):
+        for product in products:
+            with context.push(product=product):
+                cards.append(template.nodelist.render(context))
+    return cards
+
+
+def render_product_cards(products, template_name):
+    """Render `template_name` once per product, with `product` in its context, reusing cached cards"""
+    products = list(products)
+    if len(products) > PRODUCT_CARD_LIST_LIMIT:
+        return mark_safe(''.join(_render_cards(products, template_name)))
+
+    cache = caches['product_cards']
+    template_version = get_template_version()
+    navigation_version = get_navigation_version()
+    keys = [
+        product_card_key(template_name, product, template_version, navigation_version)
+        for product in products
+    ]
+    cached = cache.get_many(keys)
+
+    missing = [(key, product) for key, product in zip(keys, products) if key not in cached]
+    if missing:
+        fresh = {}
+        for (key, product), card in zip(missing, _render_cards([product for _, product in missing], template_name)):
+            cached[key] = card
+            fresh.setdefault(_card_timeout(product), {})[key] = card
+        for timeout, cards in fresh.items():
+            cache.set_many(cards, timeout)
+    return mark_safe(''.join(cached[key] for key in keys))
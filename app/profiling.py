@@ -0,0 +1,209 @@
+"""Profile single staff requests on demand with ?_profile=cprofile|sample or an X-Profile header"""
+import cProfile
+import marshal
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connection
+
+from .counters import increment_counter
+from .models import SharedCounter
+
+
+# Runs allowed to start per minute across all processes
+PROFILE_RATE_LIMIT = 6
+PROFILE_RATE_COUNTER = 'profiling:{minute}'
+PROFILE_KEEP = 50
+PROFILE_SAMPLE_INTERVAL = 0.002
+PROFILE_PARAMETER = '_profile'
+PROFILE_HEADER = 'X-Profile'
+PROFILE_MODES = {'1': 'cprofile', 'cprofile': 'cprofile', 'sample': 'sample'}
+# Extension -> content type of every file a run can leave behind
+PROFILE_FILES = {
+    'prof': 'application/octet-stream',  # cProfile stats, for pstats or snakeviz
+    'collapsed': 'text/plain',  # sampled stacks, for flamegraph.pl or speedscope
+    'sql': 'text/plain',  # every query of the request with its time
+}
+
+_running = threading.Lock()
+
+
+def profiler_root():
+    return Path(settings.PROFILER_ROOT)
+
+
+def profile_path(profile_id, kind):
+    """Path of one file of a run, or None for a kind the profiler never writes"""
+    if kind not in PROFILE_FILES:
+        return None
+    return profiler_root() / f'{profile_id}.{kind}'
+
+
+def save_profile(profile_id, files):
+    """Write a run's files ({extension: bytes}) and drop runs beyond PROFILE_KEEP"""
+    root = profiler_root()
+    root.mkdir(parents=True, exist_ok=True)
+    for kind, data in files.items():
+        profile_path(profile_id, kind).write_bytes(data)
+
+    runs = {}
+    for path in root.iterdir():
+        if path.suffix[1:] in PROFILE_FILES:
+            runs.setdefault(path.stem, []).append(path)
+    # Ids start with a timestamp, so they sort oldest first
+    for stale in sorted(runs)[:-PROFILE_KEEP]:
+        for path in runs[stale]:
+            path.unlink(missing_ok=True)
+
+
+def _take_slot():
+    """Count a run against this minute's shared limit; False once it is used up"""
+    name = PROFILE_RATE_COUNTER.format(minute=int(time.time() // 60))
+    runs = increment_counter(name, initial=0)
+    if runs == 1:
+        # First run of the minute: earlier minutes' counters are done with
+        SharedCounter.objects.filter(name__startswith=PROFILE_RATE_COUNTER.format(minute='')).exclude(name=name).delete()
+    return runs <= PROFILE_RATE_LIMIT
+
+
+class QueryLog:
+    """connection.execute_wrapper hook keeping each statement, its parameters and its time"""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((time.perf_counter() - started, sql, params))
+
+    def render(self, request, elapsed):
+        total = sum(seconds for seconds, _, _ in self.queries)
+        lines = [
+            f'-- {request.method} {request.get_full_path()}',
+            f'-- {len(self.queries)} queries, {total * 1000:.2f} ms of {elapsed * 1000:.2f} ms',
+            '',
+        ]
+        for seconds, sql, params in self.queries:
+            lines += [f'-- {seconds * 1000:.3f} ms, params: {params!r}', f'{sql};', '']
+        return '\n'.join(lines).encode()
+
+
+class StackSampler(threading.Thread):
+    """Record the stack of one thread every `interval` seconds, as counts of collapsed stacks"""
+
+    def __init__(self, thread_id, interval=PROFILE_SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.done = threading.Event()
+
+    def run(self):
+        while not self.done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({code.co_filename}:{code.co_firstlineno})')
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    # Same interface as cProfile.Profile
+    enable = threading.Thread.start
+
+    def disable(self):
+        self.done.set()
+        self.join()
+
+    def collapsed(self):
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common()).encode()
+
+
+def requested_mode(request):
+    value = request.GET.get(PROFILE_PARAMETER) or request.headers.get(PROFILE_HEADER)
+    return PROFILE_MODES.get(value) if value else None
+
+
+class ProfilingMiddleware:
+    """Profile a staff request that asks for it; needs AuthenticationMiddleware before it.
+
+    At most PROFILE_RATE_LIMIT runs start per minute and one at a time per
+    process; other requests are served normally with an X-Profile-Skipped
+    header. Profilers follow one thread, so under ASGI the rest of the
+    chain runs from a worker thread, where the sync views then run too.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        mode = requested_mode(request)
+        if mode is None or not request.user.is_staff:
+            return self.get_response(request)
+        return self._run(request, mode, self.get_response)
+
+    async def __acall__(self, request):
+        mode = requested_mode(request)
+        if mode is None or not (await request.auser()).is_staff:
+            return await self.get_response(request)
+        return await sync_to_async(self._run)(request, mode, async_to_sync(self.get_response))
+
+    def _run(self, request, mode, get_response):
+        if not _running.acquire(blocking=False):
+            response = get_response(request)
+            response[f'{PROFILE_HEADER}-Skipped'] = 'another request is being profiled'
+            return response
+        try:
+            if not _take_slot():
+                response = get_response(request)
+                response[f'{PROFILE_HEADER}-Skipped'] = f'limit of {PROFILE_RATE_LIMIT} per minute reached'
+                return response
+            return self._profile(request, mode, get_response)
+        finally:
+            _running.release()
+
+    def _profile(self, request, mode, get_response):
+        profile_id = f'{time.strftime("%Y%m%d-%H%M%S")}-{secrets.token_hex(4)}'
+        queries = QueryLog()
+        if mode == 'cprofile':
+            profiler = cProfile.Profile()
+        else:
+            profiler = StackSampler(threading.get_ident())
+
+        started = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            profiler.enable()
+            try:
+                response = get_response(request)
+            finally:
+                profiler.disable()
+        elapsed = time.perf_counter() - started
+
+        files = {'sql': queries.render(request, elapsed)}
+        if mode == 'cprofile':
+            # What Profile.dump_stats() writes, without the temporary file
+            profiler.create_stats()
+            files['prof'] = marshal.dumps(profiler.stats)
+        else:
+            files['collapsed'] = profiler.collapsed()
+        save_profile(profile_id, files)
+        response[f'{PROFILE_HEADER}-Id'] = profile_id
+        return response
+
@@ -0,0 +1,106 @@
+"""Full-table-scan audit over the SQL every route runs, using SQLite's EXPLAIN QUERY PLAN.
+
+Used by the ``audit_indexes`` management command and by app/tests.py.
+"""
+import json
+import re
+
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from .benchmarks import ROUTE_REQUESTS, capture_route_queries
+
+
+# Scans that are the point of the query rather than a missing index
+EXPECTED_SCANS = {
+    ('search_suggestions', 'app_product'): "the suggestion index loads every product once per catalog version",
+    ('product_feed', 'app_product'): "the merchant feed exports the whole catalog, streamed in chunks",
+}
+# Whichever listing first needs facet counts after a catalog change rebuilds the facet index
+EXPECTED_SCANS.update({
+    (route, table): "the facet index loads every product and size link once per catalog version"
+    for route in ('AllProduct', 'category_products', 'search_products')
+    for table in ('app_product', 'app_product_available_sizes', 'app_product_available_shoe_sizes')
+})
+
+EXPLAINABLE = re.compile(r'\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b', re.IGNORECASE)
+SCAN = re.compile(r'^SCAN (?P<name>\w+)(?P<index> USING (?:COVERING )?INDEX \w+)?$')
+UNFILTERED_LIMIT = re.compile(r'^(?!.*\bWHERE\b).*\bLIMIT\b', re.IGNORECASE | re.DOTALL)
+TABLE_ALIAS = re.compile(r'\b(?:FROM|JOIN)\s+"?(\w+)"?(?:\s+(?:AS\s+)?"?(\w+)"?)?', re.IGNORECASE)
+
+
+def query_plan(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+        return [row[3] for row in cursor.fetchall()]
+
+
+def full_scans(sql):
+    """Return the tables a statement reads end to end, as (table, plan line) pairs.
+
+    An unfiltered scan in the table's natural order feeding a LIMIT stops
+    after LIMIT rows (the first keyset page walks the rowid backwards), so
+    it is not reported. With a WHERE clause the same scan may have to read
+    every row before it finds a match, e.g. .first() on an unindexed column.
+    FTS virtual tables are searched through their own index and never show.
+    """
+    plan = query_plan(sql)
+    sorted_in_temp = any('TEMP B-TREE' in line for line in plan)
+    if UNFILTERED_LIMIT.search(sql) and not sorted_in_temp:
+        return []
+    aliases = {}
+    for table, alias in TABLE_ALIAS.findall(sql):
+        aliases[table] = table
+        if alias:
+            aliases[alias] = table
+    scans = []
+    for line in plan:
+        match = SCAN.match(line)
+        if match:
+            scans.append((aliases.get(match['name'], match['name']), line))
+    return scans
+
+
+def table_sizes():
+    with connection.cursor() as cursor:
+        tables = connection.introspection.table_names(cursor)
+        sizes = {}
+        for table in tables:
+            cursor.execute(f'SELECT COUNT(*) FROM "{table}"')
+            sizes[table] = cursor.fetchone()[0]
+    return sizes
+
+
+def audit_routes(fixture, min_rows=0, names=None):
+    """Request every route, signed in and as an anonymous shopper with a cart, and list full scans.
+
+    Returns dicts with the route, table, plan line, SQL and whether the scan
+    is in EXPECTED_SCANS. Tables with fewer than min_rows rows are skipped.
+    """
+    anonymous = Client()
+    # A session cart, so anonymous requests exercise the session_key lookups
+    product, size = fixture['product'], fixture['size']
+    anonymous.post(reverse('add_to_cart'), json.dumps({'product_id': product.id, 'size_id': size.id}),
+                   content_type='application/json')
+
+    sizes = table_sizes()
+    findings = []
+    for name in names or ROUTE_REQUESTS:
+        statements = capture_route_queries(name, fixture) + capture_route_queries(name, fixture, anonymous)
+        seen = set()
+        for sql in statements:
+            if not EXPLAINABLE.match(sql):
+                continue
+            for table, line in full_scans(sql):
+                if sizes.get(table, min_rows) < min_rows or (table, sql) in seen:
+                    continue
+                seen.add((table, sql))
+                findings.append({
+                    'route': name,
+                    'table': table,
+                    'plan': line,
+                    'sql': sql,
+                    'expected': (name, table) in EXPECTED_SCANS,
+                })
+    return findings
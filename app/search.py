@@ -0,0 +1,107 @@
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Replace
+
+from .models import Product
+
+
+SEARCH_TABLE = 'app_product_search'
+
+# The indexed columns of every product; `compounds` repeats hyphenated names
+# without their hyphens (NULL when there are none), so 'tshirt' finds 'T-Shirt'
+SEARCH_ROWS = (
+    "SELECT p.id, p.name, c.name, p.description, "
+    "nullif(replace(p.name || ' ' || c.name, '-', ''), p.name || ' ' || c.name) "
+    "FROM app_product p INNER JOIN app_category c ON c.id = p.category_id"
+)
+SEARCH_INSERT = f'INSERT INTO {SEARCH_TABLE} (rowid, name, category, description, compounds) {SEARCH_ROWS}'
+
+# bm25 column weights: name matches rank above category, category above description;
+# compounds are names too. Lower is better.
+SEARCH_RANK = f'bm25({SEARCH_TABLE}, 10.0, 5.0, 1.0, 10.0)'
+
+
+def search_index_enabled():
+    """The FTS5 index only exists on SQLite; other backends use the ORM fallback"""
+    return connection.vendor == 'sqlite'
+
+
+def normalize_query(query):
+    """Fold case and treat hyphens/punctuation as word breaks, e.g. 'Air-Max' -> ['air', 'max']"""
+    return re.findall(r'\w+', query.lower())
+
+
+def build_match_expression(tokens):
+    """Turn normalized tokens into an FTS5 MATCH expression where every token is a prefix"""
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def search_products_queryset(query):
+    """Return products matching every token of the query, annotated with their search_rank.
+
+    Listings page ranked querysets best match first (pagination.keyset_page);
+    the ORM fallback has no rank and is paged newest first.
+    """
+    tokens = normalize_query(query)
+    if not tokens:
+        return Product.objects.none()
+
+    products = Product.objects.select_related('category')
+    if not search_index_enabled():
+        products = products.annotate(compound_name=Replace('name', Value('-'), Value('')))
+        conditions = Q()
+        for token in tokens:
+            conditions &= (
+                Q(name__icontains=token) |
+                Q(compound_name__icontains=token) |
+                Q(category__name__icontains=token) |
+                Q(description__icontains=token)
+            )
+        return products.filter(conditions).order_by('-id')
+
+    # Joined rather than an id IN (...) subquery, as bm25() only ranks the rows of its own MATCH
+    matches = RawSQL(f'{SEARCH_TABLE} MATCH %s', [build_match_expression(tokens)], output_field=BooleanField())
+    return products.filter(search_entry__isnull=False).filter(matches).annotate(
+        search_rank=RawSQL(SEARCH_RANK, [], output_field=FloatField())
+    ).order_by('search_rank', '-id')
+
+
+def index_product(product):
+    """Insert or refresh a product's row in the search index"""
+    if not search_index_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [product.id])
+        cursor.execute(f'{SEARCH_INSERT} WHERE p.id = %s', [product.id])
+
+
+def unindex_product(product_id):
+    """Remove a product from the search index"""
+    if not search_index_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [product_id])
+
+
+def reindex_category(category):
+    """Refresh the indexed category name of every product in a category"""
+    if not search_index_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE rowid IN (SELECT id FROM app_product WHERE category_id = %s)',
+            [category.id]
+        )
+        cursor.execute(f'{SEARCH_INSERT} WHERE p.category_id = %s', [category.id])
+
+
+def rebuild_search_index():
+    """Repopulate the whole search index from the product table"""
+    if not search_index_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+        cursor.execute(SEARCH_INSERT)
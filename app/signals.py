@@ -0,0 +1,149 @@
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import m2m_changed, pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .background import rebuild_in_background
+from .counters import increment_counter
+from .facets import facet_index
+from .feeds import FEED_CHANGES
+from .images import generate_renditions, delete_renditions
+from .metrics import time_query
+from .models import HeadCategory, Category, Product, ProductImage
+from .navigation import invalidate_navigation_tree
+from .search import index_product, unindex_product, reindex_category
+from .suggestions import suggestion_index
+
+logger = logging.getLogger(__name__)
+
+# Models whose image field gets responsive renditions
+IMAGE_MODELS = (HeadCategory, Category, Product, ProductImage)
+
+
+@receiver(connection_created)
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """Apply settings.SQLITE_PRAGMAS once per connection; persistent connections keep them"""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+            cursor.execute(f'PRAGMA {pragma} = {value}')
+
+
+@receiver(connection_created)
+def install_query_timer(sender, connection, **kwargs):
+    """Let sampled requests time their queries on whichever thread's connection runs them"""
+    # The wrapper list outlives reconnects of the same connection object
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_query)
+
+
+@receiver(post_save, sender=HeadCategory)
+@receiver(post_delete, sender=HeadCategory)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def catalog_tree_changed(sender, **kwargs):
+    """Drop the cached navigation tree whenever a head category or category changes"""
+    invalidate_navigation_tree()
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=HeadCategory)
+@receiver(post_delete, sender=HeadCategory)
+@receiver(m2m_changed, sender=Product.available_sizes.through)
+@receiver(m2m_changed, sender=Product.available_shoe_sizes.through)
+def facets_changed(sender, **kwargs):
+    """Recount listing facets after any change to a product's price, sizes or category"""
+    # m2m_changed also fires pre_add/pre_remove/pre_clear before the rows change
+    if kwargs.get('action', 'post_').startswith('post_'):
+        facet_index.invalidate()
+
+
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def feeds_changed(sender, **kwargs):
+    """Move the feeds' Last-Modified for changes no product's updated_at records"""
+    increment_counter(FEED_CHANGES)
+
+
+@receiver(post_save, sender=Product)
+def product_saved(sender, instance, **kwargs):
+    """Keep the product search and suggestion indexes in sync with product edits"""
+    index_product(instance)
+    suggestion_index.update_product(instance)
+
+
+@receiver(post_delete, sender=Product)
+def product_deleted(sender, instance, **kwargs):
+    unindex_product(instance.id)
+    suggestion_index.remove_product(instance.id)
+
+
+@receiver(post_save, sender=Category)
+def category_saved(sender, instance, created, **kwargs):
+    if not created:
+        reindex_category(instance)
+        suggestion_index.rename_category(instance)
+
+
+@receiver(pre_save, sender=HeadCategory)
+@receiver(pre_save, sender=Category)
+@receiver(pre_save, sender=Product)
+@receiver(pre_save, sender=ProductImage)
+def image_saving(sender, instance, **kwargs):
+    """Remember the stored image a save may replace, so image_saved only acts on a change"""
+    previous = None
+    if instance.pk is not None:
+        previous = sender.objects.filter(pk=instance.pk).values_list('image', flat=True).first()
+    instance._previous_image = previous or ''
+
+
+@receiver(post_save, sender=HeadCategory)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=ProductImage)
+def image_saved(sender, instance, **kwargs):
+    """After commit, build a new image's renditions in the background and drop the replaced one's"""
+    image = instance.image
+    previous = getattr(instance, '_previous_image', '')
+    if (image.name or '') == previous:
+        return
+    if previous:
+        transaction.on_commit(lambda: drop_renditions(previous, image.storage))
+    if image:
+        transaction.on_commit(
+            lambda: rebuild_in_background(f'renditions:{image.name}', lambda: build_renditions(image))
+        )
+
+
+@receiver(post_delete, sender=HeadCategory)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Product)
+@receiver(post_delete, sender=ProductImage)
+def image_deleted(sender, instance, **kwargs):
+    if instance.image:
+        name, storage = instance.image.name, instance.image.storage
+        transaction.on_commit(lambda: drop_renditions(name, storage))
+
+
+def drop_renditions(name, storage):
+    """Delete an image's renditions unless another row still shows it, as imports may share files"""
+    for model in IMAGE_MODELS:
+        if model.objects.filter(image=name).exists():
+            return
+    delete_renditions(name, storage)
+
+
+def build_renditions(image):
+    try:
+        generate_renditions(image)
+    except Exception:
+        # A bad upload must not break the save; templates fall back to the original
+        logger.exception("Could not generate renditions for %s", image.name)
@@ -0,0 +1,153 @@
+// ==================== Modal Functions ====================
+const modal = document.getElementById('productModal');
+const closeBtn = document.getElementById('closeModal');
+const productGrid = document.querySelector('.product-grid-row');
+let currentProductId = null;
+
+// Open modal function
+function openModal(card) {
+  const productId = card.getAttribute('data-product-id');
+  const productName = card.getAttribute('data-product-name');
+  const productCategory = card.getAttribute('data-product-category');
+  const productPrice = card.getAttribute('data-product-price');
+  const productDescription = card.getAttribute('data-product-description');
+  const productImage = card.querySelector('.product-image').src;
+
+  currentProductId = productId;
+
+  document.getElementById('modalImage').src = productImage;
+  document.getElementById('modalImage').alt = productName;
+  document.getElementById('modalCategory').textContent = productCategory;
+  document.getElementById('modalName').textContent = productName;
+  document.getElementById('modalDescription').textContent = productDescription;
+  document.getElementById('modalPrice').textContent = `Rs. ${productPrice}`;
+
+  modal.classList.add('active');
+  document.body.style.overflow = 'hidden';
+}
+
+// Close modal function
+function closeModal() {
+  modal.classList.remove('active');
+  document.body.style.overflow = 'auto';
+}
+
+// Event listeners for product cards, delegated so infinite-scroll cards work too
+productGrid.addEventListener('click', function(e) {
+  const card = e.target.closest('.dripspace-product-card');
+  // Don't open modal if clicking on wishlist button
+  if (card && !e.target.closest('.wishlist-btn')) {
+    openModal(card);
+  }
+});
+
+// Close modal when clicking close button
+closeBtn.addEventListener('click', closeModal);
+
+// Close modal when clicking outside content
+modal.addEventListener('click', function(e) {
+  if (e.target === modal) {
+    closeModal();
+  }
+});
+
+// Close modal with Escape key
+document.addEventListener('keydown', function(e) {
+  if (e.key === 'Escape' && modal.classList.contains('active')) {
+    closeModal();
+  }
+});
+
+// ==================== Wishlist Functionality ====================
+productGrid.addEventListener('click', function(e) {
+  const button = e.target.closest('.wishlist-btn');
+  if (!button) {
+    return;
+  }
+
+  button.classList.toggle('active');
+
+  const productId = button.getAttribute('data-product-id');
+  const isActive = button.classList.contains('active');
+
+  // Here you would typically make an AJAX call to update the wishlist
+  console.log(`Product ${productId} ${isActive ? 'added to' : 'removed from'} wishlist`);
+
+  // Show visual feedback
+  const feedback = document.createElement('div');
+  feedback.textContent = isActive ? 'Added to wishlist' : 'Removed from wishlist';
+  feedback.style.cssText = `
+    position: fixed;
+    top: 20px;
+    right: 20px;
+    background: #1a1a1a;
+    color: white;
+    padding: 12px 20px;
+    border-radius: 4px;
+    font-size: 14px;
+    z-index: 10000;
+    animation: fadeInOut 3s ease;
+  `;
+
+  document.body.appendChild(feedback);
+
+  setTimeout(() => {
+    if (feedback.parentNode) {
+      feedback.parentNode.removeChild(feedback);
+    }
+  }, 3000);
+});
+
+// ==================== Add to Cart Functionality ====================
+document.getElementById('modalAddToCart').addEventListener('click', function() {
+  if (currentProductId) {
+    // Here you would typically make an AJAX call to add to cart
+    console.log(`Adding product ${currentProductId} to cart`);
+
+    // Show confirmation
+    const confirmation = document.createElement('div');
+    confirmation.textContent = 'Product added to cart';
+    confirmation.style.cssText = `
+      position: fixed;
+      top: 20px;
+      right: 20px;
+      background: #4CAF50;
+      color: white;
+      padding: 12px 20px;
+      border-radius: 4px;
+      font-size: 14px;
+      z-index: 10000;
+      animation: fadeInOut 3s ease;
+    `;
+
+    document.body.appendChild(confirmation);
+
+    setTimeout(() => {
+      if (confirmation.parentNode) {
+        confirmation.parentNode.removeChild(confirmation);
+      }
+    }, 3000);
+
+    closeModal();
+  }
+});
+
+// ==================== Buy Now Functionality ====================
+document.getElementById('modalBuyNow').addEventListener('click', function() {
+  if (currentProductId) {
+    // Redirect to product detail page or checkout
+    window.location.href = `/product/${currentProductId}/`;
+  }
+});
+
+// ==================== Animations ====================
+const style = document.createElement('style');
+style.textContent = `
+  @keyframes fadeInOut {
+    0% { opacity: 0; transform: translateY(-20px); }
+    10% { opacity: 1; transform: translateY(0); }
+    90% { opacity: 1; transform: translateY(0); }
+    100% { opacity: 0; transform: translateY(-20px); }
+  }
+`;
+document.head.appendChild(style);
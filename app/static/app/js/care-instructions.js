@@ -0,0 +1,187 @@
+// Accordion functionality for Men's Clothing Care Instructions
+document.addEventListener('DOMContentLoaded', function() {
+    // Get all accordion toggle buttons
+    const accordionButtons = document.querySelectorAll('.accordion-toggle-btn');
+
+    // Add click event listener to each button
+    accordionButtons.forEach(button => {
+        button.addEventListener('click', function() {
+            // Get the parent category and the content panel
+            const category = this.closest('.mens-care-category');
+            const content = this.nextElementSibling;
+            const isActive = category.classList.contains('active');
+
+            // Toggle current accordion
+            if (isActive) {
+                closeAccordion(category, this, content);
+            } else {
+                openAccordion(category, this, content);
+            }
+        });
+    });
+
+    // Function to open accordion
+    function openAccordion(category, button, content) {
+        // Add active class to category
+        category.classList.add('active');
+
+        // Update ARIA attributes
+        button.setAttribute('aria-expanded', 'true');
+
+        // Animate content expansion
+        content.style.maxHeight = content.scrollHeight + 'px';
+        content.style.opacity = '1';
+
+        // Add subtle animation to instruction cards
+        const instructionCards = content.querySelectorAll('.care-instruction-card');
+        instructionCards.forEach((card, index) => {
+            card.style.opacity = '0';
+            card.style.transform = 'translateY(10px)';
+
+            setTimeout(() => {
+                card.style.transition = 'opacity 300ms ease-out, transform 300ms ease-out';
+                card.style.opacity = '1';
+                card.style.transform = 'translateY(0)';
+            }, index * 100);
+        });
+    }
+
+    // Function to close accordion
+    function closeAccordion(category, button, content) {
+        // Remove active class from category
+        category.classList.remove('active');
+
+        // Update ARIA attributes
+        button.setAttribute('aria-expanded', 'false');
+
+        // Animate content collapse
+        content.style.maxHeight = '0px';
+        content.style.opacity = '0';
+    }
+
+    // Close accordion when clicking outside
+    document.addEventListener('click', function(event) {
+        if (!event.target.closest('.mens-care-category')) {
+            const activeCategories = document.querySelectorAll('.mens-care-category.active');
+            activeCategories.forEach(category => {
+                const button = category.querySelector('.accordion-toggle-btn');
+                const content = button.nextElementSibling;
+                closeAccordion(category, button, content);
+            });
+        }
+    });
+
+    // Keyboard navigation support
+    accordionButtons.forEach(button => {
+        button.addEventListener('keydown', function(event) {
+            // Handle Enter and Space key presses
+            if (event.key === 'Enter' || event.key === ' ') {
+                event.preventDefault();
+                this.click();
+            }
+
+            // Handle Arrow key navigation
+            if (event.key === 'ArrowDown' || event.key === 'ArrowUp') {
+                event.preventDefault();
+                const currentIndex = Array.from(accordionButtons).indexOf(this);
+                let nextIndex;
+
+                if (event.key === 'ArrowDown') {
+                    nextIndex = (currentIndex + 1) % accordionButtons.length;
+                } else {
+                    nextIndex = (currentIndex - 1 + accordionButtons.length) % accordionButtons.length;
+                }
+
+                accordionButtons[nextIndex].focus();
+            }
+        });
+    });
+
+    // Handle window resize to recalculate content height
+    window.addEventListener('resize', function() {
+        const activeCategories = document.querySelectorAll('.mens-care-category.active');
+        activeCategories.forEach(category => {
+            const content = category.querySelector('.accordion-content');
+            if (content) {
+                content.style.maxHeight = content.scrollHeight + 'px';
+            }
+        });
+    });
+
+    // Initialize all accordions in closed state
+    const allCategories = document.querySelectorAll('.mens-care-category');
+    allCategories.forEach(category => {
+        const button = category.querySelector('.accordion-toggle-btn');
+        const content = category.querySelector('.accordion-content');
+
+        if (button && content) {
+            button.setAttribute('aria-expanded', 'false');
+            content.style.maxHeight = '0px';
+            content.style.opacity = '0';
+        }
+    });
+
+    // Add subtle scroll-in animation for tips on page load
+    const observerOptions = {
+        threshold: 0.1,
+        rootMargin: '0px 0px -50px 0px'
+    };
+
+    const tipObserver = new IntersectionObserver(function(entries) {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                const tipCards = entry.target.querySelectorAll('.tip-card');
+                tipCards.forEach((card, index) => {
+                    card.style.opacity = '0';
+                    card.style.transform = 'translateY(20px)';
+
+                    setTimeout(() => {
+                        card.style.transition = 'opacity 500ms ease-out, transform 500ms ease-out';
+                        card.style.opacity = '1';
+                        card.style.transform = 'translateY(0)';
+                    }, index * 150);
+                });
+
+                tipObserver.unobserve(entry.target);
+            }
+        });
+    }, observerOptions);
+
+    // Observe the general tips section
+    const generalTipsSection = document.querySelector('.general-care-tips');
+    if (generalTipsSection) {
+        tipObserver.observe(generalTipsSection);
+    }
+
+    // Add print functionality - expand all accordions before printing
+    window.addEventListener('beforeprint', function() {
+        const allCategories = document.querySelectorAll('.mens-care-category');
+        allCategories.forEach(category => {
+            const button = category.querySelector('.accordion-toggle-btn');
+            const content = category.querySelector('.accordion-content');
+
+            if (button && content) {
+                category.classList.add('active');
+                button.setAttribute('aria-expanded', 'true');
+                content.style.maxHeight = 'none';
+                content.style.opacity = '1';
+            }
+        });
+    });
+
+    // Close all accordions after printing
+    window.addEventListener('afterprint', function() {
+        const allCategories = document.querySelectorAll('.mens-care-category');
+        allCategories.forEach(category => {
+            const button = category.querySelector('.accordion-toggle-btn');
+            const content = category.querySelector('.accordion-content');
+
+            if (button && content) {
+                category.classList.remove('active');
+                button.setAttribute('aria-expanded', 'false');
+                content.style.maxHeight = '0px';
+                content.style.opacity = '0';
+            }
+        });
+    });
+});
@@ -0,0 +1,257 @@
+/* ==========================================
+   DripSpace Checkout - JavaScript Logic
+   ========================================== */
+
+document.addEventListener('DOMContentLoaded', function() {
+  // Initialize all functionality
+  initPaymentMethodToggle();
+  initCardFormatting();
+  initPincodeValidation();
+
+  // Add form submission handler
+  const form = document.getElementById('dsAddressForm');
+  const buyNowBtn = document.querySelector('.ds-buy-now-btn');
+
+  if (form && buyNowBtn) {
+    form.addEventListener('submit', function(e) {
+      e.preventDefault();
+
+      // Create FormData object
+      const formData = new FormData(form);
+
+      // Debug: Log all form data
+      console.log('Form Data:');
+      for (let [key, value] of formData.entries()) {
+        console.log(key, value);
+      }
+
+      // Ensure payment method is included
+      const selectedPayment = document.querySelector('input[name="paymentMethod"]:checked');
+      if (selectedPayment) {
+        formData.set('paymentMethod', selectedPayment.value);
+        console.log('Payment method:', selectedPayment.value);
+      } else {
+        console.log('No payment method selected');
+      }
+
+      // Ensure state is selected
+      const stateSelect = document.getElementById('state');
+      if (stateSelect && stateSelect.value === '') {
+        // If no state is selected, don't include it in the form data
+        // This will allow the backend to handle it properly
+        console.log('No state selected');
+        // Remove the state field from formData if it's empty
+        if (formData.has('state') && formData.get('state') === '') {
+          formData.delete('state');
+        }
+      }
+
+      // Debug: Log all form data after modifications
+      console.log('Form Data after modifications:');
+      for (let [key, value] of formData.entries()) {
+        console.log(key, value);
+      }
+
+      // Send AJAX request
+      fetch(form.action, {
+        method: 'POST',
+        body: formData,
+        headers: {
+          'X-CSRFToken': document.querySelector('[name=csrfmiddlewaretoken]').value
+        }
+      })
+      .then(response => response.json())
+      .then(data => {
+        if (data.success) {
+          // Redirect to payment done page
+          window.location.href = data.redirect_url;
+        } else {
+          // Show error message
+          alert(data.message);
+        }
+      })
+      .catch(error => {
+        console.error('Error:', error);
+        alert('An error occurred while processing your order. Please try again.');
+      });
+    });
+  }
+
+  // Form validation will happen on submit
+});
+
+/* ==========================================
+   Payment Method Toggle
+   ========================================== */
+function initPaymentMethodToggle() {
+  const paymentRadios = document.querySelectorAll('.ds-payment-radio');
+  const cardInputs = document.getElementById('cardInputs');
+  const upiInput = document.getElementById('upiInput');
+
+  if (!paymentRadios.length) return;
+
+  paymentRadios.forEach(radio => {
+    radio.addEventListener('change', function() {
+      const value = this.value;
+
+      // Hide all conditional inputs first
+      if (cardInputs) cardInputs.style.display = 'none';
+      if (upiInput) upiInput.style.display = 'none';
+
+      // Show relevant inputs based on selection
+      if (value === 'credit-card' || value === 'debit-card') {
+        if (cardInputs) cardInputs.style.display = 'block';
+      } else if (value === 'upi') {
+        if (upiInput) upiInput.style.display = 'block';
+      }
+    });
+  });
+
+  // Trigger initial state for default selection
+  const defaultSelected = document.querySelector('.ds-payment-radio:checked');
+  if (defaultSelected) {
+    defaultSelected.dispatchEvent(new Event('change'));
+  }
+}
+
+/* ==========================================
+   Card Number Formatting
+   ========================================== */
+function initCardFormatting() {
+  const cardNumber = document.getElementById('cardNumber');
+  const expiry = document.getElementById('expiry');
+  const cvv = document.getElementById('cvv');
+
+  if (cardNumber) {
+    // Format card number (add spaces every 4 digits)
+    cardNumber.addEventListener('input', function(e) {
+      let value = e.target.value.replace(/\s/g, '');
+      value = value.replace(/\D/g, ''); // Only digits
+
+      // Add space every 4 digits
+      let formatted = value.match(/.{1,4}/g)?.join(' ') || value;
+      e.target.value = formatted;
+    });
+
+    // Prevent non-numeric input for card number
+    cardNumber.addEventListener('keypress', function(e) {
+      // Allow: backspace, delete, tab, escape, enter
+      if ([8, 9, 27, 13].indexOf(e.keyCode) !== -1 ||
+          // Allow: Ctrl+A, Command+A
+          (e.keyCode === 65 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+C, Command+C
+          (e.keyCode === 67 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+V, Command+V
+          (e.keyCode === 86 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+X, Command+X
+          (e.keyCode === 88 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: home, end, left, right
+          (e.keyCode >= 35 && e.keyCode <= 39)) {
+        return;  // let it happen, don't do anything
+      }
+      // Ensure that it is a number and stop the keypress
+      if ((e.shiftKey || (e.keyCode < 48 || e.keyCode > 57)) && (e.keyCode < 96 || e.keyCode > 105)) {
+        e.preventDefault();
+      }
+    });
+  }
+
+  if (expiry) {
+    // Format expiry date (MM/YY)
+    expiry.addEventListener('input', function(e) {
+      let value = e.target.value.replace(/\D/g, '');
+
+      if (value.length >= 2) {
+        value = value.slice(0, 2) + '/' + value.slice(2, 4);
+      }
+
+      e.target.value = value;
+    });
+
+    // Prevent non-numeric input for expiry
+    expiry.addEventListener('keypress', function(e) {
+      // Allow: backspace, delete, tab, escape, enter
+      if ([8, 9, 27, 13].indexOf(e.keyCode) !== -1 ||
+          // Allow: Ctrl+A, Command+A
+          (e.keyCode === 65 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+C, Command+C
+          (e.keyCode === 67 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+V, Command+V
+          (e.keyCode === 86 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+X, Command+X
+          (e.keyCode === 88 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: home, end, left, right
+          (e.keyCode >= 35 && e.keyCode <= 39)) {
+        return;  // let it happen, don't do anything
+      }
+      // Ensure that it is a number and stop the keypress
+      if ((e.shiftKey || (e.keyCode < 48 || e.keyCode > 57)) && (e.keyCode < 96 || e.keyCode > 105)) {
+        e.preventDefault();
+      }
+    });
+  }
+
+  if (cvv) {
+    // CVV - only digits
+    cvv.addEventListener('input', function(e) {
+      e.target.value = e.target.value.replace(/\D/g, '');
+    });
+
+    // Prevent non-numeric input for CVV
+    cvv.addEventListener('keypress', function(e) {
+      // Allow: backspace, delete, tab, escape, enter
+      if ([8, 9, 27, 13].indexOf(e.keyCode) !== -1 ||
+          // Allow: Ctrl+A, Command+A
+          (e.keyCode === 65 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+C, Command+C
+          (e.keyCode === 67 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+V, Command+V
+          (e.keyCode === 86 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+X, Command+X
+          (e.keyCode === 88 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: home, end, left, right
+          (e.keyCode >= 35 && e.keyCode <= 39)) {
+        return;  // let it happen, don't do anything
+      }
+      // Ensure that it is a number and stop the keypress
+      if ((e.shiftKey || (e.keyCode < 48 || e.keyCode > 57)) && (e.keyCode < 96 || e.keyCode > 105)) {
+        e.preventDefault();
+      }
+    });
+  }
+}
+
+/* ==========================================
+   Pincode Validation (numeric only)
+   ========================================== */
+function initPincodeValidation() {
+  const pincode = document.getElementById('pincode');
+
+  if (pincode) {
+    pincode.addEventListener('input', function(e) {
+      e.target.value = e.target.value.replace(/\D/g, '');
+    });
+
+    // Prevent non-numeric input for pincode
+    pincode.addEventListener('keypress', function(e) {
+      // Allow: backspace, delete, tab, escape, enter
+      if ([8, 9, 27, 13].indexOf(e.keyCode) !== -1 ||
+          // Allow: Ctrl+A, Command+A
+          (e.keyCode === 65 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+C, Command+C
+          (e.keyCode === 67 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+V, Command+V
+          (e.keyCode === 86 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: Ctrl+X, Command+X
+          (e.keyCode === 88 && (e.ctrlKey === true || e.metaKey === true)) ||
+          // Allow: home, end, left, right
+          (e.keyCode >= 35 && e.keyCode <= 39)) {
+        return;  // let it happen, don't do anything
+      }
+      // Ensure that it is a number and stop the keypress
+      if ((e.shiftKey || (e.keyCode < 48 || e.keyCode > 57)) && (e.keyCode < 96 || e.keyCode > 105)) {
+        e.preventDefault();
+      }
+    });
+  }
+}
@@ -0,0 +1,41 @@
+// ===== FAQ Toggle Functionality =====
+document.addEventListener('DOMContentLoaded', function() {
+  // Select all FAQ question buttons
+  const faqQuestions = document.querySelectorAll('.faq-question-item');
+
+  // Add click event listener to each question
+  faqQuestions.forEach(question => {
+    question.addEventListener('click', function() {
+      // Get the parent card block
+      const cardBlock = this.closest('.faq-card-block');
+      const answerPanel = cardBlock.querySelector('.faq-answer-panel');
+      const isExpanded = this.getAttribute('aria-expanded') === 'true';
+
+      // Close all other FAQs (optional - remove if you want multiple FAQs open)
+      faqQuestions.forEach(otherQuestion => {
+        if (otherQuestion !== this) {
+          otherQuestion.setAttribute('aria-expanded', 'false');
+          const otherPanel = otherQuestion.closest('.faq-card-block').querySelector('.faq-answer-panel');
+          otherPanel.classList.remove('active');
+        }
+      });
+
+      // Toggle current FAQ
+      if (isExpanded) {
+        this.setAttribute('aria-expanded', 'false');
+        answerPanel.classList.remove('active');
+      } else {
+        this.setAttribute('aria-expanded', 'true');
+        answerPanel.classList.add('active');
+      }
+    });
+
+    // Add keyboard support
+    question.addEventListener('keydown', function(e) {
+      if (e.key === 'Enter' || e.key === ' ') {
+        e.preventDefault();
+        this.click();
+      }
+    });
+  });
+});
@@ -0,0 +1,78 @@
+(function() {
+    // Newsletter form handling
+    const newsletterForm = document.querySelector('.dripspaceNavbar-newsletterForm');
+    const newsletterInput = document.querySelector('.dripspaceNavbar-newsletterInput');
+    const newsletterButton = document.querySelector('.dripspaceNavbar-newsletterButton');
+
+    if (newsletterForm) {
+        newsletterForm.addEventListener('submit', function(e) {
+            e.preventDefault();
+
+            const email = newsletterInput.value.trim();
+            if (email) {
+                // Simulate form submission
+                const originalText = newsletterButton.textContent;
+                newsletterButton.textContent = 'Subscribed!';
+                newsletterButton.style.background = '#22c55e';
+
+                setTimeout(() => {
+                    newsletterButton.textContent = originalText;
+                    newsletterButton.style.background = '';
+                    newsletterInput.value = '';
+                }, 2000);
+
+                // Here you would typically send the email to your backend
+                console.log('Newsletter subscription:', email);
+            }
+        });
+    }
+
+    // Social icon interactions
+    const socialIcons = document.querySelectorAll('.dripspaceNavbar-socialIcon');
+    socialIcons.forEach(icon => {
+        icon.addEventListener('click', function() {
+            const title = this.getAttribute('title');
+            console.log('Social media clicked:', title);
+            // Here you would typically open the social media link
+        });
+    });
+
+    // Smooth scroll for footer links
+    document.querySelectorAll('.dripspaceNavbar-footerLink').forEach(link => {
+        link.addEventListener('click', function(e) {
+            const href = this.getAttribute('href');
+            if (href && href.startsWith('#')) {
+                e.preventDefault();
+                const target = document.querySelector(href);
+                if (target) {
+                    target.scrollIntoView({
+                        behavior: 'smooth',
+                        block: 'start'
+                    });
+                }
+            }
+        });
+    });
+
+    // Intersection Observer for animations (optional enhancement)
+    if ('IntersectionObserver' in window) {
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    entry.target.style.opacity = '1';
+                    entry.target.style.transform = 'translateY(0)';
+                }
+            });
+        }, {
+            threshold: 0.1
+        });
+
+        // Observe footer sections for subtle animations
+        document.querySelectorAll('.dripspaceNavbar-footerColumn, .dripspaceNavbar-footerNewsletter').forEach(section => {
+            section.style.opacity = '0';
+            section.style.transform = 'translateY(20px)';
+            section.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
+            observer.observe(section);
+        });
+    }
+})();
@@ -0,0 +1,547 @@
+// Wait for everything to load
+document.addEventListener('DOMContentLoaded', function() {
+
+    // =====================================================
+    // CHARACTER ANIMATION
+    // =====================================================
+    function initTextAnimations() {
+        const brandName = document.getElementById('dripspace-brand-name');
+        if (brandName) {
+            const brandText = 'DripSpace';
+            brandName.innerHTML = brandText.split('').map(char => 
+                `<span class="dripspace-hero-brand-name-char">${char}</span>`
+            ).join('');
+
+            const mainHeading = document.getElementById('dripspace-main-heading');
+            if (mainHeading) {
+                const headingText = 'Premium style zero effort';
+                mainHeading.innerHTML = headingText.split('').map(char => 
+                    `<span class="dripspace-hero-main-heading-char">${char === ' ' ? '&nbsp;' : char}</span>`
+                ).join('');
+            }
+
+            const subheading = document.getElementById('dripspace-subheading');
+            if (subheading) {
+                const subheadingText = 'Where clean aesthetics meet elevated comfort';
+                subheading.innerHTML = subheadingText.split('').map(char => 
+                    `<span class="dripspace-hero-subheading-char">${char === ' ' ? '&nbsp;' : char}</span>`
+                ).join('');
+            }
+
+            const brandChars = brandName.querySelectorAll('.dripspace-hero-brand-name-char');
+            brandChars.forEach((char, index) => {
+                setTimeout(() => {
+                    char.classList.add('dripspace-animated');
+                }, 400 + (index * 50));
+            });
+
+            if (mainHeading) {
+                const headingChars = mainHeading.querySelectorAll('.dripspace-hero-main-heading-char');
+                headingChars.forEach((char, index) => {
+                    setTimeout(() => {
+                        char.classList.add('dripspace-animated');
+                    }, 700 + (index * 30));
+                });
+            }
+
+            if (subheading) {
+                const subheadingChars = subheading.querySelectorAll('.dripspace-hero-subheading-char');
+                subheadingChars.forEach((char, index) => {
+                    setTimeout(() => {
+                        char.classList.add('dripspace-animated');
+                    }, 1000 + (index * 20));
+                });
+            }
+        }
+    }
+
+    initTextAnimations();
+
+    // =====================================================
+    // GSAP ANIMATIONS
+    // =====================================================
+    if (typeof gsap !== 'undefined' && typeof ScrollTrigger !== 'undefined') {
+        gsap.registerPlugin(ScrollTrigger);
+
+        // Page3 Image Cards Stagger Animation - Run on ALL screen sizes
+        const page3Cards = document.querySelectorAll('.page3-image');
+        if (page3Cards.length > 0) {
+            // First, set initial state for desktop
+            if (window.innerWidth > 768) {
+                gsap.utils.toArray('.page3-image').forEach((card, i) => {
+                    gsap.to(card, {
+                        scrollTrigger: {
+                            trigger: card,
+                            start: 'top 85%',
+                            end: 'bottom 15%',
+                            toggleActions: 'play none none reverse'
+                        },
+                        opacity: 1,
+                        y: 0,
+                        duration: 1,
+                        delay: i * 0.2,
+                        ease: 'power3.out'
+                    });
+                });
+            }
+        }
+
+        // Other animations...
+        const arrivalsHeader = document.querySelector('.arrivals-header');
+        if (arrivalsHeader && window.innerWidth > 768) {
+            gsap.from(arrivalsHeader, {
+                scrollTrigger: {
+                    trigger: '.arrivals',
+                    start: 'top 80%',
+                    toggleActions: 'play none none reverse'
+                },
+                opacity: 0,
+                y: -50,
+                duration: 1
+            });
+        }
+
+        const gridColumns = document.querySelectorAll('.grid-column');
+        if (gridColumns.length > 0 && window.innerWidth > 768) {
+            gsap.utils.toArray('.grid-column').forEach((col, i) => {
+                gsap.from(col, {
+                    scrollTrigger: {
+                        trigger: col,
+                        start: 'top 80%',
+                        toggleActions: 'play none none reverse'
+                    },
+                    opacity: 0,
+                    scale: 0.9,
+                    rotation: i % 2 === 0 ? -5 : 5,
+                    duration: 1,
+                    delay: i * 0.15,
+                    ease: 'power2.out'
+                });
+            });
+        }
+
+        ScrollTrigger.refresh();
+    }
+
+    // =====================================================
+    // ARRIVALS SLIDER - DUAL MODE (Desktop: JS slider, Mobile: Native scroll)
+    // =====================================================
+    function initArrivalsSlider() {
+        const sliderTrack = document.getElementById('sliderTrack');
+        const prevBtn = document.getElementById('prevBtn');
+        const nextBtn = document.getElementById('nextBtn');
+        const dotsContainer = document.getElementById('sliderDots');
+        const items = document.querySelectorAll('.arrival-items');
+
+        if (!sliderTrack || !prevBtn || !nextBtn || items.length === 0) return;
+
+        let currentIndex = 0;
+        let itemsToShow = getItemsToShow();
+        let isMobile = window.innerWidth <= 768;
+        let isDragging = false;
+        let startPos = 0;
+        let currentTranslate = 0;
+        let prevTranslate = 0;
+        let animationID;
+
+        function getItemsToShow() {
+            const width = window.innerWidth;
+            if (width < 480) return 1;
+            if (width < 768) return 2;
+            if (width < 1024) return 3;
+            return 3;
+        }
+
+        function getTotalSlides() {
+            return Math.ceil(items.length / itemsToShow);
+        }
+
+        function createDots() {
+            if (!dotsContainer || isMobile) return;
+            dotsContainer.innerHTML = '';
+            const totalSlides = getTotalSlides();
+
+            for (let i = 0; i < totalSlides; i++) {
+                const dot = document.createElement('div');
+                dot.classList.add('dot');
+                if (i === 0) dot.classList.add('active');
+                dot.addEventListener('click', () => goToSlide(i));
+                dotsContainer.appendChild(dot);
+            }
+        }
+
+        function updateDots() {
+            if (isMobile) return;
+            const dots = document.querySelectorAll('.dot');
+            dots.forEach((dot, index) => {
+                dot.classList.toggle('active', index === currentIndex);
+            });
+        }
+
+        function moveSlider() {
+            if (isMobile) return;
+
+            const gap = 24;
+            const itemWidth = items[0].offsetWidth;
+            const moveAmount = currentIndex * (itemWidth * itemsToShow + gap * itemsToShow);
+            sliderTrack.style.transform = `translateX(-${moveAmount}px)`;
+            updateDots();
+        }
+
+        function nextSlide() {
+            if (isMobile) return;
+
+            const totalSlides = getTotalSlides();
+            if (currentIndex < totalSlides - 1) {
+                currentIndex++;
+            } else {
+                currentIndex = 0;
+            }
+            moveSlider();
+        }
+
+        function prevSlide() {
+            if (isMobile) return;
+
+            const totalSlides = getTotalSlides();
+            if (currentIndex > 0) {
+                currentIndex--;
+            } else {
+                currentIndex = totalSlides - 1;
+            }
+            moveSlider();
+        }
+
+        function goToSlide(index) {
+            if (isMobile) return;
+
+            currentIndex = index;
+            moveSlider();
+        }
+
+        // Touch/swipe handlers for mobile
+        function setupTouchEvents() {
+            if (!isMobile) return;
+
+            const container = document.querySelector('.arrival-container');
+
+            function getPositionX(event) {
+                return event.type.includes('mouse') ? event.pageX : event.touches[0].clientX;
+            }
+
+            function setSliderPosition() {
+                sliderTrack.style.transform = `translateX(${currentTranslate}px)`;
+            }
+
+            function animation() {
+                setSliderPosition();
+                if (isDragging) {
+                    requestAnimationFrame(animation);
+                }
+            }
+
+            function touchStart(event) {
+                if (event.type === 'touchstart') {
+                    startPos = getPositionX(event);
+                    isDragging = true;
+                    animationID = requestAnimationFrame(animation);
+                    sliderTrack.style.transition = 'none';
+                }
+            }
+
+            function touchMove(event) {
+                if (isDragging) {
+                    const currentPosition = getPositionX(event);
+                    currentTranslate = prevTranslate + currentPosition - startPos;
+                }
+            }
+
+            function touchEnd() {
+                if (!isDragging) return;
+
+                isDragging = false;
+                cancelAnimationFrame(animationID);
+
+                const movedBy = currentTranslate - prevTranslate;
+                const threshold = 100; // Minimum swipe distance
+
+                if (movedBy < -threshold && currentIndex < items.length - 1) {
+                    currentIndex += 1;
+                } else if (movedBy > threshold && currentIndex > 0) {
+                    currentIndex -= 1;
+                }
+
+                // Snap to position
+                setPositionByIndex();
+                prevTranslate = currentTranslate;
+            }
+
+            function setPositionByIndex() {
+                const gap = 24;
+                const itemWidth = items[0].offsetWidth;
+                currentTranslate = currentIndex * -(itemWidth + gap);
+                sliderTrack.style.transition = 'transform 0.3s ease-out';
+                setSliderPosition();
+            }
+
+            // Event listeners for touch
+            container.addEventListener('touchstart', touchStart);
+            container.addEventListener('touchmove', touchMove);
+            container.addEventListener('touchend', touchEnd);
+
+            // Event listeners for mouse (for testing on desktop)
+            container.addEventListener('mousedown', touchStart);
+            container.addEventListener('mousemove', touchMove);
+            container.addEventListener('mouseup', touchEnd);
+            container.addEventListener('mouseleave', touchEnd);
+        }
+
+        // Initialize based on device
+        if (!isMobile) {
+            nextBtn.addEventListener('click', nextSlide);
+            prevBtn.addEventListener('click', prevSlide);
+            createDots();
+            moveSlider();
+        } else {
+            // Hide arrow buttons on mobile
+            prevBtn.style.display = 'none';
+            nextBtn.style.display = 'none';
+            setupTouchEvents();
+        }
+
+        window.addEventListener('resize', () => {
+            const oldIsMobile = isMobile;
+            isMobile = window.innerWidth <= 768;
+            itemsToShow = getItemsToShow();
+
+            if (oldIsMobile !== isMobile) {
+                // Mode changed between mobile and desktop
+                currentIndex = 0;
+                prevTranslate = 0;
+                currentTranslate = 0;
+
+                if (isMobile) {
+                    prevBtn.style.display = 'none';
+                    nextBtn.style.display = 'none';
+                    sliderTrack.style.transform = 'translateX(0)';
+                    sliderTrack.style.transition = 'none';
+                    setupTouchEvents();
+                } else {
+                    prevBtn.style.display = 'flex';
+                    nextBtn.style.display = 'flex';
+                    createDots();
+                    moveSlider();
+                }
+            } else if (!isMobile && oldIsMobile === false) {
+                // Desktop resize only
+                createDots();
+                moveSlider();
+            }
+        });
+    }
+
+    // =====================================================
+    // SHOES SLIDER - DUAL MODE (Desktop: JS slider, Mobile: Native scroll)
+    // =====================================================
+    function initShoesSlider() {
+        const shoesTrack = document.getElementById('shoesTrack');
+        const shoesPrev = document.getElementById('shoesPrevBtn');
+        const shoesNext = document.getElementById('shoesNextBtn');
+        const shoesItems = document.querySelectorAll('.shoes-item');
+
+        if (!shoesTrack || !shoesPrev || !shoesNext || shoesItems.length === 0) return;
+
+        let shoesIndex = 0;
+        let shoesToShow = getShoesItemsToShow();
+        let isMobile = window.innerWidth <= 768;
+        let isDragging = false;
+        let startPos = 0;
+        let currentTranslate = 0;
+        let prevTranslate = 0;
+        let animationID;
+
+        function getShoesItemsToShow() {
+            const width = window.innerWidth;
+            if (width < 480) return 1;
+            if (width < 768) return 2;
+            return 3;
+        }
+
+        function moveShoesSlider() {
+            if (isMobile) return;
+
+            const gap = 32;
+            const itemWidth = shoesItems[0].offsetWidth;
+            const moveAmount = shoesIndex * (itemWidth * shoesToShow + gap * shoesToShow);
+            shoesTrack.style.transform = `translateX(-${moveAmount}px)`;
+        }
+
+        function nextShoes() {
+            if (isMobile) return;
+
+            const total = Math.ceil(shoesItems.length / shoesToShow);
+            shoesIndex = (shoesIndex + 1) % total;
+            moveShoesSlider();
+        }
+
+        function prevShoes() {
+            if (isMobile) return;
+
+            const total = Math.ceil(shoesItems.length / shoesToShow);
+            if (shoesIndex > 0) {
+                shoesIndex--;
+            } else {
+                shoesIndex = total - 1;
+            }
+            moveShoesSlider();
+        }
+
+        // Touch/swipe handlers for mobile
+        function setupShoesTouchEvents() {
+            if (!isMobile) return;
+
+            const container = document.querySelector('.shoes-slider-container');
+
+            function getPositionX(event) {
+                return event.type.includes('mouse') ? event.pageX : event.touches[0].clientX;
+            }
+
+            function setSliderPosition() {
+                shoesTrack.style.transform = `translateX(${currentTranslate}px)`;
+            }
+
+            function animation() {
+                setSliderPosition();
+                if (isDragging) {
+                    requestAnimationFrame(animation);
+                }
+            }
+
+            function touchStart(event) {
+                if (event.type === 'touchstart') {
+                    startPos = getPositionX(event);
+                    isDragging = true;
+                    animationID = requestAnimationFrame(animation);
+                    shoesTrack.style.transition = 'none';
+                }
+            }
+
+            function touchMove(event) {
+                if (isDragging) {
+                    const currentPosition = getPositionX(event);
+                    currentTranslate = prevTranslate + currentPosition - startPos;
+                }
+            }
+
+            function touchEnd() {
+                if (!isDragging) return;
+
+                isDragging = false;
+                cancelAnimationFrame(animationID);
+
+                const movedBy = currentTranslate - prevTranslate;
+                const threshold = 100; // Minimum swipe distance
+
+                if (movedBy < -threshold && shoesIndex < shoesItems.length - 1) {
+                    shoesIndex += 1;
+                } else if (movedBy > threshold && shoesIndex > 0) {
+                    shoesIndex -= 1;
+                }
+
+                // Snap to position
+                setShoesPositionByIndex();
+                prevTranslate = currentTranslate;
+            }
+
+            function setShoesPositionByIndex() {
+                const gap = 32;
+                const itemWidth = shoesItems[0].offsetWidth;
+                currentTranslate = shoesIndex * -(itemWidth + gap);
+                shoesTrack.style.transition = 'transform 0.3s ease-out';
+                setSliderPosition();
+            }
+
+            // Event listeners for touch
+            container.addEventListener('touchstart', touchStart);
+            container.addEventListener('touchmove', touchMove);
+            container.addEventListener('touchend', touchEnd);
+
+            // Event listeners for mouse (for testing on desktop)
+            container.addEventListener('mousedown', touchStart);
+            container.addEventListener('mousemove', touchMove);
+            container.addEventListener('mouseup', touchEnd);
+            container.addEventListener('mouseleave', touchEnd);
+        }
+
+        // Initialize based on device
+        if (!isMobile) {
+            shoesNext.addEventListener('click', nextShoes);
+            shoesPrev.addEventListener('click', prevShoes);
+            moveShoesSlider();
+        } else {
+            // Hide arrow buttons on mobile
+            shoesPrev.style.display = 'none';
+            shoesNext.style.display = 'none';
+            setupShoesTouchEvents();
+        }
+
+        window.addEventListener('resize', () => {
+            const oldIsMobile = isMobile;
+            isMobile = window.innerWidth <= 768;
+            shoesToShow = getShoesItemsToShow();
+
+            if (oldIsMobile !== isMobile) {
+                // Mode changed between mobile and desktop
+                shoesIndex = 0;
+                prevTranslate = 0;
+                currentTranslate = 0;
+
+                if (isMobile) {
+                    shoesPrev.style.display = 'none';
+                    shoesNext.style.display = 'none';
+                    shoesTrack.style.transform = 'translateX(0)';
+                    shoesTrack.style.transition = 'none';
+                    setupShoesTouchEvents();
+                } else {
+                    shoesPrev.style.display = 'flex';
+                    shoesNext.style.display = 'flex';
+                    moveShoesSlider();
+                }
+            } else if (!isMobile && oldIsMobile === false) {
+                // Desktop resize only
+                moveShoesSlider();
+            }
+        });
+    }
+
+    // Initialize sliders
+    initArrivalsSlider();
+    initShoesSlider();
+
+    // =====================================================
+    // PAGE3 HOVER SECTIONS
+    // =====================================================
+    function initPage3Hover() {
+        const hoverSections = document.querySelectorAll('.hover-section');
+        hoverSections.forEach(section => {
+            const header = section.querySelector('.section-header');
+            const content = section.querySelector('.section-content');
+
+            if (header && content) {
+                header.addEventListener('click', () => {
+                    section.classList.toggle('active');
+                    if (section.classList.contains('active')) {
+                        content.style.maxHeight = content.scrollHeight + 'px';
+                        content.style.opacity = '1';
+                    } else {
+                        content.style.maxHeight = '0';
+                        content.style.opacity = '0';
+                    }
+                });
+            }
+        });
+    }
+
+    initPage3Hover();
+
+}); // End of DOMContentLoaded
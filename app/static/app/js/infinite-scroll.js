@@ -0,0 +1,33 @@
+(function() {
+  const more = document.querySelector('.infinite-scroll-more');
+  if (!more || !('IntersectionObserver' in window)) {
+    return;
+  }
+  const grid = document.querySelector(more.dataset.grid);
+  let loading = false;
+
+  const observer = new IntersectionObserver(function(entries) {
+    if (!entries[0].isIntersecting || loading) {
+      return;
+    }
+    loading = true;
+    fetch(more.dataset.nextUrl, { headers: { 'Accept': 'application/json' } })
+      .then(response => response.json())
+      .then(data => {
+        grid.insertAdjacentHTML('beforeend', data.html);
+        if (data.next_url) {
+          more.dataset.nextUrl = data.next_url;
+          more.href = data.next_page_url;
+          loading = false;
+        } else {
+          observer.disconnect();
+          more.parentNode.remove();
+        }
+      })
+      .catch(() => {
+        loading = false;
+      });
+  }, { rootMargin: '600px 0px' });
+
+  observer.observe(more);
+})();
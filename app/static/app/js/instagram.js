@@ -0,0 +1,39 @@
+document.addEventListener("DOMContentLoaded", function () {
+  // Get modal elements
+  const modal = document.querySelector(".insta-modal-view");
+  const modalImage = document.querySelector(".modal-image");
+  const closeBtn = document.querySelector(".insta-close-btn");
+  const postItems = document.querySelectorAll(".post-item");
+
+  // Open modal when post is clicked
+  postItems.forEach((item) => {
+    item.addEventListener("click", function () {
+      const imgSrc = this.querySelector("img").src;
+      modalImage.src = imgSrc;
+      modal.classList.add("active");
+      document.body.style.overflow = "hidden";
+    });
+  });
+
+  // Close modal when close button is clicked
+  closeBtn.addEventListener("click", function () {
+    modal.classList.remove("active");
+    document.body.style.overflow = "auto";
+  });
+
+  // Close modal when clicking outside the image
+  modal.addEventListener("click", function (e) {
+    if (e.target === modal) {
+      modal.classList.remove("active");
+      document.body.style.overflow = "auto";
+    }
+  });
+
+  // Close modal with Escape key
+  document.addEventListener("keydown", function (e) {
+    if (e.key === "Escape" && modal.classList.contains("active")) {
+      modal.classList.remove("active");
+      document.body.style.overflow = "auto";
+    }
+  });
+});
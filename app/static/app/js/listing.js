@@ -0,0 +1,102 @@
+// Initialize event listeners when DOM is loaded
+document.addEventListener('DOMContentLoaded', function() {
+  // Listen on the grid so cards appended by infinite scroll behave the same
+  const productGrid = document.querySelector('.drippace-product-grid');
+  productGrid.addEventListener('click', function(e) {
+    const card = e.target.closest('.dripspace-product-card');
+    // Don't open modal if clicking on add to cart button
+    if (card && !e.target.classList.contains('add-to-cart-btn') && !e.target.classList.contains('view-details-btn')) {
+      const productId = card.getAttribute('data-product');
+      // Redirect to product detail page instead of opening modal
+      window.location.href = '/productInfo/' + productId + '/';
+    }
+  });
+
+  // Touch device optimization
+  if ('ontouchstart' in window) {
+    // Add touch feedback
+    productGrid.addEventListener('touchstart', function(e) {
+      const card = e.target.closest('.dripspace-product-card');
+      if (card) card.style.opacity = '0.9';
+    });
+
+    productGrid.addEventListener('touchend', function(e) {
+      const card = e.target.closest('.dripspace-product-card');
+      if (card) card.style.opacity = '1';
+    });
+  }
+});
+
+// Add to cart function - now redirects to product detail page
+function redirectToProductDetail(slug) {
+  // Show warning message
+  showNotification('Please select a size on the product page before adding to cart');
+
+  // Redirect to product detail page after a short delay
+  setTimeout(function() {
+    window.location.href = '/productInfo/' + slug + '/';
+  }, 2000);
+}
+
+// Show notification function
+function showNotification(message) {
+  // Create notification element
+  const notification = document.createElement('div');
+  notification.style.cssText = `
+    position: fixed;
+    top: 20px;
+    right: 20px;
+    background: var(--accent-red);
+    color: white;
+    padding: 12px 16px;
+    border-radius: 4px;
+    font-family: 'Inter', sans-serif;
+    font-size: 14px;
+    font-weight: 500;
+    z-index: 10000;
+    animation: slideInRight 300ms ease-out;
+    box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+    max-width: 300px;
+  `;
+  notification.textContent = message;
+
+  // Add to page
+  document.body.appendChild(notification);
+
+  // Remove after 3 seconds
+  setTimeout(() => {
+    notification.style.animation = 'slideOutRight 300ms ease-in';
+    setTimeout(() => {
+      if (notification.parentNode) {
+        notification.parentNode.removeChild(notification);
+      }
+    }, 300);
+  }, 3000);
+}
+
+// Add notification animations to CSS
+const notificationStyles = document.createElement('style');
+notificationStyles.textContent = `
+  @keyframes slideInRight {
+    from {
+      transform: translateX(100%);
+      opacity: 0;
+    }
+    to {
+      transform: translateX(0);
+      opacity: 1;
+    }
+  }
+
+  @keyframes slideOutRight {
+    from {
+      transform: translateX(0);
+      opacity: 1;
+    }
+    to {
+      transform: translateX(100%);
+      opacity: 0;
+    }
+  }
+`;
+document.head.appendChild(notificationStyles);
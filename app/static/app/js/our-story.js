@@ -0,0 +1,99 @@
+// Our Story Page Interactions
+document.addEventListener('DOMContentLoaded', function() {
+  // Scroll Animation with Intersection Observer
+  function initScrollAnimations() {
+    const observerOptions = {
+      threshold: 0.1,
+      rootMargin: '0px 0px -50px 0px'
+    };
+
+    const sectionObserver = new IntersectionObserver(function(entries) {
+      entries.forEach(entry => {
+        if (entry.isIntersecting) {
+          entry.target.classList.add('visible');
+
+          // Add staggered animation for grid items
+          if (entry.target.classList.contains('design-ethos-section')) {
+            animateGridItems(entry.target.querySelectorAll('.ethos-principle-card'));
+          }
+          if (entry.target.classList.contains('brand-values-section')) {
+            animateGridItems(entry.target.querySelectorAll('.value-card'));
+          }
+        }
+      });
+    }, observerOptions);
+
+    // Observe all story sections
+    document.querySelectorAll('.story-scroll-section').forEach(section => {
+      section.style.transition = 'opacity 0.8s ease, transform 0.8s ease';
+      sectionObserver.observe(section);
+    });
+  }
+
+  // Staggered animation for grid items
+  function animateGridItems(items) {
+    items.forEach((item, index) => {
+      item.style.transition = 'all 0.6s ease';
+      item.style.transitionDelay = `${index * 0.1}s`;
+      item.style.opacity = '1';
+      item.style.transform = 'translateY(0)';
+    });
+  }
+
+  // CTA Button Interaction
+  function initCTAInteraction() {
+    const ctaBtn = document.querySelector('.story-cta-btn');
+
+    ctaBtn.addEventListener('click', function() {
+      // Smooth scroll to brand origin section
+      const brandOriginSection = document.querySelector('.brand-origin-section');
+      brandOriginSection.scrollIntoView({
+        behavior: 'smooth',
+        block: 'start'
+      });
+
+      // Add click feedback
+      this.style.transform = 'scale(0.95)';
+      setTimeout(() => {
+        this.style.transform = '';
+      }, 150);
+    });
+  }
+
+  // Initialize grid item animations
+  function initGridItemAnimations() {
+    const ethosCards = document.querySelectorAll('.ethos-principle-card');
+    const valueCards = document.querySelectorAll('.value-card');
+
+    [].forEach.call(ethosCards, card => {
+      card.style.opacity = '0';
+      card.style.transform = 'translateY(20px)';
+    });
+
+    [].forEach.call(valueCards, card => {
+      card.style.opacity = '0';
+      card.style.transform = 'translateY(20px)';
+    });
+  }
+
+  // Hover effects for interactive elements
+  function initHoverEffects() {
+    const interactiveCards = document.querySelectorAll('.ethos-principle-card, .value-card');
+
+    interactiveCards.forEach(card => {
+      card.addEventListener('mouseenter', function() {
+        this.style.transition = 'all 0.3s ease';
+      });
+
+      card.addEventListener('mouseleave', function() {
+        this.style.transition = 'all 0.3s ease';
+      });
+    });
+  }
+
+  // Initialize all functionality
+  initScrollAnimations();
+  initCTAInteraction();
+  initGridItemAnimations();
+  initHoverEffects();
+});
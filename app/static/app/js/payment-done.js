@@ -0,0 +1,47 @@
+/**
+ * Handle official site button click
+ * Currently set to empty link - to be updated with actual portfolio URL
+ */
+function handleOfficialSiteClick() {
+  // Add button click animation
+  const button = event.currentTarget;
+  button.style.transform = 'scale(0.95)';
+
+  setTimeout(() => {
+    button.style.transform = '';
+  }, 150);
+
+  // TODO: Replace '#' with actual portfolio URL
+  // window.location.href = 'https://your-portfolio-url.com';
+
+  // For now, show console message
+  console.log('Official site link not yet configured');
+
+  // Optional: Show user feedback
+  alert('Portfolio link will be added soon!');
+}
+
+/**
+ * Add subtle hover effects to all interactive elements
+ */
+document.addEventListener('DOMContentLoaded', function() {
+  // Add ripple effect on button click
+  const button = document.querySelector('.official-site-btn');
+
+  button.addEventListener('click', function(e) {
+    const ripple = document.createElement('span');
+    const rect = this.getBoundingClientRect();
+    const size = Math.max(rect.width, rect.height);
+    const x = e.clientX - rect.left - size / 2;
+    const y = e.clientY - rect.top - size / 2;
+
+    ripple.style.width = ripple.style.height = size + 'px';
+    ripple.style.left = x + 'px';
+    ripple.style.top = y + 'px';
+    ripple.classList.add('ripple');
+
+    this.appendChild(ripple);
+
+    setTimeout(() => ripple.remove(), 600);
+  });
+});
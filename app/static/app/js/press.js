@@ -0,0 +1,105 @@
+// Press & Media Page Interactions
+document.addEventListener('DOMContentLoaded', function() {
+  // Intersection Observer for scroll animations
+  function initScrollAnimations() {
+    const observerOptions = {
+      threshold: 0.1,
+      rootMargin: '0px 0px -50px 0px'
+    };
+
+    const articleObserver = new IntersectionObserver(function(entries) {
+      entries.forEach(entry => {
+        if (entry.isIntersecting) {
+          entry.target.classList.add('visible');
+        }
+      });
+    }, observerOptions);
+
+    const mediaKitObserver = new IntersectionObserver(function(entries) {
+      entries.forEach(entry => {
+        if (entry.isIntersecting) {
+          entry.target.classList.add('visible');
+        }
+      });
+    }, observerOptions);
+
+    // Observe article cards
+    document.querySelectorAll('.press-article-card').forEach(card => {
+      card.style.transition = 'opacity 0.6s ease, transform 0.6s ease, box-shadow 0.3s ease';
+      articleObserver.observe(card);
+    });
+
+    // Observe media kit cards
+    document.querySelectorAll('.media-kit-card').forEach(card => {
+      card.style.transition = 'opacity 0.6s ease, transform 0.6s ease, box-shadow 0.3s ease';
+      mediaKitObserver.observe(card);
+    });
+  }
+
+  // Button hover effects
+  function initButtonInteractions() {
+    const buttons = document.querySelectorAll('.press-btn-primary, .press-btn-outline, .press-btn-read');
+
+    buttons.forEach(button => {
+      button.addEventListener('mouseenter', function() {
+        this.style.transition = 'all 0.3s ease';
+      });
+
+      button.addEventListener('mouseleave', function() {
+        this.style.transition = 'all 0.3s ease';
+      });
+    });
+  }
+
+  // Card click handlers (for future functionality)
+  function initCardInteractions() {
+    const articleCards = document.querySelectorAll('.press-article-card');
+    const readButtons = document.querySelectorAll('.press-btn-read');
+
+    articleCards.forEach(card => {
+      card.addEventListener('click', function(e) {
+        if (!e.target.closest('.press-btn-read')) {
+          // Future: Expand to show full article
+          console.log('Article card clicked:', this.querySelector('.article-title').textContent);
+        }
+      });
+    });
+
+    readButtons.forEach(button => {
+      button.addEventListener('click', function(e) {
+        e.stopPropagation();
+        // Future: Navigate to full article
+        console.log('Read article:', this.closest('.press-article-card').querySelector('.article-title').textContent);
+      });
+    });
+  }
+
+  // Media kit download handlers
+  function initMediaKitInteractions() {
+    const mediaKitButtons = document.querySelectorAll('.media-kit-card .press-btn-primary');
+
+    mediaKitButtons.forEach(button => {
+      button.addEventListener('click', function() {
+        const cardTitle = this.closest('.media-kit-card').querySelector('.media-kit-title').textContent;
+        // Future: Trigger download modal or direct download
+        console.log('Download media kit:', cardTitle);
+
+        // Add temporary feedback
+        const originalText = this.textContent;
+        this.textContent = 'Loading...';
+        this.disabled = true;
+
+        setTimeout(() => {
+          this.textContent = originalText;
+          this.disabled = false;
+        }, 1500);
+      });
+    });
+  }
+
+  // Initialize all functionality
+  initScrollAnimations();
+  initButtonInteractions();
+  initCardInteractions();
+  initMediaKitInteractions();
+});
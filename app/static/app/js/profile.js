@@ -0,0 +1,195 @@
+// ===================================
+// DripSpace Profile Management
+// Enterprise-Grade JavaScript
+// ===================================
+
+(function() {
+  'use strict';
+
+  // ===== DOM Elements =====
+  const viewMode = document.getElementById('viewMode');
+  const editMode = document.getElementById('editMode');
+  const editBtn = document.getElementById('editBtn');
+  const cancelBtn = document.getElementById('cancelBtn');
+  const profileForm = document.getElementById('profileForm');
+  const successMessage = document.getElementById('successMessage');
+  const fileInput = document.getElementById('fileInput');
+  const previewImg = document.getElementById('previewImg');
+  const displayPicture = document.getElementById('displayPicture');
+
+  // Display elements
+  const displayName = document.getElementById('displayName');
+  const displayGender = document.getElementById('displayGender');
+  const displayPhone = document.getElementById('displayPhone');
+  const displaySize = document.getElementById('displaySize');
+  const displayAddress = document.getElementById('displayAddress');
+  const displayCity = document.getElementById('displayCity');
+  const displayState = document.getElementById('displayState');
+  const displayPincode = document.getElementById('displayPincode');
+
+  // Form inputs
+  const fullNameInput = document.getElementById('fullName');
+  const genderInput = document.getElementById('gender');
+  const phoneNoInput = document.getElementById('phoneNo');
+  const sizeInput = document.getElementById('size');
+  const addressInput = document.getElementById('address');
+  const cityInput = document.getElementById('city');
+  const stateInput = document.getElementById('state');
+  const pincodeInput = document.getElementById('pincode');
+
+  // Debug: Log elements to console
+  console.log('DOM Elements:', {
+    viewMode,
+    editMode,
+    editBtn,
+    cancelBtn,
+    profileForm,
+    fullNameInput,
+    genderInput,
+    phoneNoInput,
+    sizeInput,
+    addressInput,
+    cityInput,
+    stateInput,
+    pincodeInput
+  });
+
+  // ===== State Management =====
+  let currentProfilePic = displayPicture.src;
+
+  // ===== Toggle Edit Mode =====
+  function showEditMode() {
+    viewMode.classList.add('hidden');
+    editMode.classList.add('active');
+  }
+
+  function showViewMode() {
+    editMode.classList.remove('active');
+    viewMode.classList.remove('hidden');
+  }
+
+  // ===== Image Upload Handler =====
+  fileInput.addEventListener('change', function(e) {
+    const file = e.target.files[0];
+
+    if (file) {
+      // Validate file type
+      if (!file.type.startsWith('image/')) {
+        alert('Please upload a valid image file');
+        return;
+      }
+
+      // Validate file size (max 5MB)
+      if (file.size > 5 * 1024 * 1024) {
+        alert('Image size should not exceed 5MB');
+        return;
+      }
+
+      // Preview image
+      const reader = new FileReader();
+      reader.onload = function(event) {
+        previewImg.src = event.target.result;
+        currentProfilePic = event.target.result;
+      };
+      reader.readAsDataURL(file);
+    }
+  });
+
+  // ===== Form Validation =====
+  function validatePhone(phone) {
+    // Remove spaces and check if it's a valid format
+    const cleaned = phone.replace(/\s+/g, '');
+    return /^[+]?[0-9]{10,15}$/.test(cleaned);
+  }
+
+  function validatePincode(pincode) {
+    return /^[0-9]{6}$/.test(pincode);
+  }
+
+  // ===== Real-time Validation =====
+  phoneNoInput.addEventListener('blur', function() {
+    if (this.value && !validatePhone(this.value)) {
+      this.style.borderColor = '#ef4444';
+    } else {
+      this.style.borderColor = '#e5e7eb';
+    }
+  });
+
+  pincodeInput.addEventListener('input', function() {
+    // Only allow numbers
+    this.value = this.value.replace(/[^0-9]/g, '');
+
+    if (this.value && !validatePincode(this.value)) {
+      this.style.borderColor = '#ef4444';
+    } else {
+      this.style.borderColor = '#e5e7eb';
+    }
+  });
+
+  // ===== Show Success Message =====
+  function showSuccessMessage() {
+    successMessage.classList.add('show');
+
+    setTimeout(() => {
+      successMessage.classList.remove('show');
+    }, 3000);
+  }
+
+  // ===== Update Display Values =====
+  function updateDisplayValues() {
+    displayName.textContent = fullNameInput.value;
+    displayGender.textContent = genderInput.value;
+    displayPhone.textContent = phoneNoInput.value;
+    displaySize.textContent = sizeInput.value;
+    displayAddress.textContent = addressInput.value;
+    displayCity.textContent = cityInput.value;
+    displayState.textContent = stateInput.value;
+    displayPincode.textContent = pincodeInput.value;
+    displayPicture.src = currentProfilePic;
+  }
+
+  // ===== Event Listeners =====
+  editBtn.addEventListener('click', function() {
+    showEditMode();
+    smoothScrollToTop();
+  });
+
+  cancelBtn.addEventListener('click', function() {
+    // Reset form to current display values
+    fullNameInput.value = displayName.textContent;
+    genderInput.value = displayGender.textContent;
+    phoneNoInput.value = displayPhone.textContent;
+    sizeInput.value = displaySize.textContent;
+    addressInput.value = displayAddress.textContent;
+    cityInput.value = displayCity.textContent;
+    stateInput.value = displayState.textContent;
+    pincodeInput.value = displayPincode.textContent;
+    previewImg.src = displayPicture.src;
+    currentProfilePic = displayPicture.src;
+
+    // Reset validation styles
+    phoneNoInput.style.borderColor = '#e5e7eb';
+    pincodeInput.style.borderColor = '#e5e7eb';
+
+    showViewMode();
+    smoothScrollToTop();
+  });
+
+  // Remove the form submit handler since we're using Django form submission
+  // The form will be submitted to the server and handle the redirect
+
+  // Add debugging to see if form submission is working
+  profileForm.addEventListener('submit', function(e) {
+    console.log('Form is being submitted');
+    // Let the form submit normally to Django
+  });
+
+  // ===== Smooth Scroll to Top on Mode Change =====
+  function smoothScrollToTop() {
+    window.scrollTo({
+      top: 0,
+      behavior: 'smooth'
+    });
+  }
+
+})();
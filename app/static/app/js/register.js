@@ -0,0 +1,13 @@
+document.getElementById('registerForm').addEventListener('submit', function(e) {
+    const password = document.getElementById('password').value;
+    const confirmPassword = document.getElementById('confirm_password').value;
+    const errorDiv = document.getElementById('password-error');
+
+    if (password !== confirmPassword) {
+        e.preventDefault();
+        errorDiv.textContent = 'Passwords do not match';
+        errorDiv.style.display = 'block';
+    } else {
+        errorDiv.style.display = 'none';
+    }
+});
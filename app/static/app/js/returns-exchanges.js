@@ -0,0 +1,49 @@
+document.addEventListener('DOMContentLoaded', function() {
+  const accordionItems = document.querySelectorAll('.policy-accordion-item');
+
+  // Initialize with first item open
+  accordionItems.forEach((item, index) => {
+    if (index !== 0) {
+      item.setAttribute('data-active', 'false');
+    }
+  });
+
+  accordionItems.forEach(item => {
+    const header = item.querySelector('.accordion-header');
+
+    header.addEventListener('click', () => {
+      const isActive = item.getAttribute('data-active') === 'true';
+
+      // Close all items
+      accordionItems.forEach(otherItem => {
+        otherItem.setAttribute('data-active', 'false');
+      });
+
+      // Open clicked item if it wasn't active
+      if (!isActive) {
+        item.setAttribute('data-active', 'true');
+      }
+    });
+  });
+
+  // Add animation to CTA button on page load
+  const ctaButton = document.querySelector('.return-cta-btn');
+  setTimeout(() => {
+    ctaButton.style.transform = 'translateY(0)';
+    ctaButton.style.opacity = '1';
+  }, 800);
+
+  // Add smooth scroll behavior for anchor links
+  document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', function (e) {
+      e.preventDefault();
+      const target = document.querySelector(this.getAttribute('href'));
+      if (target) {
+        target.scrollIntoView({
+          behavior: 'smooth',
+          block: 'start'
+        });
+      }
+    });
+  });
+});
@@ -0,0 +1,253 @@
+// Interactive functionality for the Men's Size Guide
+document.addEventListener('DOMContentLoaded', function() {
+    // Tab switching functionality
+    const tabButtons = document.querySelectorAll('.tab-button');
+    const tabPanels = document.querySelectorAll('.tab-panel');
+
+    // Initialize with first tab active
+    function activateTab(tabId) {
+        // Remove active class from all tabs and panels
+        tabButtons.forEach(btn => {
+            btn.classList.remove('active');
+            btn.setAttribute('aria-selected', 'false');
+        });
+
+        tabPanels.forEach(panel => {
+            panel.classList.remove('active');
+        });
+
+        // Activate selected tab
+        const activeButton = document.querySelector(`[data-tab="${tabId}"]`);
+        const activePanel = document.getElementById(`${tabId}-panel`);
+
+        if (activeButton && activePanel) {
+            activeButton.classList.add('active');
+            activeButton.setAttribute('aria-selected', 'true');
+            activePanel.classList.add('active');
+        }
+
+        // Clear any active measurement highlights
+        clearMeasurementHighlights();
+    }
+
+    // Add click listeners to tab buttons
+    tabButtons.forEach(button => {
+        button.addEventListener('click', function() {
+            const tabId = this.getAttribute('data-tab');
+            activateTab(tabId);
+        });
+
+        // Add keyboard navigation
+        button.addEventListener('keydown', function(e) {
+            if (e.key === 'ArrowRight' || e.key === 'ArrowLeft') {
+                e.preventDefault();
+
+                const currentIndex = Array.from(tabButtons).indexOf(this);
+                let nextIndex;
+
+                if (e.key === 'ArrowRight') {
+                    nextIndex = (currentIndex + 1) % tabButtons.length;
+                } else {
+                    nextIndex = currentIndex === 0 ? tabButtons.length - 1 : currentIndex - 1;
+                }
+
+                tabButtons[nextIndex].focus();
+                tabButtons[nextIndex].click();
+            }
+        });
+    });
+
+    // Measurement illustration highlighting
+    const measurementHeaders = document.querySelectorAll('.measurement-header');
+
+    function clearMeasurementHighlights() {
+        // Remove active class from all measurement lines and labels
+        const activeLines = document.querySelectorAll('.measure-line.active');
+        const activeLabels = document.querySelectorAll('.measure-label.active');
+
+        activeLines.forEach(line => line.classList.remove('active'));
+        activeLabels.forEach(label => label.classList.remove('active'));
+    }
+
+    function highlightMeasurement(measureType) {
+        clearMeasurementHighlights();
+
+        // Add active class to corresponding measurement elements
+        const line = document.querySelector(`.${measureType}-measure`);
+        const label = document.querySelector(`.${measureType}-label`);
+
+        if (line) line.classList.add('active');
+        if (label) label.classList.add('active');
+    }
+
+    // Add hover listeners to measurement headers
+    measurementHeaders.forEach(header => {
+        header.addEventListener('mouseenter', function() {
+            const measureType = this.getAttribute('data-measure');
+            if (measureType) {
+                highlightMeasurement(measureType);
+            }
+        });
+
+        header.addEventListener('mouseleave', function() {
+            // Keep the highlight for 500ms after mouse leaves
+            setTimeout(() => {
+                // Only clear if no other measurement header is being hovered
+                const anyHovered = Array.from(measurementHeaders).some(h => h.matches(':hover'));
+                if (!anyHovered) {
+                    clearMeasurementHighlights();
+                }
+            }, 500);
+        });
+    });
+
+    // Smooth scroll to table when tab is switched
+    function smoothScrollToTable() {
+        const activePanel = document.querySelector('.tab-panel.active');
+        if (activePanel) {
+            activePanel.scrollIntoView({
+                behavior: 'smooth',
+                block: 'nearest'
+            });
+        }
+    }
+
+    // Update tab activation to include smooth scroll
+    const originalActivateTab = activateTab;
+    activateTab = function(tabId) {
+        originalActivateTab(tabId);
+        setTimeout(smoothScrollToTable, 100);
+    };
+
+    // Initialize with first tab
+    activateTab('tops');
+
+    // Table sorting functionality (optional enhancement)
+    const tables = document.querySelectorAll('.measurement-table');
+
+    tables.forEach(table => {
+        const headers = table.querySelectorAll('.measurement-header');
+
+        headers.forEach(header => {
+            header.addEventListener('click', function() {
+                const columnIndex = Array.from(header.parentNode.children).indexOf(header);
+                const tbody = table.querySelector('tbody');
+                const rows = Array.from(tbody.querySelectorAll('tr'));
+
+                // Simple toggle between ascending/descending
+                const isCurrentlySorted = header.classList.contains('sorted-asc');
+
+                // Remove sorting classes from all headers
+                headers.forEach(h => {
+                    h.classList.remove('sorted-asc', 'sorted-desc');
+                });
+
+                // Sort rows
+                rows.sort((a, b) => {
+                    const aValue = a.children[columnIndex].textContent.trim();
+                    const bValue = b.children[columnIndex].textContent.trim();
+
+                    // Try to parse as numbers, fall back to string comparison
+                    const aNum = parseFloat(aValue);
+                    const bNum = parseFloat(bValue);
+
+                    if (!isNaN(aNum) && !isNaN(bNum)) {
+                        return isCurrentlySorted ? bNum - aNum : aNum - bNum;
+                    } else {
+                        return isCurrentlySorted ? 
+                            bValue.localeCompare(aValue) : 
+                            aValue.localeCompare(bValue);
+                    }
+                });
+
+                // Apply new sort class
+                header.classList.add(isCurrentlySorted ? 'sorted-desc' : 'sorted-asc');
+
+                // Rebuild tbody
+                tbody.innerHTML = '';
+                rows.forEach(row => tbody.appendChild(row));
+            });
+        });
+    });
+
+    // Add animation on scroll (optional enhancement)
+    const observerOptions = {
+        threshold: 0.1,
+        rootMargin: '0px 0px -50px 0px'
+    };
+
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                entry.target.style.opacity = '1';
+                entry.target.style.transform = 'translateY(0)';
+            }
+        });
+    }, observerOptions);
+
+    // Observe elements for scroll animations
+    const animatedElements = document.querySelectorAll('.premium-measure-illustration, .size-chart-container');
+    animatedElements.forEach(el => {
+        el.style.opacity = '0';
+        el.style.transform = 'translateY(20px)';
+        el.style.transition = 'opacity 0.6s ease-out, transform 0.6s ease-out';
+        observer.observe(el);
+    });
+
+    // Add touch support for mobile measurement highlighting
+    measurementHeaders.forEach(header => {
+        header.addEventListener('touchstart', function() {
+            const measureType = this.getAttribute('data-measure');
+            if (measureType) {
+                highlightMeasurement(measureType);
+            }
+        });
+    });
+
+    // Clear highlights when touching outside
+    document.addEventListener('touchstart', function(e) {
+        if (!e.target.closest('.measurement-header')) {
+            setTimeout(() => {
+                clearMeasurementHighlights();
+            }, 2000); // Keep highlight for 2 seconds on touch
+        }
+    });
+
+    // Performance optimization: Debounce scroll events
+    let scrollTimeout;
+    function handleScroll() {
+        if (scrollTimeout) {
+            cancelAnimationFrame(scrollTimeout);
+        }
+        scrollTimeout = requestAnimationFrame(() => {
+            // Any scroll-based functionality can be added here
+        });
+    }
+
+    document.addEventListener('scroll', handleScroll, { passive: true });
+});
+
+// Additional utility functions
+function formatSizeGuide() {
+    // Function to format the size guide for different use cases
+    const currentTab = document.querySelector('.tab-button.active');
+    if (currentTab) {
+        const tabId = currentTab.getAttribute('data-tab');
+        const panel = document.getElementById(`${tabId}-panel`);
+        const table = panel.querySelector('.measurement-table');
+
+        return {
+            category: tabId,
+            measurements: Array.from(table.querySelectorAll('tr')).map(row => {
+                const cells = row.querySelectorAll('td, th');
+                return Array.from(cells).map(cell => cell.textContent.trim());
+            })
+        };
+    }
+    return null;
+}
+
+// Export for potential use in other modules
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { formatSizeGuide };
+}
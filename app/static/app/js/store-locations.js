@@ -0,0 +1,283 @@
+// Store Data with map coordinates
+const stores = [
+  {
+    name: "DripSpace Guwahati",
+    address: "GS Road, Guwahati",
+    state: "Assam",
+    city: "Guwahati",
+    phone: "+91 XXXXX 00001",
+    hours: "10:00 AM - 9:00 PM",
+    mapLink: "https://maps.google.com/?q=GS+Road+Guwahati",
+    coordinates: { x: 75, y: 35 } // Percentage positions on map
+  },
+  {
+    name: "DripSpace Delhi",
+    address: "Connaught Place, New Delhi",
+    state: "Delhi",
+    city: "Delhi",
+    phone: "+91 XXXXX 00002",
+    hours: "10:00 AM - 10:00 PM",
+    mapLink: "https://maps.google.com/?q=Connaught+Place+Delhi",
+    coordinates: { x: 42, y: 28 }
+  },
+  {
+    name: "DripSpace Mumbai",
+    address: "Bandra West, Mumbai",
+    state: "Maharashtra",
+    city: "Mumbai",
+    phone: "+91 XXXXX 00003",
+    hours: "11:00 AM - 10:00 PM",
+    mapLink: "https://maps.google.com/?q=Bandra+West+Mumbai",
+    coordinates: { x: 30, y: 52 }
+  },
+  {
+    name: "DripSpace Bengaluru",
+    address: "Indiranagar, Bengaluru",
+    state: "Karnataka",
+    city: "Bengaluru",
+    phone: "+91 XXXXX 00004",
+    hours: "10:30 AM - 9:30 PM",
+    mapLink: "https://maps.google.com/?q=Indiranagar+Bengaluru",
+    coordinates: { x: 40, y: 70 }
+  },
+  {
+    name: "DripSpace Kolkata",
+    address: "Park Street, Kolkata",
+    state: "West Bengal",
+    city: "Kolkata",
+    phone: "+91 XXXXX 00005",
+    hours: "10:00 AM - 9:00 PM",
+    mapLink: "https://maps.google.com/?q=Park+Street+Kolkata",
+    coordinates: { x: 68, y: 42 }
+  },
+  {
+    name: "DripSpace Hyderabad",
+    address: "Banjara Hills, Hyderabad",
+    state: "Telangana",
+    city: "Hyderabad",
+    phone: "+91 XXXXX 00006",
+    hours: "10:00 AM - 9:30 PM",
+    mapLink: "https://maps.google.com/?q=Banjara+Hills+Hyderabad",
+    coordinates: { x: 45, y: 60 }
+  }
+];
+
+let currentFilteredStores = [...stores];
+
+// Create store card HTML
+function createStoreCard(store, index) {
+  return `
+    <div class="store-card-premium" style="animation-delay: ${index * 0.1}s">
+      <div class="store-info-block">
+        <div>
+          <h3 class="store-name-heading">${store.name}</h3>
+        </div>
+
+        <div class="store-detail-item">
+          <svg class="detail-icon" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+            <path d="M21 10c0 7-9 13-9 13s-9-6-9-13a9 9 0 0 1 18 0z"></path>
+            <circle cx="12" cy="10" r="3"></circle>
+          </svg>
+          <div class="detail-text">
+            <span class="detail-label">Address</span>
+            ${store.address}
+          </div>
+        </div>
+
+        <div class="store-detail-item">
+          <svg class="detail-icon" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+            <path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72 12.84 12.84 0 0 0 .7 2.81 2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45 12.84 12.84 0 0 0 2.81.7A2 2 0 0 1 22 16.92z"></path>
+          </svg>
+          <div class="detail-text">
+            <span class="detail-label">Contact</span>
+            ${store.phone}
+          </div>
+        </div>
+
+        <div class="store-detail-item">
+          <svg class="detail-icon" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+            <circle cx="12" cy="12" r="10"></circle>
+            <polyline points="12 6 12 12 16 14"></polyline>
+          </svg>
+          <div class="detail-text">
+            <span class="detail-label">Hours</span>
+            ${store.hours}
+          </div>
+        </div>
+
+        <button class="map-action-button" onclick="window.open('${store.mapLink}', '_blank')">
+          View on Map
+        </button>
+      </div>
+    </div>
+  `;
+}
+
+// Filter and render stores
+function renderStores(filteredStores) {
+  const container = document.getElementById('storeCardsContainer');
+
+  if (filteredStores.length === 0) {
+    container.innerHTML = `
+      <div style="grid-column: 1/-1; text-align: center; padding: 60px 20px; color: #999;">
+        <svg width="60" height="60" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5" style="margin: 0 auto 20px; opacity: 0.5;">
+          <circle cx="11" cy="11" r="8"></circle>
+          <path d="m21 21-4.35-4.35"></path>
+        </svg>
+        <p style="font-size: 18px; font-weight: 300;">No stores found matching your search</p>
+      </div>
+    `;
+  } else {
+    container.innerHTML = filteredStores.map((store, index) => createStoreCard(store, index)).join('');
+  }
+
+  renderMap(filteredStores);
+}
+
+// Draw interactive map with markers
+function renderMap(storesToShow) {
+  const canvas = document.getElementById('mapCanvas');
+  if (!canvas) return;
+
+  const ctx = canvas.getContext('2d');
+  const mapContainer = document.getElementById('interactiveMap');
+
+  // Set canvas size to match container
+  const rect = mapContainer.getBoundingClientRect();
+  canvas.width = rect.width;
+  canvas.height = rect.height;
+
+  // Draw gradient background
+  const gradient = ctx.createLinearGradient(0, 0, canvas.width, canvas.height);
+  gradient.addColorStop(0, '#f0f4f8');
+  gradient.addColorStop(1, '#e8eef4');
+  ctx.fillStyle = gradient;
+  ctx.fillRect(0, 0, canvas.width, canvas.height);
+
+  // Draw grid lines
+  ctx.strokeStyle = '#e0e6ec';
+  ctx.lineWidth = 1;
+  for (let i = 0; i <= 8; i++) {
+    const y = (canvas.height / 8) * i;
+    ctx.beginPath();
+    ctx.moveTo(0, y);
+    ctx.lineTo(canvas.width, y);
+    ctx.stroke();
+
+    const x = (canvas.width / 8) * i;
+    ctx.beginPath();
+    ctx.moveTo(x, 0);
+    ctx.lineTo(x, canvas.height);
+    ctx.stroke();
+  }
+
+  // Draw simplified India shape
+  ctx.fillStyle = '#ffffff';
+  ctx.strokeStyle = '#cbd5e1';
+  ctx.lineWidth = 2.5;
+  ctx.beginPath();
+
+  // India outline
+  const w = canvas.width;
+  const h = canvas.height;
+  ctx.moveTo(w * 0.42, h * 0.12);
+  ctx.lineTo(w * 0.48, h * 0.18);
+  ctx.lineTo(w * 0.56, h * 0.22);
+  ctx.lineTo(w * 0.64, h * 0.26);
+  ctx.lineTo(w * 0.72, h * 0.32);
+  ctx.lineTo(w * 0.75, h * 0.42);
+  ctx.lineTo(w * 0.72, h * 0.54);
+  ctx.lineTo(w * 0.68, h * 0.66);
+  ctx.lineTo(w * 0.62, h * 0.76);
+  ctx.lineTo(w * 0.54, h * 0.82);
+  ctx.lineTo(w * 0.46, h * 0.85);
+  ctx.lineTo(w * 0.38, h * 0.84);
+  ctx.lineTo(w * 0.30, h * 0.78);
+  ctx.lineTo(w * 0.26, h * 0.68);
+  ctx.lineTo(w * 0.25, h * 0.56);
+  ctx.lineTo(w * 0.28, h * 0.44);
+  ctx.lineTo(w * 0.32, h * 0.32);
+  ctx.lineTo(w * 0.38, h * 0.20);
+  ctx.closePath();
+  ctx.fill();
+  ctx.stroke();
+
+  // Remove existing markers and tooltips
+  const existingMarkers = mapContainer.querySelectorAll('.map-location-marker, .map-tooltip');
+  existingMarkers.forEach(marker => marker.remove());
+
+  // Add markers for each visible store
+  storesToShow.forEach((store, index) => {
+    setTimeout(() => {
+      // Create marker
+      const marker = document.createElement('div');
+      marker.className = 'map-location-marker';
+      marker.style.left = store.coordinates.x + '%';
+      marker.style.top = store.coordinates.y + '%';
+
+      // Create tooltip
+      const tooltip = document.createElement('div');
+      tooltip.className = 'map-tooltip';
+      tooltip.textContent = store.city;
+      tooltip.style.left = `calc(${store.coordinates.x}% + 20px)`;
+      tooltip.style.top = `calc(${store.coordinates.y}% - 50px)`;
+
+      // Add event listeners
+      marker.addEventListener('mouseenter', () => {
+        tooltip.classList.add('visible');
+      });
+
+      marker.addEventListener('mouseleave', () => {
+        tooltip.classList.remove('visible');
+      });
+
+      marker.addEventListener('click', () => {
+        window.open(store.mapLink, '_blank');
+      });
+
+      // Append to map
+      mapContainer.appendChild(marker);
+      mapContainer.appendChild(tooltip);
+    }, index * 100);
+  });
+}
+
+// Filter functionality
+function filterStores() {
+  const searchTerm = document.getElementById('storeSearch').value.toLowerCase();
+  const stateFilter = document.getElementById('stateFilter').value;
+
+  let filtered = stores;
+
+  // Filter by state
+  if (stateFilter !== 'all') {
+    filtered = filtered.filter(store => store.state === stateFilter);
+  }
+
+  // Filter by search term
+  if (searchTerm) {
+    filtered = filtered.filter(store => 
+      store.name.toLowerCase().includes(searchTerm) ||
+      store.city.toLowerCase().includes(searchTerm) ||
+      store.state.toLowerCase().includes(searchTerm) ||
+      store.address.toLowerCase().includes(searchTerm)
+    );
+  }
+
+  currentFilteredStores = filtered;
+  renderStores(filtered);
+}
+
+// Initialize
+document.addEventListener('DOMContentLoaded', function() {
+  renderStores(stores);
+
+  // Add event listeners
+  document.getElementById('storeSearch').addEventListener('input', filterStores);
+  document.getElementById('stateFilter').addEventListener('change', filterStores);
+
+  // Redraw map on window resize
+  window.addEventListener('resize', () => {
+    renderMap(currentFilteredStores);
+  });
+});
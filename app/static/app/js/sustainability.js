@@ -0,0 +1,120 @@
+// ==========================================
+// ACCORDION FUNCTIONALITY
+// ==========================================
+document.addEventListener('DOMContentLoaded', () => {
+  const accordionTriggers = document.querySelectorAll('.accordion-trigger');
+
+  accordionTriggers.forEach(trigger => {
+    trigger.addEventListener('click', () => {
+      const targetId = trigger.getAttribute('data-target');
+      const targetContent = document.getElementById(targetId);
+      const icon = trigger.querySelector('.accordion-icon');
+      const isActive = trigger.classList.contains('active');
+
+      // Close all accordions
+      accordionTriggers.forEach(t => {
+        t.classList.remove('active');
+        t.querySelector('.accordion-icon').textContent = '+';
+        const content = document.getElementById(t.getAttribute('data-target'));
+        if (content) {
+          content.style.display = 'none';
+        }
+      });
+
+      // Toggle current accordion
+      if (!isActive) {
+        trigger.classList.add('active');
+        icon.textContent = '−';
+        targetContent.style.display = 'block';
+      }
+    });
+  });
+
+  // ==========================================
+  // PILLAR CARD ANIMATIONS ON SCROLL
+  // ==========================================
+  const observerOptions = {
+    threshold: 0.15,
+    rootMargin: '0px 0px -50px 0px'
+  };
+
+  const observer = new IntersectionObserver((entries) => {
+    entries.forEach((entry, index) => {
+      if (entry.isIntersecting) {
+        setTimeout(() => {
+          entry.target.style.opacity = '1';
+          entry.target.style.transform = 'translateY(0)';
+        }, index * 100);
+      }
+    });
+  }, observerOptions);
+
+  const pillarCards = document.querySelectorAll('.pillar-card');
+  pillarCards.forEach(card => {
+    card.style.opacity = '0';
+    card.style.transform = 'translateY(30px)';
+    card.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
+    observer.observe(card);
+  });
+
+  // ==========================================
+  // STAT COUNTER ANIMATION
+  // ==========================================
+  const animateCounter = (element, target, suffix = '') => {
+    const duration = 2000;
+    const start = 0;
+    const startTime = performance.now();
+
+    const updateCounter = (currentTime) => {
+      const elapsed = currentTime - startTime;
+      const progress = Math.min(elapsed / duration, 1);
+
+      // Easing function
+      const easeOut = 1 - Math.pow(1 - progress, 3);
+      const current = Math.floor(start + (target - start) * easeOut);
+
+      element.textContent = current + suffix;
+
+      if (progress < 1) {
+        requestAnimationFrame(updateCounter);
+      } else {
+        element.textContent = target + suffix;
+      }
+    };
+
+    requestAnimationFrame(updateCounter);
+  };
+
+  const statObserver = new IntersectionObserver((entries) => {
+    entries.forEach(entry => {
+      if (entry.isIntersecting && !entry.target.dataset.animated) {
+        const statNumber = entry.target.querySelector('.stat-number');
+        const text = statNumber.textContent;
+
+        // Parse number and suffix
+        let value, suffix = '';
+        if (text.includes('%')) {
+          value = parseInt(text);
+          suffix = '%';
+        } else if (text.includes('K')) {
+          value = parseFloat(text) * 1000;
+          suffix = 'K+';
+        } else if (text.includes('M')) {
+          value = parseInt(text.replace('$', ''));
+          suffix = text.includes('$') ? 'M' : 'M';
+        } else {
+          value = parseInt(text);
+        }
+
+        if (!isNaN(value)) {
+          statNumber.textContent = '0' + suffix;
+          animateCounter(statNumber, value, suffix);
+          entry.target.dataset.animated = 'true';
+        }
+      }
+    });
+  }, { threshold: 0.5 });
+
+  const statBlocks = document.querySelectorAll('.stat-block');
+  statBlocks.forEach(block => statObserver.observe(block));
+});
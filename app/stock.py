@@ -0,0 +1,170 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.utils import timezone
+
+from .counters import increment_counter
+from .feeds import FEED_CHANGES
+from .models import Stock, StockReservation
+
+
+# How long units put in a cart stay held before they go back on sale
+RESERVATION_TTL = timedelta(minutes=15)
+RELEASE_BATCH_SIZE = 1000
+
+
+class OutOfStock(Exception):
+    """Not enough units left for a cart line; `key` is its (product_id, size_id, shoe_size_id)"""
+
+    def __init__(self, key):
+        super().__init__('Not enough stock')
+        self.key = key
+
+
+def _availability_changed():
+    # Feeds show availability, which no Product.updated_at records
+    increment_counter(FEED_CHANGES)
+
+
+def take_stock(stock_id, quantity, key=None):
+    """Conditionally decrement stock.
+
+    One UPDATE ... WHERE quantity > n: the check and the decrement are a
+    single statement, so concurrent buyers can never drive stock below zero.
+    Only taking the last units needs a second one, and it tells the feeds.
+    """
+    stock = Stock.objects.filter(id=stock_id)
+    if stock.filter(quantity__gt=quantity).update(quantity=F('quantity') - quantity):
+        return
+    if not stock.filter(quantity=quantity).update(quantity=0):
+        raise OutOfStock(key)
+    _availability_changed()
+
+
+def return_stock(stock_id, quantity):
+    stock = Stock.objects.filter(id=stock_id)
+    if not stock.filter(quantity__gt=0).update(quantity=F('quantity') + quantity):
+        # Sold out until now
+        if stock.update(quantity=F('quantity') + quantity):
+            _availability_changed()
+
+
+def _stock_ids(keys):
+    """Map (product_id, size_id, shoe_size_id) keys to Stock ids; untracked lines are left out"""
+    keys = set(keys)
+    rows = Stock.objects.filter(product_id__in={product_id for product_id, _, _ in keys}).values_list(
+        'id', 'product_id', 'size_id', 'shoe_size_id'
+    )
+    return {(product_id, size_id, shoe_size_id): stock_id
+            for stock_id, product_id, size_id, shoe_size_id in rows
+            if (product_id, size_id, shoe_size_id) in keys}
+
+
+def hold_stock(cart, targets, add=False, exact=False):
+    """Make a cart's holds match `targets`, {(product_id, size_id, shoe_size_id): quantity}.
+
+    With add=True the quantities are added to what the cart already holds.
+    With exact=True holds on lines missing from targets are handed back.
+    Raises OutOfStock, so call it inside the transaction that changes the
+    cart lines. Products without Stock rows are not tracked and always pass.
+    """
+    stock_ids = _stock_ids(targets)
+    if not stock_ids and not exact:
+        return
+
+    reservations = {
+        reservation.stock_id: reservation
+        for reservation in StockReservation.objects.select_for_update().filter(cart=cart)
+    }
+    expires_at = timezone.now() + RESERVATION_TTL
+    to_create = []
+    to_update = []
+    to_delete = []
+    for key, stock_id in stock_ids.items():
+        reservation = reservations.pop(stock_id, None)
+        held = reservation.quantity if reservation else 0
+        wanted = held + targets[key] if add else targets[key]
+        if wanted > held:
+            take_stock(stock_id, wanted - held, key)
+        elif wanted < held:
+            return_stock(stock_id, held - wanted)
+
+        if reservation is None:
+            if wanted:
+                to_create.append(StockReservation(cart=cart, stock_id=stock_id, quantity=wanted,
+                                                  expires_at=expires_at))
+        elif wanted:
+            reservation.quantity = wanted
+            reservation.expires_at = expires_at
+            to_update.append(reservation)
+        else:
+            to_delete.append(reservation.id)
+
+    if exact:
+        for reservation in reservations.values():
+            return_stock(reservation.stock_id, reservation.quantity)
+            to_delete.append(reservation.id)
+
+    if to_update:
+        StockReservation.objects.bulk_update(to_update, ['quantity', 'expires_at'])
+    if to_create:
+        StockReservation.objects.bulk_create(to_create)
+    if to_delete:
+        StockReservation.objects.filter(id__in=to_delete).delete()
+
+
+def sell_stock(cart, targets):
+    """At checkout: turn the cart's holds into sales.
+
+    Lines that are fully held cost nothing per line; only a line whose hold
+    lapsed (or never existed) needs its own conditional decrement.
+    """
+    stock_ids = _stock_ids(targets)
+    held = dict(
+        StockReservation.objects.select_for_update().filter(cart=cart).values_list('stock_id', 'quantity')
+    )
+    has_holds = bool(held)
+    for key, stock_id in stock_ids.items():
+        shortfall = targets[key] - held.pop(stock_id, 0)
+        if shortfall > 0:
+            take_stock(stock_id, shortfall, key)
+        elif shortfall < 0:
+            return_stock(stock_id, -shortfall)
+    # Holds left over belong to lines that are no longer in the cart
+    for stock_id, quantity in held.items():
+        return_stock(stock_id, quantity)
+    if has_holds:
+        StockReservation.objects.filter(cart=cart).delete()
+
+
+def release_reservations(reservations, batch_size=RELEASE_BATCH_SIZE):
+    """Hand the held units back to stock and delete the holds, a batch per transaction.
+
+    Each batch is one UPDATE over the affected Stock rows (summing their
+    holds in a subquery) and one DELETE, however many carts it covers.
+    """
+    released = 0
+    while True:
+        with transaction.atomic():
+            ids = list(reservations.select_for_update().values_list('id', flat=True)[:batch_size])
+            if not ids:
+                return released
+            batch = StockReservation.objects.filter(id__in=ids)
+            if Stock.objects.filter(id__in=batch.values('stock_id'), quantity=0).exists():
+                _availability_changed()
+            held = (
+                batch.filter(stock_id=OuterRef('pk')).values('stock_id')
+                .annotate(total=Sum('quantity')).values('total')
+            )
+            Stock.objects.filter(id__in=batch.values('stock_id')).update(
+                quantity=F('quantity') + Subquery(held)
+            )
+            batch.delete()
+        released += len(ids)
+
+
+def release_expired_reservations(now=None, batch_size=RELEASE_BATCH_SIZE):
+    return release_reservations(
+        StockReservation.objects.filter(expires_at__lte=now or timezone.now()), batch_size
+    )
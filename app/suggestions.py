@@ -0,0 +1,187 @@
+import threading
+from bisect import bisect_left, insort
+
+from asgiref.sync import sync_to_async
+
+from .background import rebuild_in_background
+from .counters import aget_counter, get_counter, increment_counter
+from .models import Product
+from .search import normalize_query
+
+
+# Shared counter bumped on every product change, so other workers know to reload
+SUGGESTIONS_VERSION = 'suggestions'
+SUGGESTIONS_LIMIT = 8
+# Answers memoized per normalized prefix; cleared whenever the index changes
+RESULT_CACHE_SIZE = 1024
+
+
+def normalize_prefix(query):
+    """Normalize a typed query the same way product names are indexed"""
+    return ' '.join(normalize_query(query))
+
+
+def _phrase_keys(text):
+    """Every word-start suffix of a phrase, so 'air ma' and 'max' both hit 'Air Max 90'"""
+    tokens = normalize_query(text)
+    return [' '.join(tokens[i:]) for i in range(len(tokens))]
+
+
+class SuggestionIndex:
+    """Per-process sorted-array prefix index over product and category names.
+
+    Edits made in this process are applied in place. Changes made by other
+    processes are picked up by a background reload, and until it finishes
+    the current index keeps answering.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._keys = []  # sorted (key, -product_id) pairs, newest product first within a key
+        self._product_keys = {}
+        self._payloads = {}
+        self._category_products = {}
+        self._results = {}
+
+    def _current_version(self):
+        return get_counter(SUGGESTIONS_VERSION)
+
+    def _bump_version(self, stay_current=True):
+        """Announce a change to other processes; stay current only if no one else changed it meanwhile"""
+        version = increment_counter(SUGGESTIONS_VERSION)
+        if stay_current and self._version is not None and version == self._version + 1:
+            self._version = version
+
+    def _rows(self):
+        return Product.objects.values('id', 'name', 'slug', 'category_id', 'category__name')
+
+    def load(self):
+        """Rebuild the whole index from the database"""
+        version = self._current_version()
+        self._install(version, self._rows().iterator(chunk_size=2000))
+
+    def _install(self, version, rows):
+        keys = []
+        product_keys = {}
+        payloads = {}
+        category_products = {}
+        for row in rows:
+            product_id = row['id']
+            entries = [(key, -product_id) for key in self._keys_for(row['name'], row['category__name'])]
+            keys.extend(entries)
+            product_keys[product_id] = entries
+            payloads[product_id] = {
+                'name': row['name'],
+                'category': row['category__name'],
+                'slug': row['slug']
+            }
+            category_products.setdefault(row['category_id'], set()).add(product_id)
+        keys.sort()
+
+        with self._lock:
+            self._keys = keys
+            self._product_keys = product_keys
+            self._payloads = payloads
+            self._category_products = category_products
+            self._results = {}
+            self._version = version
+
+    def _keys_for(self, name, category_name):
+        return set(_phrase_keys(name)) | set(_phrase_keys(category_name))
+
+    def _remove_locked(self, product_id):
+        for entry in self._product_keys.pop(product_id, []):
+            position = bisect_left(self._keys, entry)
+            if position < len(self._keys) and self._keys[position] == entry:
+                del self._keys[position]
+        self._payloads.pop(product_id, None)
+        for product_ids in self._category_products.values():
+            product_ids.discard(product_id)
+
+    def _add_locked(self, product_id, name, slug, category_id, category_name):
+        entries = [(key, -product_id) for key in self._keys_for(name, category_name)]
+        for entry in entries:
+            insort(self._keys, entry)
+        self._product_keys[product_id] = entries
+        self._payloads[product_id] = {'name': name, 'category': category_name, 'slug': slug}
+        self._category_products.setdefault(category_id, set()).add(product_id)
+
+    def update_product(self, product):
+        with self._lock:
+            if self._version is not None:
+                self._remove_locked(product.id)
+                self._add_locked(product.id, product.name, product.slug,
+                                 product.category_id, product.category.name)
+                self._results = {}
+            self._bump_version()
+
+    def remove_product(self, product_id):
+        with self._lock:
+            if self._version is not None:
+                self._remove_locked(product_id)
+                self._results = {}
+            self._bump_version()
+
+    def rename_category(self, category):
+        with self._lock:
+            if self._version is not None:
+                for product_id in list(self._category_products.get(category.id, ())):
+                    payload = self._payloads[product_id]
+                    self._remove_locked(product_id)
+                    self._add_locked(product_id, payload['name'], payload['slug'],
+                                     category.id, category.name)
+                self._results = {}
+            self._bump_version()
+
+    def invalidate(self):
+        """Make every process reload from the database, e.g. after a bulk import skipped the signals"""
+        with self._lock:
+            self._bump_version(stay_current=False)
+
+    def suggest(self, prefix, limit=SUGGESTIONS_LIMIT):
+        """Return up to `limit` suggestion payloads whose name or category starts with the prefix"""
+        if not prefix:
+            return []
+        if self._version is None:
+            self.load()
+        elif self._version != self._current_version():
+            rebuild_in_background('suggestions', self.load)
+        return self._lookup(prefix, limit)
+
+    async def asuggest(self, prefix, limit=SUGGESTIONS_LIMIT):
+        """suggest() for async views; only loading the index leaves the event loop"""
+        if not prefix:
+            return []
+        if self._version is None:
+            await sync_to_async(self.load)()
+        elif self._version != await aget_counter(SUGGESTIONS_VERSION):
+            # Inline when BACKGROUND_REBUILDS is off, so it needs a thread too
+            await sync_to_async(rebuild_in_background)('suggestions', self.load)
+        return self._lookup(prefix, limit)
+
+    def _lookup(self, prefix, limit):
+        results = self._results.get(prefix)
+        if results is not None:
+            return results
+
+        with self._lock:
+            results = []
+            seen = set()
+            position = bisect_left(self._keys, (prefix,))
+            while position < len(self._keys) and len(results) < limit:
+                key, negative_id = self._keys[position]
+                if not key.startswith(prefix):
+                    break
+                product_id = -negative_id
+                if product_id not in seen:
+                    seen.add(product_id)
+                    results.append(self._payloads[product_id])
+                position += 1
+
+            if len(self._results) >= RESULT_CACHE_SIZE:
+                self._results = {}
+            self._results[prefix] = results
+        return results
+
+suggestion_index = SuggestionIndex()
@@ -0,0 +1,11 @@
+from django import template
+
+from ..product_cards import render_product_cards
+
+register = template.Library()
+
+
+@register.simple_tag
+def product_cards(products, template_name):
+    """Render a product card template for each product, served from the card fragment cache"""
+    return render_product_cards(products, template_name)
@@ -0,0 +1,52 @@
+from django import template
+from django.core.files.storage import default_storage
+from django.utils.html import format_html, format_html_join
+
+from ..images import (
+    RENDITION_FORMATS, RENDITION_WIDTHS, available_formats, has_renditions,
+    placeholder_name, rendition_name,
+)
+
+register = template.Library()
+
+
+def _srcset(storage, name, ext):
+    return ', '.join(
+        f'{storage.url(rendition_name(name, width, ext))} {width}w' for width in RENDITION_WIDTHS
+    )
+
+
+@register.simple_tag
+def responsive_image(image, alt='', sizes='100vw', css_class='', loading='lazy'):
+    """Render an image as <picture> with AVIF/WebP/JPEG srcsets, falling back to the original"""
+    if not image:
+        return ''
+    # Accept both ImageField files and plain stored names (e.g. from the navigation tree)
+    name = getattr(image, 'name', image)
+    storage = getattr(image, 'storage', default_storage)
+    if not name:
+        return ''
+
+    if not has_renditions(name, storage):
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" loading="{}" decoding="async">',
+            storage.url(name), alt, css_class, loading
+        )
+
+    sources = format_html_join(
+        '', '<source type="{}" srcset="{}" sizes="{}">',
+        (
+            (RENDITION_FORMATS[ext]['mime'], _srcset(storage, name, ext), sizes)
+            for ext in available_formats() if ext != 'jpg'
+        )
+    )
+    # display: contents keeps the <img> laid out as if it were the direct child
+    return format_html(
+        '<picture style="display: contents">{}'
+        '<img src="{}" srcset="{}" sizes="{}" alt="{}" class="{}" loading="{}" decoding="async" '
+        'style="background: url({}) center / cover no-repeat"></picture>',
+        sources,
+        storage.url(rendition_name(name, RENDITION_WIDTHS[1], 'jpg')),
+        _srcset(storage, name, 'jpg'), sizes, alt, css_class, loading,
+        storage.url(placeholder_name(name))
+    )
@@ -1,3 +1,932 @@
-from django.test import TestCase
+import csv
+import json
+import os
+import pstats
+import tempfile
+from datetime import timedelta
+from io import BytesIO, StringIO
+from types import ModuleType
+from unittest import mock
+from xml.etree import ElementTree
 
-# Create your tests here.
+from asgiref.sync import iscoroutinefunction
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.models import Session
+from django.core.cache import cache, caches
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.http import HttpResponse, QueryDict
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLPattern, resolve, reverse
+from django.utils import timezone
+from PIL import Image
+
+from . import product_cards, urls, views
+from .benchmarks import (
+    CHECKOUT_FORM, ROUTE_REQUESTS, fill_cart, find_regressions, load_baseline, measure_checkout,
+    measure_routes, seed_catalog,
+)
+from .cart import CART_COUNT_SESSION_KEY, CartBatchError, add_cart_line, apply_cart_operations
+from .catalog_import import CatalogImporter
+from .counters import get_counter
+from .facets import FACET_VERSION, PRICE_BANDS, FacetIndex, parse_filters
+from .images import RENDITIONS_TIMEOUT, generate_renditions, has_renditions, placeholder_name, rendition_name
+from .metrics import registry
+from .models import Cart, CartItem, Category, Order, Product, SharedCounter, Size, Stock, StockReservation
+from .navigation import NAVIGATION_VERSION, get_navigation_tree, get_navigation_version
+from .page_cache import PAGE_CACHE_ALIAS, cached_page
+from .page_weight import page_weights
+from .pagination import keyset_page, parse_cursor
+from .profiling import PROFILE_RATE_LIMIT, profile_path
+from .query_plans import audit_routes
+from .search import rebuild_search_index, search_products_queryset
+from .stock import RESERVATION_TTL, release_expired_reservations, return_stock, take_stock
+from .suggestions import SUGGESTIONS_VERSION, SuggestionIndex, normalize_prefix, suggestion_index
+from .urls import ASYNC_JSON_VIEWS
+from .views import HOME_SLIDER_SIZE
+
+
+class RouteBenchmarkTests(TestCase):
+    """Query budgets for every route, checked against benchmarks/route_baseline.json"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_every_route_is_benchmarked(self):
+        names = {
+            pattern.name for pattern in urls.urlpatterns
+            if isinstance(pattern, URLPattern) and pattern.name
+        }
+        self.assertEqual(names, set(ROUTE_REQUESTS))
+
+    def test_routes_within_baseline(self):
+        fixture = seed_catalog(100)
+        results = measure_routes(fixture, repeat=1)
+        for name, result in results.items():
+            self.assertLess(result['status'], 500, name)
+        # Wall time is too noisy for CI; the management command checks it
+        regressions = find_regressions(results, load_baseline().get('100', {}), check_time=False)
+        self.assertEqual(regressions, [])
+
+    def test_query_counts_do_not_grow_with_catalog(self):
+        fixture = seed_catalog(40)
+        small = measure_routes(fixture, repeat=1)
+
+        extra = []
+        categories = list(Category.objects.all())
+        for number in range(160):
+            category = categories[number % len(categories)]
+            extra.append(Product(
+                category=category,
+                name=f'{category.name} Extra {number}',
+                slug=f'{category.slug}-extra-{number}',
+                price=999,
+                image='products/benchmark.jpg',
+                description='Extra synthetic product.'
+            ))
+        Product.objects.bulk_create(extra)
+        rebuild_search_index()
+        cache.clear()
+        large = measure_routes(fixture, repeat=1)
+
+        for name in ROUTE_REQUESTS:
+            self.assertEqual(large[name]['queries'], small[name]['queries'], name)
+
+    def test_home_sliders_are_bounded(self):
+        seed_catalog(HOME_SLIDER_SIZE * 4)
+        response = self.client.get(reverse('home'))
+        self.assertEqual(len(response.context['all_products']), HOME_SLIDER_SIZE)
+        self.assertEqual(len(response.context['footwear_products']), HOME_SLIDER_SIZE)
+
+    def test_checkout_queries_do_not_grow_with_cart(self):
+        fixture = seed_catalog(60)
+        results = measure_checkout(fixture, line_counts=(1, 30), repeat=1)
+        self.assertEqual(results[1]['queries'], results[30]['queries'])
+
+
+class QueryPlanTests(TestCase):
+
+    def test_no_route_scans_a_growing_table(self):
+        fixture = seed_catalog(100)
+        Cart.objects.bulk_create(Cart(session_key=f'audit-{number}') for number in range(100))
+        findings = audit_routes(fixture, min_rows=50)
+        unexpected = [f"{finding['route']}: {finding['plan']}" for finding in findings if not finding['expected']]
+        self.assertEqual(unexpected, [])
+
+
+class NavigationTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        seed_catalog(10)
+
+    def test_invalidation_from_another_process_rebuilds_the_tree(self):
+        tree = get_navigation_tree()
+        category = Category.objects.order_by('id').first()
+        # Another worker renames a category: none of this process's signals
+        # run, only the shared version counter moves
+        Category.objects.filter(id=category.id).update(name='Renamed')
+        self.assertIs(get_navigation_tree(), tree)
+        SharedCounter.objects.filter(name=NAVIGATION_VERSION).update(value=F('value') + 1)
+
+        names = [node['name'] for node in get_navigation_tree()['categories']]
+        self.assertIn('Renamed', names)
+
+    def test_saving_a_category_bumps_the_shared_version(self):
+        version = get_navigation_version()
+        Category.objects.order_by('id').first().save()
+        self.assertEqual(SharedCounter.objects.get(name=NAVIGATION_VERSION).value, version + 1)
+
+
+class SearchTests(TestCase):
+
+    def setUp(self):
+        self.tops = Category.objects.create(name='Tops')
+        self.tshirt = Product.objects.create(
+            category=self.tops, name='Classic T-Shirt', price=799, image='products/tee.jpg',
+            description='Heavy cotton'
+        )
+        self.polo = Product.objects.create(
+            category=self.tops, name='Pique Polo', price=1299, image='products/polo.jpg',
+            description='Classic collar'
+        )
+
+    def search(self, query):
+        return list(search_products_queryset(query).values_list('id', flat=True))
+
+    def test_hyphens_fold_either_way(self):
+        for query in ('tshirt', 'T-Shirt', 't shirt', 'TSHIRT'):
+            self.assertEqual(self.search(query), [self.tshirt.id], query)
+
+    def test_every_token_must_match_as_a_prefix(self):
+        self.assertCountEqual(self.search('clas'), [self.polo.id, self.tshirt.id])
+        self.assertEqual(self.search('classic cott'), [self.tshirt.id])
+        self.assertEqual(self.search('classic linen'), [])
+        self.assertEqual(self.search('--'), [])
+
+    def test_name_matches_outrank_description_matches(self):
+        self.assertEqual(self.search('classic'), [self.tshirt.id, self.polo.id])
+
+    def test_ranked_results_page_by_rank_then_id(self):
+        for number in range(3):
+            Product.objects.create(category=self.tops, name=f'Classic Tee {number}', price=499,
+                                   image='products/tee.jpg')
+        ranked = self.search('classic')
+        pages, cursor = [], None
+        while True:
+            page, cursor = keyset_page(search_products_queryset('classic'), cursor, page_size=2)
+            pages += [product.id for product in page]
+            if cursor is None:
+                break
+            cursor = parse_cursor(RequestFactory().get('/', {'cursor': cursor}))
+        self.assertEqual(pages, ranked)
+        self.assertEqual(ranked[-1], self.polo.id)
+
+    def test_index_follows_edits(self):
+        self.tops.name = 'Upper-Wear'
+        self.tops.save()
+        self.assertEqual(self.search('upperwear'), [self.polo.id, self.tshirt.id])
+        self.polo.name = 'Pique Henley'
+        self.polo.save()
+        self.assertEqual(self.search('henley'), [self.polo.id])
+        self.polo.delete()
+        self.assertEqual(self.search('pique'), [])
+
+
+class SuggestionTests(TestCase):
+
+    def setUp(self):
+        self.index = SuggestionIndex()
+        self.shoes = Category.objects.create(name='Sneakers')
+        self.old = Product.objects.create(category=self.shoes, name='Air Max 90', price=9999, image='products/a.jpg')
+        self.new = Product.objects.create(category=self.shoes, name='Air-Force 1', price=8999, image='products/b.jpg')
+
+    def names(self, query):
+        return [payload['name'] for payload in self.index.suggest(normalize_prefix(query))]
+
+    def test_prefixes_match_at_every_word_start_newest_first(self):
+        self.assertEqual(self.names('AIR'), ['Air-Force 1', 'Air Max 90'])
+        self.assertEqual(self.names('max'), ['Air Max 90'])
+        self.assertEqual(self.names('air-fo'), ['Air-Force 1'])
+        self.assertEqual(self.names('sneak'), ['Air-Force 1', 'Air Max 90'])
+        self.assertEqual(self.names(''), [])
+
+    def test_changes_in_this_process_apply_in_place(self):
+        self.names('air')
+        self.new.name = 'Court Vision'
+        self.new.save()
+        self.assertEqual(self.names('air'), ['Air Max 90'])
+        self.assertEqual(self.names('court'), ['Court Vision'])
+
+    def test_changes_from_another_process_reload_in_the_background(self):
+        self.names('air')
+        # Another worker renames a product: only the shared counter tells this one
+        Product.objects.filter(id=self.old.id).update(name='Renamed')
+        SharedCounter.objects.filter(name=SUGGESTIONS_VERSION).update(value=F('value') + 1)
+
+        with self.settings(BACKGROUND_REBUILDS=True), mock.patch('app.background.threading.Thread') as thread:
+            # The stale index keeps answering while one reload is started
+            self.assertEqual(self.names('air'), ['Air-Force 1', 'Air Max 90'])
+            self.assertEqual(self.names('air'), ['Air-Force 1', 'Air Max 90'])
+        thread.assert_called_once()
+        self.assertEqual(thread.return_value.start.call_count, 1)
+
+        target, args = thread.call_args.kwargs['target'], thread.call_args.kwargs['args']
+        with mock.patch('app.background.connections'):
+            target(*args)
+        self.assertEqual(self.names('air'), ['Air-Force 1'])
+        self.assertEqual(self.names('renamed'), ['Renamed'])
+
+
+class CartLineTests(TestCase):
+
+    def setUp(self):
+        self.fixture = seed_catalog(10)
+        self.cart = Cart.objects.create(user=self.fixture['user'])
+
+    def test_repeated_adds_accumulate_on_one_line(self):
+        for quantity in (1, 2, 3):
+            add_cart_line(self.cart, self.fixture['product'], size=self.fixture['size'], quantity=quantity)
+        add_cart_line(self.cart, self.fixture['footwear_product'], shoe_size=self.fixture['shoe_size'])
+        add_cart_line(self.cart, self.fixture['footwear_product'], shoe_size=self.fixture['shoe_size'])
+
+        lines = {item.product_id: item.quantity for item in self.cart.items.all()}
+        self.assertEqual(lines, {self.fixture['product'].id: 6, self.fixture['footwear_product'].id: 2})
+
+    def test_duplicate_lines_are_rejected(self):
+        add_cart_line(self.cart, self.fixture['product'], size=self.fixture['size'])
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            CartItem.objects.create(cart=self.cart, product=self.fixture['product'], size=self.fixture['size'])
+
+    def test_batch_applies_all_operations_or_none(self):
+        product, size = self.fixture['product'], self.fixture['size']
+        footwear, shoe_size = self.fixture['footwear_product'], self.fixture['shoe_size']
+        add_cart_line(self.cart, product, size=size, quantity=2)
+        add_cart_line(self.cart, footwear, shoe_size=shoe_size)
+        clothing_line, footwear_line = self.cart.items.order_by('id')
+
+        with self.assertRaises(CartBatchError):
+            apply_cart_operations(self.cart, [
+                {'op': 'remove', 'item_id': footwear_line.id},
+                {'op': 'add', 'product_id': footwear.id, 'size_id': size.id},
+            ])
+        self.assertEqual(self.cart.items.count(), 2)
+
+        items = apply_cart_operations(self.cart, [
+            {'op': 'update', 'item_id': clothing_line.id, 'quantity': 5},
+            {'op': 'add', 'product_id': product.id, 'size_id': size.id, 'quantity': 1},
+            {'op': 'remove', 'item_id': footwear_line.id},
+        ])
+        self.assertEqual(items, {clothing_line.id: 6})
+        self.assertEqual(list(self.cart.items.values_list('id', 'quantity')), [(clothing_line.id, 6)])
+
+
+class CartViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.fixture = seed_catalog(10)
+        self.client.force_login(self.fixture['user'])
+
+    def post(self, path, data):
+        return self.client.post(path, json.dumps(data), content_type='application/json').json()
+
+    def test_cart_endpoints_keep_lines_and_totals_in_step(self):
+        product, size = self.fixture['product'], self.fixture['size']
+        for _ in range(2):
+            added = self.post('/add-to-cart/', {'product_id': product.id, 'size_id': size.id})
+        self.assertEqual(added['cart_total_items'], 2)
+        line = CartItem.objects.get(cart__user=self.fixture['user'])
+        self.assertEqual(line.quantity, 2)
+
+        updated = self.post('/update-cart-item/', {'item_id': line.id, 'quantity': 5})
+        self.assertEqual((updated['total_items'], updated['subtotal']), (5, float(product.price * 5)))
+        self.assertEqual(self.client.get('/cart/count/').json()['cart_total_items'], 5)
+
+        removed = self.post('/remove-cart-item/', {'item_id': line.id})
+        self.assertEqual(removed['total_items'], 0)
+        self.assertFalse(CartItem.objects.exists())
+        self.assertEqual(self.client.get('/cart/count/').json()['cart_total_items'], 0)
+
+    def test_count_is_kept_in_the_session(self):
+        self.post('/add-to-cart/', {
+            'product_id': self.fixture['product'].id, 'size_id': self.fixture['size'].id, 'quantity': 3,
+        })
+        # Another worker has none of this one's cache
+        cache.clear()
+        self.assertEqual(self.client.session[CART_COUNT_SESSION_KEY][1], 3)
+        self.assertEqual(self.client.get('/cart/count/').json()['cart_total_items'], 3)
+
+    def test_logging_in_recounts_for_the_users_cart(self):
+        self.client.logout()
+        self.post('/add-to-cart/', {'product_id': self.fixture['product'].id, 'size_id': self.fixture['size'].id})
+        self.assertEqual(self.client.get('/cart/count/').json()['cart_total_items'], 1)
+
+        self.client.force_login(self.fixture['user'])
+        self.assertEqual(self.client.get('/cart/count/').json()['cart_total_items'], 0)
+
+    def test_clothing_needs_a_size(self):
+        response = self.post('/add-to-cart/', {'product_id': self.fixture['product'].id})
+        self.assertFalse(response['success'])
+        self.assertFalse(CartItem.objects.exists())
+
+
+# app.urls with the JSON endpoints routed to their async views, as settings.ASYNC_VIEWS does
+ASYNC_VIEWS_URLCONF = ModuleType('async_views_urls')
+ASYNC_VIEWS_URLCONF.urlpatterns = [
+    URLPattern(pattern.pattern, getattr(views, f'a{pattern.name}'), name=pattern.name)
+    if pattern.name in ASYNC_JSON_VIEWS else pattern
+    for pattern in urls.urlpatterns
+]
+
+
+@override_settings(ROOT_URLCONF=ASYNC_VIEWS_URLCONF)
+class AsyncCartViewTests(CartViewTests):
+    """CartViewTests against the async views"""
+
+    def test_every_json_endpoint_is_async(self):
+        for name in ASYNC_JSON_VIEWS:
+            self.assertTrue(iscoroutinefunction(resolve(reverse(name)).func), name)
+
+    async def test_cart_endpoints_under_asgi(self):
+        await self.async_client.aforce_login(self.fixture['user'])
+        product, size = self.fixture['product'], self.fixture['size']
+        added = await self.async_client.post('/add-to-cart/', {'product_id': product.id, 'size_id': size.id},
+                                             content_type='application/json')
+        self.assertEqual(added.json()['cart_total_items'], 1)
+        count = await self.async_client.get('/cart/count/')
+        self.assertEqual(count.json()['cart_total_items'], 1)
+
+    def test_suggestions(self):
+        product = self.fixture['product']
+        suggestions = self.client.get('/search/suggestions/', {'q': product.name[:4]}).json()
+        self.assertIn(product.name, [suggestion['name'] for suggestion in suggestions])
+
+
+class CheckoutTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.fixture = seed_catalog(20)
+        self.client.force_login(self.fixture['user'])
+
+    def test_checkout_records_order_with_price_snapshot(self):
+        fill_cart(self.fixture, lines=3)
+        cart = Cart.objects.get(user=self.fixture['user'])
+        expected_total = cart.get_totals()['total_price']
+
+        response = self.client.post('/process-checkout/', CHECKOUT_FORM)
+        self.assertTrue(response.json()['success'])
+
+        order = Order.objects.get(id=response.json()['order_id'])
+        self.assertEqual(order.total_items, 6)
+        self.assertEqual(order.total_price, expected_total)
+        self.assertEqual(order.lines.count(), 3)
+        self.assertFalse(cart.items.exists())
+
+        line = order.lines.select_related('product').first()
+        paid_price = line.unit_price
+        line.product.price += 100
+        line.product.save()
+        line.refresh_from_db()
+        self.assertEqual(line.unit_price, paid_price)
+        self.assertEqual(line.size_name, self.fixture['size'].name)
+
+    def test_failed_checkout_leaves_cart_and_profile_untouched(self):
+        fill_cart(self.fixture, lines=2)
+        response = self.client.post('/process-checkout/', dict(CHECKOUT_FORM, paymentMethod=''))
+        self.assertFalse(response.json()['success'])
+        self.assertEqual(CartItem.objects.count(), 2)
+        self.assertFalse(Order.objects.exists())
+
+
+class StockTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.fixture = seed_catalog(10)
+        self.client.force_login(self.fixture['user'])
+        self.stock = Stock.objects.get(product=self.fixture['product'], size=self.fixture['size'])
+        self.stock.quantity = 2
+        self.stock.save()
+
+    def add(self, quantity):
+        return self.client.post('/add-to-cart/', json.dumps({
+            'product_id': self.fixture['product'].id, 'size_id': self.fixture['size'].id,
+            'quantity': quantity,
+        }), content_type='application/json').json()
+
+    def test_add_to_cart_cannot_hold_more_than_is_left(self):
+        self.assertTrue(self.add(2)['success'])
+        self.assertFalse(self.add(1)['success'])
+        self.stock.refresh_from_db()
+        self.assertEqual(self.stock.quantity, 0)
+        self.assertEqual(CartItem.objects.get().quantity, 2)
+
+    def test_expired_holds_go_back_on_sale(self):
+        self.add(2)
+        self.assertEqual(release_expired_reservations(), 0)
+        later = timezone.now() + RESERVATION_TTL + timedelta(seconds=1)
+        self.assertEqual(release_expired_reservations(now=later), 1)
+        self.stock.refresh_from_db()
+        self.assertEqual(self.stock.quantity, 2)
+        self.assertFalse(StockReservation.objects.exists())
+
+    def test_checkout_with_lapsed_hold_needs_stock_left(self):
+        self.add(2)
+        release_expired_reservations(now=timezone.now() + RESERVATION_TTL * 2)
+        Stock.objects.filter(id=self.stock.id).update(quantity=1)
+
+        response = self.client.post('/process-checkout/', CHECKOUT_FORM).json()
+        self.assertFalse(response['success'])
+        self.assertFalse(Order.objects.exists())
+        self.assertEqual(CartItem.objects.get().quantity, 2)
+
+        Stock.objects.filter(id=self.stock.id).update(quantity=3)
+        self.assertTrue(self.client.post('/process-checkout/', CHECKOUT_FORM).json()['success'])
+        self.stock.refresh_from_db()
+        self.assertEqual(self.stock.quantity, 1)
+
+
+class SQLiteConnectionTests(TestCase):
+
+    def test_new_connections_get_the_configured_pragmas(self):
+        # synchronous reads back as a number; NORMAL is 1
+        expected = {'busy_timeout': 5000, 'cache_size': -20000, 'synchronous': 1}
+        with connection.cursor() as cursor:
+            for pragma, value in expected.items():
+                cursor.execute(f'PRAGMA {pragma}')
+                self.assertEqual(cursor.fetchone()[0], value)
+
+
+class CatalogImportTests(TestCase):
+
+    def catalog_file(self, suffix, content):
+        with tempfile.NamedTemporaryFile('w', suffix=suffix, delete=False) as catalog_file:
+            catalog_file.write(content)
+        self.addCleanup(os.remove, catalog_file.name)
+        return catalog_file.name
+
+    def import_catalog(self, suffix, content):
+        stderr = StringIO()
+        call_command('import_catalog', self.catalog_file(suffix, content), '--skip-renditions',
+                     stdout=StringIO(), stderr=stderr)
+        return stderr.getvalue()
+
+    def test_import_then_reimport_updates_in_place(self):
+        errors = self.import_catalog('.csv', (
+            'name,category,head_category,price,image,sizes,shoe_sizes,stock\n'
+            'Night Bomber,Jacket,Clothing,2999,products/bomber.jpg,S|M,,5\n'
+            'Court Low,Sneakers,Footwear,4599,products/court.jpg,,8|9,3\n'
+            'No Price,Jacket,Clothing,abc,products/x.jpg,S,,1\n'
+        ))
+        self.assertIn('line 4', errors)
+        bomber = Product.objects.get(slug='night-bomber')
+        self.assertEqual(sorted(bomber.available_sizes.values_list('name', flat=True)), ['M', 'S'])
+        self.assertEqual(Product.objects.get(slug='court-low').category.head_category.name, 'Footwear')
+        self.assertEqual(Stock.objects.filter(product=bomber, quantity=5).count(), 2)
+        self.assertEqual(list(search_products_queryset('bomber').values_list('id', flat=True)), [bomber.id])
+
+        self.import_catalog('.jsonl', json.dumps({
+            'name': 'Night Bomber', 'category': 'Jacket', 'price': '2499', 'image': 'products/bomber.jpg',
+            'sizes': ['L'], 'stock': 7,
+        }) + '\n')
+        self.assertEqual(Product.objects.count(), 2)
+        bomber.refresh_from_db()
+        self.assertEqual(bomber.price, 2499)
+        self.assertEqual(list(bomber.available_sizes.values_list('name', flat=True)), ['L'])
+        self.assertEqual(Stock.objects.get(product=bomber, size__name='L').quantity, 7)
+
+    def test_malformed_jsonl_lines_are_rejected_one_by_one(self):
+        errors = self.import_catalog('.jsonl', '\n'.join([
+            json.dumps({'name': 'Rain Shell', 'category': 'Outerwear', 'price': '3999'}),
+            '{"name": "Broken',
+            '["not", "an", "object"]',
+            json.dumps({'name': 'Trail Vest', 'category': 'Outerwear', 'price': '1999', 'sizes': 5}),
+            json.dumps({'name': 'Fleece', 'category': 'Outerwear', 'price': '2499'}),
+        ]) + '\n')
+        for line in (2, 3, 4):
+            self.assertIn(f'line {line}:', errors)
+        self.assertEqual(sorted(Product.objects.values_list('slug', flat=True)), ['fleece', 'rain-shell'])
+
+    def test_a_failed_import_still_indexes_the_batches_it_committed(self):
+        write_batch = CatalogImporter.write_batch
+        calls = []
+
+        def fail_second_batch(importer, rows):
+            calls.append(rows)
+            if len(calls) == 2:
+                raise RuntimeError('disk full')
+            return write_batch(importer, rows)
+
+        rows = ''.join(f'Rain Shell {number},Outerwear,3999,\n' for number in range(3))
+        with mock.patch.object(CatalogImporter, 'write_batch', fail_second_batch):
+            with self.assertRaises(RuntimeError):
+                call_command('import_catalog', self.catalog_file('.csv', 'name,category,price,image\n' + rows),
+                             '--skip-renditions', '--batch-size', '2', stdout=StringIO(), stderr=StringIO())
+        self.assertEqual(len(search_products_queryset('rain shell')), 2)
+        self.assertEqual(len(suggestion_index.suggest('rain')), 2)
+
+    def test_import_moves_the_versions_every_worker_checks(self):
+        names = (NAVIGATION_VERSION, SUGGESTIONS_VERSION, FACET_VERSION)
+        before = {name: get_counter(name) for name in names}
+        self.import_catalog('.csv', 'name,category,price,image\nRain Shell,Outerwear,3999,products/shell.jpg\n')
+        after = dict(SharedCounter.objects.filter(name__in=names).values_list('name', 'value'))
+        for name in names:
+            self.assertGreater(after[name], before[name], name)
+
+
+class FeedTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.fixture = seed_catalog(25)
+
+    def get_body(self, path, **headers):
+        response = self.client.get(path, headers=headers)
+        return response, b''.join(response.streaming_content).decode() if response.streaming else ''
+
+    @mock.patch('app.feeds.SITEMAP_URLS_PER_SHARD', 10)
+    def test_sitemap_is_sharded_by_id_range(self):
+        _, index = self.get_body('/sitemap.xml')
+        last_shard = -(-Product.objects.order_by('-id').first().id // 10)
+        self.assertIn(f'/sitemap-products-{last_shard}.xml', index)
+        self.assertIn('/sitemap-pages.xml', index)
+
+        urls = 0
+        for shard in range(1, last_shard + 1):
+            _, body = self.get_body(f'/sitemap-products-{shard}.xml')
+            ElementTree.fromstring(body)
+            urls += body.count('<url>')
+        self.assertEqual(urls, Product.objects.count())
+        self.assertEqual(self.client.get(f'/sitemap-products-{last_shard + 1}.xml').status_code, 404)
+
+    def test_feeds_list_every_product_and_honour_if_modified_since(self):
+        response, body = self.get_body('/feeds/products.csv')
+        rows = list(csv.DictReader(StringIO(body)))
+        self.assertEqual(len(rows), Product.objects.count())
+        self.assertEqual(rows[0]['availability'], 'in stock')
+
+        _, body = self.get_body('/feeds/products.xml')
+        self.assertEqual(len(ElementTree.fromstring(body).findall('channel/item')), len(rows))
+
+        not_modified = self.client.get('/feeds/products.csv', headers={
+            'if-modified-since': response['Last-Modified'],
+        })
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_deleting_a_product_moves_last_modified(self):
+        response = self.client.get('/feeds/products.csv')
+        later = timezone.now() + timedelta(hours=1)
+        with mock.patch('app.counters.timezone.now', return_value=later):
+            Product.objects.order_by('id').first().delete()
+
+        response = self.client.get('/feeds/products.csv', headers={
+            'if-modified-since': response['Last-Modified'],
+        })
+        self.assertEqual(response.status_code, 200)
+        rows = list(csv.DictReader(StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(len(rows), Product.objects.count())
+
+    def test_selling_out_and_restocking_move_last_modified(self):
+        product = Product.objects.order_by('id').first()
+        stock = list(Stock.objects.filter(product=product).values_list('id', 'quantity'))
+
+        def availability(since, now, change):
+            with mock.patch('app.counters.timezone.now', return_value=now):
+                change()
+            response = self.client.get('/feeds/products.csv', headers={
+                'if-modified-since': since['Last-Modified'],
+            })
+            self.assertEqual(response.status_code, 200)
+            rows = csv.DictReader(StringIO(b''.join(response.streaming_content).decode()))
+            return response, next(row['availability'] for row in rows if row['id'] == str(product.id))
+
+        response = self.client.get('/feeds/products.csv')
+        response, sold_out = availability(response, timezone.now() + timedelta(hours=1), lambda: [
+            take_stock(stock_id, quantity) for stock_id, quantity in stock
+        ])
+        self.assertEqual(sold_out, 'out of stock')
+        _, restocked = availability(response, timezone.now() + timedelta(hours=2), lambda: return_stock(*stock[0]))
+        self.assertEqual(restocked, 'in stock')
+
+    async def test_feeds_stream_asynchronously_under_asgi(self):
+        response = await self.async_client.get('/feeds/products.csv')
+        self.assertTrue(response.is_async)
+        body = b''.join([chunk async for chunk in response.streaming_content]).decode()
+        self.assertEqual(len(list(csv.DictReader(StringIO(body)))), await Product.objects.acount())
+
+
+class PageCacheTests(TestCase):
+
+    def setUp(self):
+        caches[PAGE_CACHE_ALIAS].clear()
+
+    def rendered(self, path, *args, **kwargs):
+        with mock.patch('app.views.render', wraps=views.render) as render:
+            response = self.client.get(path, *args, **kwargs)
+        return response, render.call_count
+
+    def test_pages_are_cached_by_path_whatever_the_host_or_other_params(self):
+        response, rendered = self.rendered('/faq/', headers={'host': 'localhost'})
+        self.assertEqual(rendered, 1)
+        cached, rendered = self.rendered('/faq/', {'utm_source': 'ad'}, headers={'host': '127.0.0.1'})
+        self.assertEqual(rendered, 0)
+        self.assertEqual(cached.content, response.content)
+
+        not_modified = self.client.get('/faq/', headers={'if-none-match': response['ETag']})
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_whitelisted_params_get_their_own_entry(self):
+        view = mock.Mock(side_effect=lambda request: HttpResponse(request.GET.get('tab', '')))
+        page = cached_page(params=('tab',))(view)
+        factory = RequestFactory()
+
+        def get(params):
+            request = factory.get('/page/', params)
+            request.user = AnonymousUser()
+            return page(request).content
+
+        self.assertEqual(get({'tab': 'a'}), b'a')
+        self.assertEqual(get({'tab': 'b', 'utm_source': 'ad'}), b'b')
+        self.assertEqual(get({'utm_source': 'ad', 'tab': 'a'}), b'a')
+        self.assertEqual(view.call_count, 2)
+
+
+class ImageRenditionTests(TestCase):
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        self.enterContext(self.settings(MEDIA_ROOT=media_root.name))
+        cache.clear()
+        self.category = seed_catalog(1)['category']
+
+    def upload(self, name, color):
+        buffer = BytesIO()
+        Image.new('RGB', (700, 400), color).save(buffer, 'PNG')
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+    def save_category(self):
+        with mock.patch('app.signals.generate_renditions', wraps=generate_renditions) as generate:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.category.save()
+        return generate.call_count
+
+    def test_renditions_follow_the_image_they_were_made_from(self):
+        self.category.image = self.upload('drip.png', 'red')
+        self.assertEqual(self.save_category(), 1)
+        first = self.category.image.name
+        self.assertTrue(default_storage.exists(rendition_name(first, 320, 'jpg')))
+
+        # Saves that leave the image alone do not touch its renditions
+        self.category.name = 'Renamed Category'
+        self.assertEqual(self.save_category(), 0)
+
+        self.category.image = self.upload('drip.jpg', 'blue')
+        self.assertEqual(self.save_category(), 1)
+        second = self.category.image.name
+        self.assertNotEqual(rendition_name(first, 320, 'jpg'), rendition_name(second, 320, 'jpg'))
+        self.assertTrue(has_renditions(second))
+        self.assertFalse(has_renditions(first))
+        self.assertFalse(default_storage.exists(placeholder_name(first)))
+
+    def test_renditions_dropped_by_another_worker_expire_from_the_cache(self):
+        self.category.image = self.upload('drip.png', 'red')
+        self.save_category()
+        name = self.category.image.name
+        self.assertTrue(has_renditions(name))
+
+        # Deleted from storage without this process's cache hearing about it
+        default_storage.delete(placeholder_name(name))
+        self.assertTrue(has_renditions(name))
+        later = timezone.now().timestamp() + RENDITIONS_TIMEOUT + 1
+        with mock.patch('django.core.cache.backends.locmem.time.time', return_value=later):
+            self.assertFalse(has_renditions(name))
+
+
+class PageWeightTests(TestCase):
+
+    def test_pages_link_cacheable_bundles_instead_of_inlining_them(self):
+        cache.clear()
+        pages, assets = page_weights(seed_catalog(10))
+        for name, page in pages.items():
+            self.assertLess(page['html']['raw'], page['inline']['raw'], name)
+        # The navbar and footer ship once for the whole storefront
+        for name in ('home', 'productDetail', 'AllProduct'):
+            self.assertIn('app/css/navbar.css', pages[name]['assets'])
+            self.assertIn('app/css/footer.css', pages[name]['assets'])
+        # Category pages add only the facet filters to what new arrivals link
+        self.assertEqual(pages['newArrival']['assets'],
+                         [path for path in pages['category_products']['assets'] if path != 'app/css/facets.css'])
+        self.assertTrue(all(sizes['gzip'] < sizes['raw'] for sizes in assets.values()))
+
+    async def test_static_files_are_served_under_asgi(self):
+        response = await self.async_client.get('/static/app/css/navbar.css')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/css'))
+
+
+class ProductCardCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        caches['product_cards'].clear()
+        self.fixture = seed_catalog(10)
+
+    def rendered_cards(self, url):
+        with mock.patch('app.product_cards._render_cards', wraps=product_cards._render_cards) as render:
+            response = self.client.get(url)
+        return response, sum(len(call.args[0]) for call in render.call_args_list)
+
+    def test_cards_are_reused_until_their_product_or_category_changes(self):
+        url = reverse('newArrival')
+        self.assertEqual(self.rendered_cards(url)[1], Product.objects.count())
+        self.assertEqual(self.rendered_cards(url)[1], 0)
+
+        product = Product.objects.order_by('-id').first()
+        product.name = 'Renamed Drip'
+        product.save()
+        response, rendered = self.rendered_cards(url)
+        self.assertEqual(rendered, 1)
+        self.assertContains(response, 'Renamed Drip')
+
+        category = product.category
+        category.name = 'Renamed Category'
+        category.save()
+        response, rendered = self.rendered_cards(url)
+        self.assertEqual(rendered, Product.objects.count())
+        self.assertContains(response, 'Renamed Category')
+
+
+class RequestMetricsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        registry.reset()
+        self.fixture = seed_catalog(10)
+
+    def test_sampled_requests_report_server_timing(self):
+        with self.settings(REQUEST_METRICS_SAMPLE_RATE=1), CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('newArrival'))
+        timing = response['Server-Timing']
+        self.assertRegex(timing, r'^db;dur=[\d.]+;desc="\d+ queries", render;dur=[\d.]+, total;dur=[\d.]+$')
+        self.assertIn(f'desc="{len(queries)} queries"', timing)
+
+        with self.settings(REQUEST_METRICS_SAMPLE_RATE=0):
+            self.assertNotIn('Server-Timing', self.client.get(reverse('newArrival')))
+
+    async def test_sampled_requests_are_timed_under_asgi(self):
+        with self.settings(REQUEST_METRICS_SAMPLE_RATE=1):
+            response = await self.async_client.get(reverse('newArrival'))
+        # The sync view ran behind sync_to_async, which carries the request's timings along
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="[1-9]\d* queries", render;dur=[\d.]*[1-9]')
+
+    def test_metrics_are_staff_only_prometheus_text(self):
+        with self.settings(REQUEST_METRICS_SAMPLE_RATE=0):
+            self.client.get(reverse('newArrival'))
+            self.assertEqual(self.client.get(reverse('metrics')).status_code, 302)
+            self.client.force_login(self.fixture['staff'])
+            body = self.client.get(reverse('metrics')).content.decode()
+        labels = 'route="newArrival",method="GET",status="2xx"'
+        self.assertIn(f'dripspace_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1', body)
+        self.assertIn(f'dripspace_http_request_duration_seconds_count{{{labels}}} 1', body)
+        self.assertIn(f'dripspace_http_sampled_requests_total{{{labels}}} 0', body)
+
+
+class ProfilingTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.fixture = seed_catalog(10)
+        self.client.force_login(self.fixture['staff'])
+
+    def test_staff_can_profile_a_request_and_download_the_results(self):
+        response = self.client.get(reverse('home'), {'_profile': '1'})
+        profile_id = response['X-Profile-Id']
+        prof = self.client.get(reverse('profile_download', args=[profile_id, 'prof']))
+        with tempfile.NamedTemporaryFile() as prof_file:
+            prof_file.write(b''.join(prof.streaming_content))
+            prof_file.flush()
+            self.assertTrue(any(func[2] == 'home' for func in pstats.Stats(prof_file.name).stats))
+        sql = b''.join(self.client.get(reverse('profile_download', args=[profile_id, 'sql'])).streaming_content)
+        self.assertIn(b'FROM "app_product"', sql)
+
+        response = self.client.get(reverse('productDetail', args=[self.fixture['product'].slug]),
+                                   headers={'X-Profile': 'sample'})
+        self.assertTrue(profile_path(response['X-Profile-Id'], 'collapsed').exists())
+
+    async def test_requests_are_profiled_under_asgi(self):
+        await self.async_client.aforce_login(self.fixture['staff'])
+        response = await self.async_client.get(reverse('faq'), {'_profile': '1'})
+        # The sync view ran on the profiled thread
+        stats = pstats.Stats(str(profile_path(response['X-Profile-Id'], 'prof'))).stats
+        self.assertTrue(any(func[2] == 'faq' for func in stats))
+
+    def test_profiling_is_staff_only_and_rate_limited(self):
+        self.client.force_login(self.fixture['user'])
+        self.assertNotIn('X-Profile-Id', self.client.get(reverse('faq'), {'_profile': '1'}))
+        self.assertEqual(self.client.get(reverse('profile_download', args=['x', 'sql'])).status_code, 302)
+
+        self.client.force_login(self.fixture['staff'])
+        responses = [self.client.get(reverse('faq'), {'_profile': '1'}) for _ in range(PROFILE_RATE_LIMIT + 1)]
+        self.assertTrue(all('X-Profile-Id' in response for response in responses[:-1]))
+        self.assertIn('X-Profile-Skipped', responses[-1])
+        # The limit is counted in the database, where every process sees it
+        self.assertEqual(SharedCounter.objects.get(name__startswith='profiling:').value, PROFILE_RATE_LIMIT + 1)
+        self.assertEqual(self.client.get(reverse('profile_download', args=['x', 'exe'])).status_code, 404)
+
+
+class FacetTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        # 7 clothing products in S-XL and 3 footwear products in shoe sizes 8-11, priced 499 to 508
+        self.fixture = seed_catalog(10)
+
+    def listing(self, url, params=None):
+        response = self.client.get(url, params or {})
+        groups = {
+            title: {option['label']: option['count'] for option in options}
+            for title, options in response.context['facets'].groups
+        }
+        return response.context['products'], groups
+
+    def test_filters_combine_and_each_facet_counts_without_its_own_filter(self):
+        products, groups = self.listing(reverse('AllProduct'), {'size': ['M', 'XXL', 'bogus']})
+        self.assertEqual(len(products), 7)
+        # A selected size stays listed, so it can be cleared, even with nothing in it
+        self.assertEqual(groups['Size'], {'S': 7, 'M': 7, 'L': 7, 'XL': 7, 'XXL': 0})
+        self.assertEqual(groups['Category'], {'Clothing': 7})
+        self.assertNotIn('Shoe size', groups)
+
+        products, groups = self.listing(reverse('AllProduct'), {'min_price': '500', 'max_price': '505'})
+        self.assertEqual(sorted(product.price for product in products), list(range(500, 505)))
+        self.assertEqual(groups['Category'], {'Clothing': 4, 'Footwear': 1})
+        self.assertEqual(groups['Price'], {'Under ₹1,000': 10})
+
+        products, groups = self.listing(reverse('search_products'), {'q': 'sneakers', 'shoe_size': '9'})
+        self.assertEqual([product.category.name for product in products], ['Sneakers'])
+        self.assertEqual(groups['Shoe size'], {'8': 1, '9': 1, '10': 1, '11': 1})
+        self.assertEqual(groups['Category'], {'Footwear': 1})
+
+    def test_counts_follow_catalog_changes(self):
+        url = reverse('category_products', args=[self.fixture['category'].slug])
+        product = Product.objects.filter(category=self.fixture['category']).first()
+        product.available_sizes.add(Size.objects.get(name='XXL'))
+        product.price = 1500
+        product.save()
+
+        products, groups = self.listing(url, {'size': 'XXL'})
+        self.assertEqual(list(products), [product])
+        self.assertEqual(groups['Price'], {'₹1,000 – ₹2,500': 1})
+        self.assertEqual(groups['Size']['XXL'], 1)
+
+    def test_stale_counts_are_served_while_rebuilding_in_the_background(self):
+        index = FacetIndex()
+        snapshot = index.snapshot()
+        # Another worker reprices a category; only the shared counter tells this one
+        repriced = Product.objects.filter(category=self.fixture['category']).update(price=6000)
+        SharedCounter.objects.filter(name=FACET_VERSION).update(value=F('value') + 1)
+
+        with self.settings(BACKGROUND_REBUILDS=True), mock.patch('app.background.threading.Thread') as thread:
+            self.assertIs(index.snapshot(), snapshot)
+        thread.assert_called_once()
+        with mock.patch('app.background.connections'):
+            thread.call_args.kwargs['target'](*thread.call_args.kwargs['args'])
+
+        rebuilt = index.snapshot()
+        self.assertIsNot(rebuilt, snapshot)
+        counts = rebuilt.counts(rebuilt.everything, parse_filters(QueryDict()))
+        self.assertEqual(counts['price'][len(PRICE_BANDS) - 1], repriced)
+
+
+class AnonymousCartTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.fixture = seed_catalog(10)
+
+    def test_browsing_creates_no_cart_or_session(self):
+        for path in ('/', '/cart/', '/cart/count/'):
+            self.assertEqual(self.client.get(path).status_code, 200)
+        self.assertFalse(Cart.objects.exists())
+        self.assertFalse(Session.objects.exists())
+
+    def test_cart_created_on_first_add_and_purged_with_its_session(self):
+        response = self.client.post('/add-to-cart/', json.dumps({
+            'product_id': self.fixture['product'].id, 'size_id': self.fixture['size'].id,
+        }), content_type='application/json')
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(Cart.objects.filter(user__isnull=True).count(), 1)
+
+        call_command('purge_carts', stdout=StringIO())
+        self.assertEqual(Cart.objects.filter(user__isnull=True).count(), 1)
+
+        Session.objects.all().delete()
+        call_command('purge_carts', stdout=StringIO())
+        self.assertFalse(Cart.objects.filter(user__isnull=True).exists())
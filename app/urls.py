@@ -4,6 +4,16 @@ from django.conf.urls.static import static
 from django.conf import settings
 from django.contrib.auth import views as auth_views
 
+
+# Endpoints with a native async version in views, named a<name>
+ASYNC_JSON_VIEWS = ('search_suggestions', 'get_cart_count', 'add_to_cart', 'update_cart_item', 'remove_cart_item')
+
+
+def json_view(name):
+    """The async version of a JSON endpoint when settings.ASYNC_VIEWS is on, else the sync one"""
+    return getattr(views, f'a{name}' if settings.ASYNC_VIEWS else name)
+
+
 urlpatterns = [
     path('', views.home, name='home'),
     path('login/', views.userLogin, name='login'),
@@ -12,15 +22,16 @@ urlpatterns = [
     path('productInfo/<slug:slug>/', views.productInfo, name='productDetail'),
     path('category/<slug:category_slug>/', views.category_products, name='category_products'),
     path('search/', views.search_products, name='search_products'),
-    path('search/suggestions/', views.search_suggestions, name='search_suggestions'),
+    path('search/suggestions/', json_view('search_suggestions'), name='search_suggestions'),
     path('userProfile/', views.userProfile, name='userProfile'),
     path('cart/', views.view_cart, name='view_cart'),
-    path('cart/count/', views.get_cart_count, name='get_cart_count'),
+    path('cart/count/', json_view('get_cart_count'), name='get_cart_count'),
     path('checkout/', views.checkout, name='checkout'),
     path('process-checkout/', views.process_checkout, name='process_checkout'),
-    path('add-to-cart/', views.add_to_cart, name='add_to_cart'),
-    path('update-cart-item/', views.update_cart_item, name='update_cart_item'),
-    path('remove-cart-item/', views.remove_cart_item, name='remove_cart_item'),
+    path('add-to-cart/', json_view('add_to_cart'), name='add_to_cart'),
+    path('update-cart-item/', json_view('update_cart_item'), name='update_cart_item'),
+    path('remove-cart-item/', json_view('remove_cart_item'), name='remove_cart_item'),
+    path('cart/update/', views.update_cart, name='update_cart'),
 
     #Extra Page URLs
     path('faq/', views.faq, name='faq'),
@@ -40,7 +51,17 @@ urlpatterns = [
 
     #------------ Product URLs -----------------
     path('DripSpace-AllProduct/', views.AllProduct, name='AllProduct'),
-    path('new-arrivals/', views.newArrival, name='newArrival')
+    path('new-arrivals/', views.newArrival, name='newArrival'),
+
+    #------------ Sitemap & Feed URLs -----------------
+    path('sitemap.xml', views.sitemap, name='sitemap'),
+    path('sitemap-pages.xml', views.sitemap_pages, name='sitemap_pages'),
+    path('sitemap-products-<int:shard>.xml', views.sitemap_products, name='sitemap_products'),
+    path('feeds/products.<str:feed_format>', views.product_feed, name='product_feed'),
+
+    #------------ Metrics & Profiling URLs -----------------
+    path('metrics/', views.metrics, name='metrics'),
+    path('profiles/<slug:profile_id>.<str:kind>', views.profile_download, name='profile_download'),
 ]
 
 if settings.DEBUG:
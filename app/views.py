@@ -1,12 +1,34 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect, get_object_or_404, aget_object_or_404
 from . models import CustomUser, HeadCategory, Category, Product, Size, Cart, CartItem, ShoeSize
 from django.contrib.auth.models import AbstractUser
 from django.contrib import messages
-from django.http import JsonResponse
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
+from django.utils.cache import patch_cache_control
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition
+from django.db import transaction
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q
+from django.contrib.admin.views.decorators import staff_member_required
 import json
+import logging
+
+from asgiref.sync import sync_to_async
+
+from . import feeds
+from .cart import (
+    CartBatchError, add_cart_line, aget_cart_item_count, apply_cart_operations, aset_cart_item_count,
+    get_cart_item_count, set_cart_item_count, set_cart_line_quantity,
+)
+from .facets import Facets
+from .metrics import registry
+from .profiling import PROFILE_FILES, profile_path
+from .navigation import get_head_category, get_category
+from .orders import place_order
+from .page_cache import cached_page
+from .pagination import render_product_listing
+from .search import search_products_queryset
+from .stock import OutOfStock
+from .suggestions import suggestion_index, normalize_prefix
 
 from django.contrib.auth import login, logout, authenticate, get_user_model
 # Create your views here.
@@ -14,9 +36,22 @@ from django.contrib.auth import login, logout, authenticate, get_user_model
 
 User = get_user_model()
 
+# Products per home page slider; the rest of the catalog is on the listing pages
+HOME_SLIDER_SIZE = 24
+
+
+def get_cart(request):
+    """Get the cart of the current user or session, or None if nothing was ever added"""
+    if request.user.is_authenticated:
+        return Cart.objects.filter(user=request.user).first()
+    session_key = request.session.session_key
+    if not session_key:
+        return None
+    return Cart.objects.filter(session_key=session_key).first()
+
 
 def get_or_create_cart(request):
-    """Get or create a cart for the current user or session"""
+    """Get or create a cart for the current user or session; only adding to the cart calls this"""
     if request.user.is_authenticated:
         cart, created = Cart.objects.get_or_create(user=request.user)
     else:
@@ -31,8 +66,7 @@ def get_or_create_cart(request):
 def get_cart_count(request):
     """API endpoint to get the current cart item count"""
     try:
-        cart = get_or_create_cart(request)
-        cart_count = cart.get_total_items()
+        cart_count = get_cart_item_count(request)
         return JsonResponse({
             'success': True,
             'cart_total_items': cart_count
@@ -44,62 +78,37 @@ def get_cart_count(request):
         })
 
 
-def get_head_categories():
-    """Helper function to get all head categories with their subcategories"""
-    return HeadCategory.objects.prefetch_related('categories').all()
-
-
-def get_categories():
-    """Helper function to get all categories"""
-    return Category.objects.select_related('head_category').all()
-
-
 def home(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    
     # Get new arrivals (latest 8 products)
     try:
-        new_arrivals = Product.objects.all().order_by('-id')[:8]
+        new_arrivals = Product.objects.select_related('category').order_by('-id')[:8]
     except:
         new_arrivals = []
     
-    # Get all products for the slider (not just 8)
+    # Get the latest products for the slider
     try:
-        all_products = Product.objects.all().order_by('-id')
+        all_products = Product.objects.select_related('category').order_by('-id')[:HOME_SLIDER_SIZE]
     except:
         all_products = []
     
-    # Get footwear categories
+    # Get footwear categories from the cached navigation tree
     footwear_categories = []
     footwear_products = []
-    try:
-        footwear_head_category = HeadCategory.objects.get(name='Footwear')
-        footwear_categories = footwear_head_category.categories.all()
+    footwear_head_category = get_head_category('Footwear')
+    if footwear_head_category:
+        footwear_categories = footwear_head_category['categories']
         # Get footwear products
-        footwear_products = Product.objects.filter(
-            category__in=footwear_categories
-        ).order_by('-id')
-    except HeadCategory.DoesNotExist:
-        footwear_categories = []
-        footwear_products = []
-    except:
-        footwear_categories = []
-        footwear_products = []
-    
+        footwear_products = Product.objects.select_related('category').filter(
+            category_id__in=[category['id'] for category in footwear_categories]
+        ).order_by('-id')[:HOME_SLIDER_SIZE]
+
     # Get Jacket products for the Drip section
     drip_products = []
-    try:
-        jacket_category = Category.objects.get(name='Jacket')
-        drip_products = jacket_category.products.all().order_by('-id')[:8]
-    except Category.DoesNotExist:
-        drip_products = []
-    except:
-        drip_products = []
-    
+    jacket_category = get_category('Jacket')
+    if jacket_category:
+        drip_products = Product.objects.select_related('category').filter(category_id=jacket_category['id']).order_by('-id')[:8]
+
     context = {
-        'categories': categories,
-        'head_categories': head_categories,
         'new_arrivals': new_arrivals,
         'all_products': all_products,  # Add all products for slider
         'footwear_categories': footwear_categories,
@@ -111,9 +120,6 @@ def home(request):
 
 
 def userLogin(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    
     # If user is already authenticated, redirect to home
     if request.user.is_authenticated:
         return redirect('home')
@@ -125,10 +131,7 @@ def userLogin(request):
         # Validate input
         if not username or not password:
             messages.error(request, 'Please provide both username and password.')
-            return render(request, 'app/auth/userLogin.html', {
-                'categories': categories, 
-                'head_categories': head_categories
-            })
+            return render(request, 'app/auth/userLogin.html')
         
         user = authenticate(request, username=username, password=password)
         
@@ -143,16 +146,10 @@ def userLogin(request):
         else:
             messages.error(request, 'Invalid credentials. Please check your username and password and try again.')
     
-    return render(request, 'app/auth/userLogin.html', {
-        'categories': categories, 
-        'head_categories': head_categories
-    })
+    return render(request, 'app/auth/userLogin.html')
 
 
 def userRegister(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    
     # If user is already authenticated, redirect to home
     if request.user.is_authenticated:
         return redirect('home')
@@ -166,38 +163,23 @@ def userRegister(request):
         # Validate input
         if not username or not email or not password or not confirm_password:
             messages.error(request, 'All fields are required')
-            return render(request, 'app/auth/userRegister.html', {
-                'categories': categories, 
-                'head_categories': head_categories
-            })
+            return render(request, 'app/auth/userRegister.html')
             
         if password != confirm_password:
             messages.error(request, 'Passwords do not match')
-            return render(request, 'app/auth/userRegister.html', {
-                'categories': categories, 
-                'head_categories': head_categories
-            })
+            return render(request, 'app/auth/userRegister.html')
             
         if len(password) < 6:
             messages.error(request, 'Password must be at least 6 characters long')
-            return render(request, 'app/auth/userRegister.html', {
-                'categories': categories, 
-                'head_categories': head_categories
-            })
+            return render(request, 'app/auth/userRegister.html')
             
         if User.objects.filter(username=username).exists():
             messages.error(request, 'Username Already Exists')
-            return render(request, 'app/auth/userRegister.html', {
-                'categories': categories, 
-                'head_categories': head_categories
-            })
+            return render(request, 'app/auth/userRegister.html')
             
         if User.objects.filter(email=email).exists():
             messages.error(request, 'Email Already Exists')
-            return render(request, 'app/auth/userRegister.html', {
-                'categories': categories, 
-                'head_categories': head_categories
-            })
+            return render(request, 'app/auth/userRegister.html')
         
         try:
             user = User.objects.create_user(
@@ -222,15 +204,9 @@ def userRegister(request):
                 
         except Exception as e:
             messages.error(request, 'An error occurred during registration. Please try again.')
-            return render(request, 'app/auth/userRegister.html', {
-                'categories': categories, 
-                'head_categories': head_categories
-            })
+            return render(request, 'app/auth/userRegister.html')
         
-    return render(request, 'app/auth/userRegister.html', {
-        'categories': categories, 
-        'head_categories': head_categories
-    })
+    return render(request, 'app/auth/userRegister.html')
 
 
 def userLogout(request):
@@ -242,22 +218,32 @@ def userLogout(request):
 
 def productInfo(request, slug):
     # Get the product by slug or return 404 if not found
-    product = get_object_or_404(Product, slug=slug)
+    product = get_object_or_404(
+        Product.objects.select_related('category__head_category').prefetch_related('images'),
+        slug=slug
+    )
     # Get related products (same category, limit to 4)
-    related_products = Product.objects.filter(category=product.category).exclude(slug=slug)[:4]
-    # Get all possible sizes
-    all_sizes = Size.objects.all().order_by('id')
-    # Get all possible shoe sizes
-    all_shoe_sizes = ShoeSize.objects.all().order_by('size')
-    categories = get_categories()
-    head_categories = get_head_categories()
+    related_products = Product.objects.filter(category=product.category).exclude(slug=slug).select_related('category')[:4]
+    
+    # Build size options with availability resolved up front, instead of
+    # one available_sizes lookup per size in the template
+    if product.is_footwear:
+        available_ids = set(product.available_shoe_sizes.values_list('id', flat=True))
+        size_options = [
+            {'id': shoe_size.id, 'label': shoe_size.size, 'available': shoe_size.id in available_ids}
+            for shoe_size in ShoeSize.objects.all().order_by('size')
+        ]
+    else:
+        available_ids = set(product.available_sizes.values_list('id', flat=True))
+        size_options = [
+            {'id': size.id, 'label': size.name, 'available': size.id in available_ids}
+            for size in Size.objects.all().order_by('id')
+        ]
+    
     return render(request, 'app/product/productInfo.html', {
         'product': product,
         'related_products': related_products,
-        'all_sizes': all_sizes,
-        'all_shoe_sizes': all_shoe_sizes,
-        'categories': categories,
-        'head_categories': head_categories
+        'size_options': size_options
     })
 
 
@@ -307,159 +293,70 @@ def userProfile(request):
     profile.GENDER_CHOICES_DICT = ProfileModel.GENDER_CHOICES_DICT
     profile.SIZE_CHOICES_DICT = ProfileModel.SIZE_CHOICES_DICT
     
-    categories = get_categories()
-    head_categories = get_head_categories()
     context = {
-        'profile': profile,
-        'categories': categories,
-        'head_categories': head_categories
+        'profile': profile
     }
     return render(request, 'app/pages/userProfile.html', context)
 
 # ------------------------ Product Section -----------------------------------
 
 def AllProduct(request):
-    products = Product.objects.all()
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/product/AllProduct.html', {'products':products, 'categories': categories, 'head_categories': head_categories})
+    facets = Facets(request, Product.objects.select_related('category'))
+    return render_product_listing(
+        request, 'app/product/AllProduct.html', 'app/includes/all_product_cards.html', facets.filtered(),
+        {'facets': facets}
+    )
 
 
 def newArrival(request):
-    # Get products ordered by ID in descending order (newest first)
-    products = Product.objects.all().order_by('-id')[:12]  # Limit to 12 newest products
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/product/newArrival.html', {'products':products, 'categories': categories, 'head_categories': head_categories})
+    # Products ordered by ID in descending order (newest first), 12 per page
+    products = Product.objects.select_related('category')
+    return render_product_listing(
+        request, 'app/product/newArrival.html', 'app/includes/product_cards.html', products,
+        page_size=12
+    )
 
 
 def category_products(request, category_slug):
     # Get the category by slug or return 404 if not found
     category = get_object_or_404(Category, slug=category_slug)
-    # Get all products in this category
-    products = Product.objects.filter(category=category)
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/product/category_products.html', {
-        'category': category,
-        'products': products,
-        'categories': categories,
-        'head_categories': head_categories
-    })
+    # Get all products in this category, narrowed by any facet filters
+    facets = Facets(request, Product.objects.filter(category=category).select_related('category'),
+                    category_id=category.id)
+    return render_product_listing(
+        request, 'app/product/category_products.html', 'app/includes/product_cards.html', facets.filtered(),
+        {'category': category, 'facets': facets}
+    )
 
 
 def search_products(request):
     """Search products by name, category, or other relevant fields"""
     query = request.GET.get('q', '')
-    products = []
-    
-    # Debug: Print the query to see what we're receiving
-    print(f"Search query received: '{query}'")
+    products = Product.objects.none()
     
     if query:
-        # Normalize the query for better matching
-        normalized_query = query.strip()
-        
-        # Create multiple search variations
-        search_terms = [normalized_query]
-        
-        # Add variation with hyphens instead of spaces
-        if ' ' in normalized_query:
-            search_terms.append(normalized_query.replace(' ', '-'))
-        
-        # Add variation with spaces instead of hyphens
-        if '-' in normalized_query:
-            search_terms.append(normalized_query.replace('-', ' '))
-        
-        # Add lowercase variations
-        search_terms.append(normalized_query.lower())
-        search_terms.append(normalized_query.title())
-        search_terms.append(normalized_query.upper())
-        
-        # Add lowercase variations with hyphens/spaces
-        for term in search_terms[:]:  # Iterate over a copy to avoid modification during iteration
-            if ' ' in term:
-                search_terms.append(term.replace(' ', '-').lower())
-                search_terms.append(term.replace(' ', '-').title())
-                search_terms.append(term.replace(' ', '-').upper())
-            if '-' in term:
-                search_terms.append(term.replace('-', ' ').lower())
-                search_terms.append(term.replace('-', ' ').title())
-                search_terms.append(term.replace('-', ' ').upper())
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_search_terms = []
-        for term in search_terms:
-            if term not in seen:
-                seen.add(term)
-                unique_search_terms.append(term)
-        
-        search_terms = unique_search_terms
-        print(f"Search terms generated: {search_terms}")
-        
-        # Build query conditions for all search terms
-        conditions = Q()
-        for term in search_terms:
-            term_condition = (
-                Q(name__icontains=term) | 
-                Q(category__name__icontains=term) | 
-                Q(description__icontains=term)
-            )
-            conditions |= term_condition  # Use OR to combine terms
-        
-        # Search for products matching the query
-        products = Product.objects.filter(conditions).distinct().order_by('-id')  # Show newest products first
-        
-        # If no products found, try case-insensitive exact match as fallback
-        if not products.exists() and search_terms:
-            fallback_conditions = Q()
-            for term in search_terms:
-                fallback_condition = (
-                    Q(name__iexact=term) | 
-                    Q(category__name__iexact=term) | 
-                    Q(description__iexact=term)
-                )
-                fallback_conditions |= fallback_condition
-            products = Product.objects.filter(fallback_conditions).distinct().order_by('-id')
-        
-        # Debug: Print number of products found
-        print(f"Products found: {products.count()}")
-        if products.exists():
-            print(f"Product names: {[p.name for p in products]}")
+        # Case and hyphen folding are handled by the search index; results are
+        # paged best match first on a (rank, id) keyset
+        products = search_products_queryset(query)
+    facets = Facets(request, products, search_query=query)
     
-    categories = get_categories()
-    head_categories = get_head_categories()
-    context = {
-        'query': query,
-        'products': products,
-        'categories': categories,
-        'head_categories': head_categories
-    }
-    return render(request, 'app/product/search_results.html', context)
+    return render_product_listing(
+        request, 'app/product/search_results.html', 'app/includes/product_cards.html', facets.filtered(),
+        {'query': query, 'facets': facets}
+    )
 
 
 def search_suggestions(request):
     """API endpoint for search suggestions"""
-    query = request.GET.get('q', '')
-    suggestions = []
+    prefix = normalize_prefix(request.GET.get('q', ''))
     
-    if query:
-        # Get products matching the query
-        products = Product.objects.filter(
-            Q(name__icontains=query) | 
-            Q(category__name__icontains=query)
-        ).distinct()[:8]  # Limit to 8 suggestions
-        
-        # Format suggestions
-        for product in products:
-            suggestions.append({
-                'name': product.name,
-                'category': product.category.name,
-                'slug': product.slug
-            })
+    # Answered from the in-process prefix index, no database round trip
+    suggestions = suggestion_index.suggest(prefix)
     
-    return JsonResponse(suggestions, safe=False)
+    response = JsonResponse(suggestions, safe=False)
+    # Identical for every visitor typing the same normalized prefix
+    patch_cache_control(response, public=True, max_age=60)
+    return response
 
 
 def add_to_cart(request):
@@ -473,7 +370,9 @@ def add_to_cart(request):
             quantity = int(data.get('quantity', 1))
             
             # Get the product
-            product = get_object_or_404(Product, id=product_id)
+            product = get_object_or_404(
+                Product.objects.select_related('category__head_category'), id=product_id
+            )
             
             # Get the size or shoe size based on product type
             size = None
@@ -502,25 +401,22 @@ def add_to_cart(request):
             # Get or create cart
             cart = get_or_create_cart(request)
             
-            # Check if item already exists in cart
-            cart_item, created = CartItem.objects.get_or_create(
-                cart=cart,
-                product=product,
-                size=size,
-                shoe_size=shoe_size,
-                defaults={'quantity': quantity}
-            )
+            # Create the line or add to its quantity in a single write
+            add_cart_line(cart, product, size, shoe_size, quantity)
             
-            # If item exists, update quantity
-            if not created:
-                cart_item.quantity += quantity
-                cart_item.save()
+            cart_total_items = cart.get_totals()['total_items']
+            set_cart_item_count(request, cart_total_items)
             
             # Return success response
             return JsonResponse({
                 'success': True,
                 'message': f'{product.name} added to cart successfully!',
-                'cart_total_items': cart.get_total_items()
+                'cart_total_items': cart_total_items
+            })
+        except OutOfStock:
+            return JsonResponse({
+                'success': False,
+                'message': f'Sorry, {product.name} is out of stock in this size'
             })
         except Exception as e:
             # Log the actual error for debugging
@@ -548,23 +444,28 @@ def update_cart_item(request):
             quantity = int(data.get('quantity'))
             
             # Get the cart item
-            cart = get_or_create_cart(request)
+            cart = get_cart(request)
+            if cart is None:
+                raise Http404('No cart')
             cart_item = get_object_or_404(CartItem, id=item_id, cart=cart)
             
-            if quantity <= 0:
-                # Remove item if quantity is 0 or less
-                cart_item.delete()
-            else:
-                # Update quantity
-                cart_item.quantity = quantity
-                cart_item.save()
+            # Update quantity and its stock hold; 0 or less removes the item
+            set_cart_line_quantity(cart, cart_item, quantity)
+            
+            totals = cart.get_totals()
+            set_cart_item_count(request, totals['total_items'])
             
             # Return success response with updated totals
             return JsonResponse({
                 'success': True,
                 'message': 'Cart updated successfully!',
-                'subtotal': float(cart.get_total_price()),
-                'total_items': cart.get_total_items()
+                'subtotal': float(totals['total_price']),
+                'total_items': totals['total_items']
+            })
+        except OutOfStock:
+            return JsonResponse({
+                'success': False,
+                'message': 'Not enough stock for that quantity'
             })
         except Exception as e:
             return JsonResponse({
@@ -586,18 +487,23 @@ def remove_cart_item(request):
             item_id = data.get('item_id')
             
             # Get the cart item
-            cart = get_or_create_cart(request)
+            cart = get_cart(request)
+            if cart is None:
+                raise Http404('No cart')
             cart_item = get_object_or_404(CartItem, id=item_id, cart=cart)
             
-            # Remove item
-            cart_item.delete()
+            # Remove item and hand its held stock back
+            set_cart_line_quantity(cart, cart_item, 0)
+            
+            totals = cart.get_totals()
+            set_cart_item_count(request, totals['total_items'])
             
             # Return success response with updated totals
             return JsonResponse({
                 'success': True,
                 'message': 'Item removed from cart!',
-                'subtotal': float(cart.get_total_price()),
-                'total_items': cart.get_total_items()
+                'subtotal': float(totals['total_price']),
+                'total_items': totals['total_items']
             })
         except Exception as e:
             return JsonResponse({
@@ -611,18 +517,72 @@ def remove_cart_item(request):
     })
 
 
+def update_cart(request):
+    """Apply a batch of add/update/remove operations and return the new totals once"""
+    if request.method == 'POST':
+        try:
+            operations = json.loads(request.body).get('operations')
+            if isinstance(operations, list) and any(
+                isinstance(operation, dict) and operation.get('op') == 'add' for operation in operations
+            ):
+                cart = get_or_create_cart(request)
+            else:
+                cart = get_cart(request)
+            if cart is None:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Your cart is empty'
+                })
+            
+            items = apply_cart_operations(cart, operations)
+            totals = cart.get_totals()
+            set_cart_item_count(request, totals['total_items'])
+            
+            return JsonResponse({
+                'success': True,
+                'message': 'Cart updated successfully!',
+                'items': items,
+                'subtotal': float(totals['total_price']),
+                'total_items': totals['total_items']
+            })
+        except CartBatchError as e:
+            return JsonResponse({
+                'success': False,
+                'message': str(e)
+            })
+        except OutOfStock:
+            return JsonResponse({
+                'success': False,
+                'message': 'Not enough stock for that quantity'
+            })
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'message': 'Error updating cart'
+            })
+    
+    return JsonResponse({
+        'success': False,
+        'message': 'Invalid request method'
+    })
+
+
 def view_cart(request):
     """Display the cart page"""
-    cart = get_or_create_cart(request)
-    cart_items = cart.items.all()
-    categories = get_categories()
-    head_categories = get_head_categories()
+    cart = get_cart(request)
+    if cart is None:
+        # Browsing the cart never creates one; it stays empty until something is added
+        cart_items = CartItem.objects.none()
+        cart_totals = {'total_items': 0, 'total_price': 0}
+    else:
+        cart_items = cart.items.select_related('product__category__head_category', 'size', 'shoe_size')
+        cart_totals = cart.get_totals()
+        set_cart_item_count(request, cart_totals['total_items'])
     
     context = {
         'cart_items': cart_items,
         'cart': cart,
-        'categories': categories,
-        'head_categories': head_categories
+        'cart_totals': cart_totals
     }
     return render(request, 'app/product/cart.html', context)
 
@@ -635,11 +595,13 @@ def checkout(request):
         return redirect('login')
     
     # Get user's cart
-    cart = get_or_create_cart(request)
-    cart_items = cart.items.all()
+    cart = get_cart(request)
+    cart_items = None
+    if cart is not None:
+        cart_items = cart.items.select_related('product__category__head_category', 'size', 'shoe_size')
     
     # Check if cart is empty
-    if not cart_items.exists():
+    if not cart_items:
         messages.error(request, 'Your cart is empty')
         return redirect('view_cart')
     
@@ -650,15 +612,11 @@ def checkout(request):
         from .models import Profile
         profile = Profile.objects.create(user=request.user)
     
-    categories = get_categories()
-    head_categories = get_head_categories()
-    
     context = {
         'cart_items': cart_items,
         'cart': cart,
-        'profile': profile,
-        'categories': categories,
-        'head_categories': head_categories
+        'cart_totals': cart.get_totals(),
+        'profile': profile
     }
     return render(request, 'app/product/checkout.html', context)
 
@@ -674,11 +632,10 @@ def process_checkout(request):
             })
         
         # Get user's cart
-        cart = get_or_create_cart(request)
-        cart_items = cart.items.all()
+        cart = get_cart(request)
         
         # Check if cart is empty
-        if not cart_items.exists():
+        if cart is None or not cart.items.exists():
             return JsonResponse({
                 'success': False,
                 'message': 'Your cart is empty'
@@ -696,9 +653,6 @@ def process_checkout(request):
             pincode = request.POST.get('pincode')
             payment_method = request.POST.get('paymentMethod')
             
-            # Debug: Print received data
-            print(f"Received data: full_name={full_name}, phone={phone}, email={email}, address_line1={address_line1}, city={city}, state={state}, pincode={pincode}, payment_method={payment_method}")
-            
             # Validate required fields with specific error messages
             missing_fields = []
             if not full_name:
@@ -724,31 +678,57 @@ def process_checkout(request):
                     'message': f'Please fill in the following required fields: {", ".join(missing_fields)}'
                 })
             
-            # Update user's profile with address information
-            profile = request.user.profile
-            profile.full_name = full_name
-            profile.address = f"{address_line1}\n{address_line2}".strip()
-            profile.city = city
-            profile.state = state
-            profile.pincode = pincode
-            profile.save()
-            
-            # Update user's phone number
-            request.user.phone_no = phone
-            request.user.save()
+            address = f"{address_line1}\n{address_line2}".strip()
             
-            # TODO: Implement actual payment processing here
-            # For now, we'll just simulate a successful payment
+            # The profile update, the order and emptying the cart commit together or not at all
+            with transaction.atomic():
+                # Update user's profile with address information
+                profile = request.user.profile
+                profile.full_name = full_name
+                profile.address = address
+                profile.city = city
+                profile.state = state
+                profile.pincode = pincode
+                profile.save()
+                
+                # Update user's phone number
+                request.user.phone_no = phone
+                request.user.save()
+                
+                # TODO: Implement actual payment processing here
+                # For now, we'll just simulate a successful payment
+                
+                order = place_order(request.user, cart, {
+                    'full_name': full_name,
+                    'phone': phone,
+                    'email': email,
+                    'address': address,
+                    'city': city,
+                    'state': state,
+                    'pincode': pincode,
+                    'payment_method': payment_method
+                })
+                if order is None:
+                    transaction.set_rollback(True)
+                    return JsonResponse({
+                        'success': False,
+                        'message': 'Your cart is empty'
+                    })
             
-            # Clear the cart after successful checkout
-            cart.items.all().delete()
+            set_cart_item_count(request, 0)
             
             return JsonResponse({
                 'success': True,
                 'message': 'Order placed successfully!',
+                'order_id': order.id,
                 'redirect_url': '/thank-you/'  # Redirect to payment done page after successful checkout
             })
             
+        except OutOfStock:
+            return JsonResponse({
+                'success': False,
+                'message': 'Some items in your cart just sold out. Please review your cart.'
+            })
         except Exception as e:
             return JsonResponse({
                 'success': False,
@@ -763,56 +743,46 @@ def process_checkout(request):
 
 # ----------------------------- Extra Page Views STARTING---------------------------------
 
+@cached_page
 def faq(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/extra/faq.html', {'categories': categories, 'head_categories': head_categories})
+    return render(request, 'app/extra/faq.html')
 
 
+@cached_page
 def sizeGuide(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/extra/sizeGuide.html', {'categories': categories, 'head_categories': head_categories})
+    return render(request, 'app/extra/sizeGuide.html')
 
 
+@cached_page
 def storeLocations(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/extra/storeLocations.html', {'categories': categories, 'head_categories': head_categories})
+    return render(request, 'app/extra/storeLocations.html')
 
+@cached_page
 def careInstruction(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/extra/careInstruction.html', {'categories': categories, 'head_categories': head_categories})
+    return render(request, 'app/extra/careInstruction.html')
 
+@cached_page
 def returnExchanges(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/extra/returnExchanges.html', {'categories': categories, 'head_categories': head_categories})
+    return render(request, 'app/extra/returnExchanges.html')
 
 
+@cached_page
 def sustainability(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/extra/Sustainability.html', {'categories': categories, 'head_categories': head_categories})
+    return render(request, 'app/extra/Sustainability.html')
 
 
+@cached_page
 def press(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/extra/press.html', {'categories': categories, 'head_categories': head_categories})
+    return render(request, 'app/extra/press.html')
 
 
+@cached_page
 def ourstory(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/extra/ourstory.html', {'categories': categories, 'head_categories': head_categories})
+    return render(request, 'app/extra/ourstory.html')
 
 
 def paymentdone(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/extra/paymentdone.html', {'categories': categories, 'head_categories': head_categories})
+    return render(request, 'app/extra/paymentdone.html')
 
 
 # ----------------------------- Extra Page Views ENDING---------------------------------
@@ -820,13 +790,238 @@ def paymentdone(request):
 
 # -------------------- Social Page STARTING -----------------------------
 
+@cached_page
 def instagram(request):
-    categories = get_categories()
-    head_categories = get_head_categories()
-    return render(request, 'app/social/instagram.html', {'categories': categories, 'head_categories': head_categories})
+    return render(request, 'app/social/instagram.html')
 
 
 # -------------------- Social Page ENDING -----------------------------
 
 
+# -------------------- Sitemap & Feed STARTING -----------------------------
+
+@condition(last_modified_func=feeds.catalog_last_modified)
+def sitemap(request):
+    return feeds.streaming_response(request, feeds.sitemap_index(request), 'application/xml')
+
+
+def sitemap_pages(request):
+    return feeds.streaming_response(request, feeds.sitemap_pages(request), 'application/xml')
+
+
+@condition(last_modified_func=feeds.catalog_last_modified)
+def sitemap_products(request, shard):
+    if not 1 <= shard <= feeds.sitemap_shard_count():
+        raise Http404("No such sitemap")
+    return feeds.streaming_response(request, feeds.sitemap_products(request, shard), 'application/xml')
+
+
+@condition(last_modified_func=feeds.catalog_last_modified)
+def product_feed(request, feed_format):
+    if feed_format == 'csv':
+        return feeds.streaming_response(request, feeds.product_feed_csv(request), 'text/csv')
+    if feed_format == 'xml':
+        return feeds.streaming_response(request, feeds.product_feed_xml(request), 'application/xml')
+    raise Http404("Unknown feed format")
+
+
+# -------------------- Sitemap & Feed ENDING -----------------------------
+
+
+# -------------------- Metrics & Profiling STARTING -----------------------------
+
+@staff_member_required
+def metrics(request):
+    """Per-route request metrics of this worker process, in the Prometheus text format"""
+    return HttpResponse(registry.prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+@staff_member_required
+def profile_download(request, profile_id, kind):
+    """One file of a run left by app.profiling.ProfilingMiddleware"""
+    path = profile_path(profile_id, kind)
+    if path is None or not path.exists():
+        raise Http404("No such profile")
+    return FileResponse(open(path, 'rb'), as_attachment=True, filename=path.name,
+                        content_type=PROFILE_FILES[kind])
+
+
+# -------------------- Metrics & Profiling ENDING -----------------------------
+
+
+# -------------------- Async JSON Endpoints STARTING -----------------------------
+# Native async versions of the JSON cart and suggestion endpoints, routed in
+# place of the sync ones when settings.ASYNC_VIEWS is on (app/urls.py). Reads
+# use the async ORM and session API; writes that need a transaction make one
+# trip to a thread, as the async ORM has no transactions.
+
+async def aget_cart(request):
+    """get_cart for async views"""
+    user = await request.auser()
+    if user.is_authenticated:
+        return await Cart.objects.filter(user=user).afirst()
+    session_key = request.session.session_key
+    if not session_key:
+        return None
+    return await Cart.objects.filter(session_key=session_key).afirst()
+
+
+async def aget_or_create_cart(request):
+    """get_or_create_cart for async views"""
+    user = await request.auser()
+    if user.is_authenticated:
+        cart, created = await Cart.objects.aget_or_create(user=user)
+    else:
+        session_key = request.session.session_key
+        if not session_key:
+            await request.session.acreate()
+            session_key = request.session.session_key
+        cart, created = await Cart.objects.aget_or_create(session_key=session_key)
+    return cart
+
+
+async def aget_cart_count(request):
+    """API endpoint to get the current cart item count"""
+    try:
+        cart_count = await aget_cart_item_count(request)
+        return JsonResponse({
+            'success': True,
+            'cart_total_items': cart_count
+        })
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e)
+        })
+
+
+async def asearch_suggestions(request):
+    """API endpoint for search suggestions"""
+    prefix = normalize_prefix(request.GET.get('q', ''))
+    suggestions = await suggestion_index.asuggest(prefix)
+    response = JsonResponse(suggestions, safe=False)
+    patch_cache_control(response, public=True, max_age=60)
+    return response
+
+
+async def aadd_to_cart(request):
+    """Add a product to the cart"""
+    if request.method != 'POST':
+        return JsonResponse({
+            'success': False,
+            'message': 'Invalid request method'
+        })
+    try:
+        data = json.loads(request.body)
+        quantity = int(data.get('quantity', 1))
+        product = await aget_object_or_404(
+            Product.objects.select_related('category__head_category'), id=data.get('product_id')
+        )
+
+        size = None
+        shoe_size = None
+        if product.is_footwear:
+            if not data.get('shoe_size_id'):
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Please select a shoe size for footwear products'
+                })
+            shoe_size = await aget_object_or_404(ShoeSize, id=data.get('shoe_size_id'))
+        else:
+            if not data.get('size_id'):
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Please select a size for clothing products'
+                })
+            size = await aget_object_or_404(Size, id=data.get('size_id'))
+
+        cart = await aget_or_create_cart(request)
+        await sync_to_async(add_cart_line)(cart, product, size, shoe_size, quantity)
+
+        cart_total_items = (await cart.aget_totals())['total_items']
+        await aset_cart_item_count(request, cart_total_items)
+        return JsonResponse({
+            'success': True,
+            'message': f'{product.name} added to cart successfully!',
+            'cart_total_items': cart_total_items
+        })
+    except OutOfStock:
+        return JsonResponse({
+            'success': False,
+            'message': f'Sorry, {product.name} is out of stock in this size'
+        })
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Error adding product to cart: {str(e)}", exc_info=True)
+        return JsonResponse({
+            'success': False,
+            'message': f'Error adding product to cart: {str(e)}'
+        })
+
+
+async def _aset_line_quantity(request, item_id, quantity):
+    """Resize or remove one line of the visitor's cart and return the new totals"""
+    cart = await aget_cart(request)
+    if cart is None:
+        raise Http404('No cart')
+    cart_item = await aget_object_or_404(CartItem, id=item_id, cart=cart)
+    await sync_to_async(set_cart_line_quantity)(cart, cart_item, quantity)
+    totals = await cart.aget_totals()
+    await aset_cart_item_count(request, totals['total_items'])
+    return totals
+
+
+async def aupdate_cart_item(request):
+    """Update quantity of a cart item"""
+    if request.method != 'POST':
+        return JsonResponse({
+            'success': False,
+            'message': 'Invalid request method'
+        })
+    try:
+        data = json.loads(request.body)
+        totals = await _aset_line_quantity(request, data.get('item_id'), int(data.get('quantity')))
+        return JsonResponse({
+            'success': True,
+            'message': 'Cart updated successfully!',
+            'subtotal': float(totals['total_price']),
+            'total_items': totals['total_items']
+        })
+    except OutOfStock:
+        return JsonResponse({
+            'success': False,
+            'message': 'Not enough stock for that quantity'
+        })
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'message': 'Error updating cart item'
+        })
+
+
+async def aremove_cart_item(request):
+    """Remove an item from the cart"""
+    if request.method != 'POST':
+        return JsonResponse({
+            'success': False,
+            'message': 'Invalid request method'
+        })
+    try:
+        data = json.loads(request.body)
+        totals = await _aset_line_quantity(request, data.get('item_id'), 0)
+        return JsonResponse({
+            'success': True,
+            'message': 'Item removed from cart!',
+            'subtotal': float(totals['total_price']),
+            'total_items': totals['total_items']
+        })
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'message': 'Error removing cart item'
+        })
+
+
+# -------------------- Async JSON Endpoints ENDING -----------------------------
+
+
 # ----------------------------- Extra Page Views  ENDING ---------------------------------
\ No newline at end of file
@@ -52,16 +52,24 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    # Serve static files through WhiteNoise under runserver too, as in production
+    'whitenoise.runserver_nostatic',
     'django.contrib.staticfiles',
     'app',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # WhiteNoise, able to run under ASGI without a thread hop
+    'app.static_files.WhiteNoiseMiddleware',
+    'app.metrics.RequestMetricsMiddleware',
+    # Reads the shared version counters once per request (app/counters.py)
+    'app.counters.CounterSnapshotMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'app.profiling.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -70,7 +78,8 @@ ROOT_URLCONF = 'main.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # The stock backend with template rendering timed for Server-Timing
+        'BACKEND': 'app.metrics.DjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -79,6 +88,7 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
                 'app.context_processors.cart_context',
+                'app.context_processors.navigation_context',
             ],
         },
     },
@@ -86,6 +96,28 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'main.wsgi.application'
 
+# Applies main.test_runner.TEST_SETTINGS while the tests run
+TEST_RUNNER = 'main.test_runner.TestRunner'
+
+
+# Share of requests app.metrics.RequestMetricsMiddleware times in detail:
+# query and template time go into a Server-Timing header and the /metrics/
+# totals. 0 turns it off; every request still lands in the latency histogram.
+REQUEST_METRICS_SAMPLE_RATE = 0.1
+
+# Where app.profiling keeps the runs staff trigger with ?_profile=
+PROFILER_ROOT = BASE_DIR / 'profiles'
+
+# Reload the in-process suggestion and facet indexes on a background thread
+# when another process changed the catalog, serving the old ones meanwhile
+BACKGROUND_REBUILDS = True
+
+# Route the JSON cart and suggestion endpoints to their native async views
+# (app/urls.py). Off by default: on Django 5.2 every async ORM call still hops
+# to a thread, and under uvicorn the async views measured slower on SQLite
+# than the sync ones (manage.py benchmark_servers)
+ASYNC_VIEWS = os.environ.get('DJANGO_ASYNC_VIEWS') == '1'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
@@ -93,10 +125,32 @@ WSGI_APPLICATION = 'main.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        # Overridable so load tests can run servers against a scratch copy
+        'NAME': os.environ.get('DJANGO_SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+        # Keep connections open between requests instead of reconnecting every time.
+        # WSGI only: under ASGI each request may land on a new thread, so a kept
+        # connection is never reused; main/asgi.py sets DJANGO_CONN_MAX_AGE=0
+        'CONN_MAX_AGE': int(os.environ.get('DJANGO_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # Take the write lock at BEGIN, so concurrent writers queue on busy_timeout
+            # instead of failing with "database is locked" when a read upgrades to a write
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
+# Applied to every new SQLite connection by app.signals.configure_sqlite_connection.
+# WAL mode, which lets readers and the writer work side by side, is stored in
+# the database file and set once by migration 0017
+SQLITE_PRAGMAS = {
+    'synchronous': 'NORMAL',  # durable in WAL mode except for the last commits on power loss
+    'busy_timeout': 5000,  # ms to wait for the write lock
+    'cache_size': -20000,  # ~20 MB page cache per connection
+    'mmap_size': 268435456,  # read through a 256 MB memory map
+    'temp_store': 'MEMORY',
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -117,6 +171,28 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# Product card fragments (app/product_cards.py) get their own cache, so a
+# big listing churning through cards cannot evict the navigation tree or
+# cached pages from the default one
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'product_cards': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'product-cards',
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    },
+    'pages': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pages',
+    },
+}
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -134,6 +210,21 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# collectstatic writes content-hashed copies of every file plus .gz and .br
+# (when Brotli is installed) variants; WhiteNoise serves the hashed names
+# with a far-future, immutable Cache-Control and picks the encoding the
+# browser accepts.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
 MEDIA_URL = '/media/'
 
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
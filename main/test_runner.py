@@ -0,0 +1,35 @@
+import tempfile
+from pathlib import Path
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+# Tests render templates with DEBUG off but without running collectstatic,
+# so there is no manifest to look hashed names up in; files are served
+# straight from the app directories as under runserver
+TEST_SETTINGS = {
+    'STORAGES': {
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    },
+    'WHITENOISE_AUTOREFRESH': True,
+    'WHITENOISE_USE_FINDERS': True,
+    # Rebuild stale indexes inline, where the test transaction is visible
+    'BACKGROUND_REBUILDS': False,
+    # Profiles written by the tests stay out of the project
+    'PROFILER_ROOT': Path(tempfile.gettempdir()) / 'dripspace-test-profiles',
+}
+
+
+class TestRunner(DiscoverRunner):
+    """The stock runner with TEST_SETTINGS applied for the whole run"""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._test_settings = override_settings(**TEST_SETTINGS)
+        self._test_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._test_settings.disable()
+        super().teardown_test_environment(**kwargs)